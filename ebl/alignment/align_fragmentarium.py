@@ -1,22 +1,34 @@
 import argparse
 import csv
 from functools import partial
+import multiprocessing
 import re
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 import sys
 import time
-from typing import Iterable, List, Tuple
+from typing import Collection, Dict, List, Optional, Sequence, TextIO, Tuple, cast
 
+import attr
+from alignment.sequence import Sequence as SignSequence
 from alignment.vocabulary import Vocabulary
 from tqdm import tqdm
 
 from ebl.alignment.application.align import align
+from ebl.alignment.application.alignment_repository import AlignmentRepository
 from ebl.alignment.domain.result import AlignmentResult
-from ebl.alignment.domain.sequence import NamedSequence
+from ebl.alignment.domain.seed_index import SeedIndex, get_minimum_seeds
+from ebl.alignment.domain.sequence import NamedSequence, make_sequence
+from ebl.alignment.domain.stored_alignment import (
+    ChapterAlignment,
+    ManuscriptAlignment,
+    hash_parameters,
+    hash_signs,
+)
 from ebl.app import create_context
 from ebl.context import Context
 from ebl.corpus.domain.chapter import ChapterId, Chapter
-from ebl.corpus.domain.text import Text
+from ebl.corpus.domain.text import Text, TextId
+from ebl.fragmentarium.application.fragment_repository import FragmentRepository
 from ebl.fragmentarium.domain.fragment import Fragment
 from ebl.transliteration.domain.museum_number import MuseumNumber
 
@@ -25,74 +37,244 @@ def has_clear_signs(signs: str) -> bool:
     return not re.fullmatch(r"[X\\n\s]*", signs)
 
 
+@attr.s(auto_attribs=True, frozen=True)
+class ChapterSequences:
+    text_id: TextId
+    text_name: str
+    chapter: str
+    manuscripts: Sequence[Tuple[str, SignSequence]]
+
+    @property
+    def key(self) -> str:
+        return f"{self.text_id} {self.chapter}"
+
+    @property
+    def signs_hash(self) -> str:
+        return hash_signs(
+            part
+            for siglum, signs in self.manuscripts
+            for part in (siglum, " ".join(signs))
+        )
+
+    @staticmethod
+    def of(text: Text, chapter: Chapter) -> "ChapterSequences":
+        return ChapterSequences(
+            text.id,
+            text.name,
+            f"{chapter.stage.abbreviation} {chapter.name}",
+            tuple(
+                (str(chapter.manuscripts[index].siglum), make_sequence(signs))
+                for index, signs in enumerate(chapter.signs)
+                if has_clear_signs(signs)
+            ),
+        )
+
+
+def create_seed_index(
+    chapters: Sequence[ChapterSequences], seed_length: int
+) -> SeedIndex:
+    seed_index = SeedIndex(seed_length)
+    for chapter_index, chapter in enumerate(chapters):
+        for manuscript_index, (_, signs) in enumerate(chapter.manuscripts):
+            seed_index.add((chapter_index, manuscript_index), signs)
+    return seed_index
+
+
+_context: Optional[Context] = None
+_chapters: Sequence[ChapterSequences] = ()
+_seed_index: SeedIndex = SeedIndex()
+
+
+def initialize_worker(
+    chapters: Sequence[ChapterSequences], seed_index: SeedIndex
+) -> None:
+    global _context, _chapters, _seed_index
+    sys.setrecursionlimit(50000)
+    _context = create_context()
+    _chapters = chapters
+    _seed_index = seed_index
+
+
+def get_required_seeds(
+    signs: SignSequence, min_score: int, min_seeds: Optional[int]
+) -> int:
+    if min_seeds is not None:
+        return min_seeds
+    elif _seed_index.length == 1:
+        return get_minimum_seeds(min_score, signs)
+    else:
+        return 1
+
+
 def align_fragment_and_chapter(
-    fragment: Fragment, chapter: Chapter
+    fragment: Fragment,
+    chapter: ChapterSequences,
+    manuscripts: Optional[Collection[int]] = None,
+    min_score: Optional[int] = None,
 ) -> List[AlignmentResult]:
     vocabulary = Vocabulary()
     fragment_sequence = NamedSequence.of_fragment(fragment, vocabulary)
 
     pairs = [
-        (
-            fragment_sequence,
-            NamedSequence.of_signs(
-                chapter.manuscripts[index].siglum, signs, vocabulary
-            ),
-        )
-        for index, signs in enumerate(chapter.signs)
-        if has_clear_signs(signs)
+        (fragment_sequence, NamedSequence(siglum, vocabulary.encodeSequence(signs)))
+        for index, (siglum, signs) in enumerate(chapter.manuscripts)
+        if manuscripts is None or index in manuscripts
     ]
 
-    return align(pairs, vocabulary)
+    return align(pairs, vocabulary, min_score)
 
 
-def to_dict(
-    fragment: Fragment, text: Text, chapter: Chapter, result: AlignmentResult
-) -> dict:
-    common = {
-        "fragment": result.a.name,
-        "manuscript": result.b.name,
-        "text id": text.id,
-        "text name": text.name,
-        "chapter": f"{chapter.stage.abbreviation} {chapter.name}",
-        "notes": fragment.notes,
-    }
+def to_manuscript_alignment(result: AlignmentResult) -> ManuscriptAlignment:
     if not result.alignments:
-        return {**common, "score": result.score}
+        return ManuscriptAlignment(result.b.name, result.score)
     alignment = result.alignments[0]
-    return {
-        **common,
-        "score": alignment.score,
-        "preserved identity": round(alignment.percentPreservedIdentity(), 2),
-        "preserved similarity": round(alignment.percentPreservedSimilarity(), 2),
-    }
+    return ManuscriptAlignment(
+        result.b.name,
+        alignment.score,
+        round(alignment.percentPreservedIdentity(), 2),
+        round(alignment.percentPreservedSimilarity(), 2),
+    )
+
+
+def align_chapters(
+    fragment: Fragment,
+    chapters: Sequence[Tuple[int, ChapterSequences]],
+    min_score: int,
+    min_seeds: Optional[int] = None,
+) -> List[ChapterAlignment]:
+    signs = make_sequence(fragment.signs)
+    required_seeds = get_required_seeds(signs, min_score, min_seeds)
+    seeds = _seed_index.count_seeds(signs)
+
+    return [
+        ChapterAlignment(
+            chapter.key,
+            chapter.signs_hash,
+            [
+                to_manuscript_alignment(result)
+                for result in align_fragment_and_chapter(
+                    fragment,
+                    chapter,
+                    [
+                        manuscript_index
+                        for manuscript_index in range(len(chapter.manuscripts))
+                        if seeds[(chapter_index, manuscript_index)] >= required_seeds
+                    ],
+                    min_score,
+                )
+            ],
+        )
+        for chapter_index, chapter in chapters
+    ]
 
 
 def align_fragment(
     number: MuseumNumber,
-    chapters: Iterable[Tuple[Text, Chapter]],
     max_lines: int,
     min_score: int,
-) -> List[dict]:
-    sys.setrecursionlimit(50000)
-    context = create_context()
+    min_seeds: Optional[int] = None,
+) -> int:
+    context = cast(Context, _context)
+    repository = context.alignment_repository
     fragment = context.fragment_repository.query_by_museum_number(number)
+    if fragment.text.number_of_lines > max_lines:
+        return 0
+
+    signs_hash = hash_signs([fragment.signs])
+    parameters_hash = hash_parameters(
+        {
+            "max_lines": max_lines,
+            "min_score": min_score,
+            "seed_length": _seed_index.length,
+            "min_seeds": min_seeds,
+        }
+    )
+    state = repository.query_state(number)
+
+    outdated = [
+        (index, chapter)
+        for index, chapter in enumerate(_chapters)
+        if state is None
+        or state.is_outdated(
+            signs_hash, parameters_hash, chapter.key, chapter.signs_hash
+        )
+    ]
+    removed = (
+        set()
+        if state is None
+        else set(state.chapters) - {chapter.key for chapter in _chapters}
+    )
+    if state is not None and not outdated and not removed:
+        return 0
 
-    return (
-        [
-            to_dict(fragment, text, chapter, result)
-            for (text, chapter) in chapters
-            for result in align_fragment_and_chapter(fragment, chapter)
-            if result.score >= min_score
-        ]
-        if fragment.text.number_of_lines <= max_lines
-        else []
+    repository.update(
+        number,
+        signs_hash,
+        parameters_hash,
+        align_chapters(fragment, outdated, min_score, min_seeds),
+        removed,
     )
+    return len(outdated)
 
 
-def load_chapters(context: Context) -> List[Tuple[Text, Chapter]]:
+def to_dict(
+    chapters: Dict[str, ChapterSequences],
+    number: MuseumNumber,
+    chapter: str,
+    alignment: ManuscriptAlignment,
+    notes: str,
+) -> dict:
+    sequences = chapters.get(chapter)
+    return {
+        "fragment": str(number),
+        "text id": None if sequences is None else sequences.text_id,
+        "text name": None if sequences is None else sequences.text_name,
+        "chapter": chapter if sequences is None else sequences.chapter,
+        "manuscript": alignment.manuscript,
+        "score": alignment.score,
+        "preserved identity": alignment.preserved_identity,
+        "preserved similarity": alignment.preserved_similarity,
+        "notes": notes,
+    }
+
+
+def export_alignments(
+    repository: AlignmentRepository,
+    fragments: FragmentRepository,
+    chapters: Sequence[ChapterSequences],
+    file: TextIO,
+) -> None:
+    by_key = {chapter.key: chapter for chapter in chapters}
+    notes: Dict[str, str] = {}
+
+    def get_notes(number: MuseumNumber) -> str:
+        if str(number) not in notes:
+            notes[str(number)] = fragments.query_by_museum_number(number).notes
+        return notes[str(number)]
+
+    writer = csv.DictWriter(
+        file,
+        fieldnames=[
+            "fragment",
+            "text id",
+            "text name",
+            "chapter",
+            "manuscript",
+            "score",
+            "preserved identity",
+            "preserved similarity",
+            "notes",
+        ],
+    )
+    writer.writeheader()
+    for number, chapter, alignment in repository.query_alignments():
+        writer.writerow(to_dict(by_key, number, chapter, alignment, get_notes(number)))
+
+
+def load_chapters(context: Context) -> List[ChapterSequences]:
     texts = context.text_repository
     return [
-        (text, chapter)
+        ChapterSequences.of(text, chapter)
         for (text, chapter) in (
             (text, texts.find_chapter(ChapterId(text.id, listing.stage, listing.name)))
             for text in texts.list()
@@ -102,13 +284,39 @@ def load_chapters(context: Context) -> List[Tuple[Text, Chapter]]:
     ]
 
 
+def create_executor(
+    workers: int,
+    threads: bool,
+    chapters: Sequence[ChapterSequences],
+    seed_index: SeedIndex,
+) -> Executor:
+    if threads:
+        initialize_worker(chapters, seed_index)
+        return ThreadPoolExecutor(max_workers=workers)
+    else:
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=(
+                multiprocessing.get_context("fork")
+                if "fork" in multiprocessing.get_all_start_methods()
+                else None
+            ),
+            initializer=initialize_worker,
+            initargs=(chapters, seed_index),
+        )
+
+
 def parse_arguments() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "-s", "--skip", type=int, default=0, help="Number of fragments to skip."
     )
     parser.add_argument(
-        "-l", "--limit", type=int, default=10, help="Number of fragments to align."
+        "-l",
+        "--limit",
+        type=int,
+        default=None,
+        help="Number of fragments to align. Defaults to all fragments.",
     )
     parser.add_argument(
         "--minScore",
@@ -124,12 +332,29 @@ def parse_arguments() -> argparse.Namespace:
         default=20,
         help="Maximum size of fragment to align.",
     )
+    parser.add_argument(
+        "--seedLength",
+        dest="seed_length",
+        type=int,
+        default=1,
+        help="Number of consecutive signs in a seed.",
+    )
+    parser.add_argument(
+        "--minSeeds",
+        dest="min_seeds",
+        type=int,
+        default=None,
+        help=(
+            "Minimum number of shared seeds to align a manuscript. "
+            "Defaults to the bound implied by --minScore for single sign seeds."
+        ),
+    )
     parser.add_argument(
         "-o",
         "--output",
         type=str,
-        default="alignment.csv",
-        help="Filename for saving the results.",
+        default=None,
+        help="Filename for exporting all stored alignments as CSV.",
     )
     parser.add_argument(
         "-w", "--workers", type=int, default=4, help="Number of parallel workers."
@@ -147,51 +372,38 @@ def parse_arguments() -> argparse.Namespace:
 if __name__ == "__main__":
     args = parse_arguments()
     start = args.skip
-    end = args.skip + args.limit
+    end = None if args.limit is None else args.skip + args.limit
 
     context = create_context()
     fragments = context.fragment_repository
+    context.alignment_repository.create_indexes()
 
     t0 = time.time()
 
     fragment_numbers = fragments.query_transliterated_numbers()[start:end]
     chapters = load_chapters(context)
+    seed_index = create_seed_index(chapters, args.seed_length)
 
-    Executor = ThreadPoolExecutor if args.threads else ProcessPoolExecutor
-
-    with Executor(max_workers=args.workers) as executor, open(
-        args.output, "w", encoding="utf-8"
-    ) as file:
-        results = tqdm(
-            executor.map(
-                partial(
-                    align_fragment,
-                    chapters=chapters,
-                    max_lines=args.max_lines,
-                    min_score=args.min_score,
+    with create_executor(args.workers, args.threads, chapters, seed_index) as executor:
+        aligned = sum(
+            tqdm(
+                executor.map(
+                    partial(
+                        align_fragment,
+                        max_lines=args.max_lines,
+                        min_score=args.min_score,
+                        min_seeds=args.min_seeds,
+                    ),
+                    fragment_numbers,
                 ),
-                fragment_numbers,
-            ),
-            total=len(fragment_numbers),
+                total=len(fragment_numbers),
+            )
         )
 
-        fieldnames = [
-            "fragment",
-            "text id",
-            "text name",
-            "chapter",
-            "manuscript",
-            "score",
-            "preserved identity",
-            "preserved similarity",
-            "notes",
-        ]
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for fragment_results in results:
-            for result in fragment_results:
-                writer.writerow(result)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            export_alignments(context.alignment_repository, fragments, chapters, file)
 
     t = time.time()
-    print(f"\nTime: {round((t-t0)/60, 2)} min")
+    print(f"\nRealigned fragment-chapter pairs: {aligned}")
+    print(f"Time: {round((t-t0)/60, 2)} min")
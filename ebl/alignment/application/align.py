@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from alignment.sequencealigner import GlobalSequenceAligner
 from alignment.vocabulary import Vocabulary
@@ -8,13 +8,17 @@ from ebl.alignment.domain.scoring import EblScoring
 from ebl.alignment.domain.result import AlignmentResult
 
 
+def create_aligner(vocabulary: Vocabulary) -> GlobalSequenceAligner:
+    return GlobalSequenceAligner(EblScoring(vocabulary), True)
+
+
 def align_pair(
     first: NamedSequence,
     second: NamedSequence,
     vocabulary: Vocabulary,
+    aligner: Optional[GlobalSequenceAligner] = None,
 ) -> AlignmentResult:
-    scoring = EblScoring(vocabulary)
-    aligner = GlobalSequenceAligner(scoring, True)
+    aligner = create_aligner(vocabulary) if aligner is None else aligner
     score, alignments = aligner.align(first.sequence, second.sequence, backtrace=True)
     return AlignmentResult(
         score,
@@ -24,11 +28,30 @@ def align_pair(
     )
 
 
+def score_pair(
+    first: NamedSequence,
+    second: NamedSequence,
+    vocabulary: Vocabulary,
+    aligner: Optional[GlobalSequenceAligner] = None,
+) -> int:
+    aligner = create_aligner(vocabulary) if aligner is None else aligner
+    return int(aligner.align(first.sequence, second.sequence))
+
+
 def align(
-    pairs: List[Tuple[NamedSequence, NamedSequence]], vocabulary: Vocabulary
+    pairs: List[Tuple[NamedSequence, NamedSequence]],
+    vocabulary: Vocabulary,
+    min_score: Optional[int] = None,
+    aligner: Optional[GlobalSequenceAligner] = None,
 ) -> List[AlignmentResult]:
+    aligner = create_aligner(vocabulary) if aligner is None else aligner
     return sorted(
-        (align_pair(first, second, vocabulary) for (first, second) in pairs),
+        (
+            align_pair(first, second, vocabulary, aligner)
+            for (first, second) in pairs
+            if min_score is None
+            or score_pair(first, second, vocabulary, aligner) >= min_score
+        ),
         key=lambda result: result.score,
         reverse=True,
     )
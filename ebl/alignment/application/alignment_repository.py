@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Collection, Iterable, Optional, Sequence, Tuple
+
+from ebl.alignment.domain.stored_alignment import (
+    AlignmentState,
+    ChapterAlignment,
+    ManuscriptAlignment,
+)
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+
+class AlignmentRepository(ABC):
+    @abstractmethod
+    def create_indexes(self) -> None:
+        ...
+
+    @abstractmethod
+    def query_state(self, number: MuseumNumber) -> Optional[AlignmentState]:
+        ...
+
+    @abstractmethod
+    def query_alignments(
+        self,
+    ) -> Iterable[Tuple[MuseumNumber, str, ManuscriptAlignment]]:
+        ...
+
+    @abstractmethod
+    def update(
+        self,
+        number: MuseumNumber,
+        signs_hash: str,
+        parameters_hash: str,
+        chapters: Sequence[ChapterAlignment],
+        removed_chapters: Collection[str] = frozenset(),
+    ) -> None:
+        ...
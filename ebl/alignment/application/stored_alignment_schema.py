@@ -0,0 +1,48 @@
+from marshmallow import Schema, fields, post_load, pre_dump
+
+from ebl.alignment.domain.stored_alignment import AlignmentState, ManuscriptAlignment
+
+
+class ManuscriptAlignmentSchema(Schema):
+    manuscript = fields.String(required=True)
+    score = fields.Int(required=True)
+    preserved_identity = fields.Float(
+        load_default=None, allow_none=True, data_key="preservedIdentity"
+    )
+    preserved_similarity = fields.Float(
+        load_default=None, allow_none=True, data_key="preservedSimilarity"
+    )
+
+    @post_load
+    def make_manuscript_alignment(self, data: dict, **kwargs) -> ManuscriptAlignment:
+        return ManuscriptAlignment(**data)
+
+
+class ChapterHashSchema(Schema):
+    chapter = fields.String(required=True)
+    signs_hash = fields.String(required=True, data_key="signsHash")
+
+
+class AlignmentStateSchema(Schema):
+    signs_hash = fields.String(required=True, data_key="signsHash")
+    chapters = fields.Nested(ChapterHashSchema, many=True, required=True)
+    parameters_hash = fields.String(load_default="", data_key="parametersHash")
+
+    @pre_dump
+    def make_chapter_list(self, state: AlignmentState, **kwargs) -> dict:
+        return {
+            "signs_hash": state.signs_hash,
+            "chapters": [
+                {"chapter": chapter, "signs_hash": signs_hash}
+                for chapter, signs_hash in state.chapters.items()
+            ],
+            "parameters_hash": state.parameters_hash,
+        }
+
+    @post_load
+    def make_alignment_state(self, data: dict, **kwargs) -> AlignmentState:
+        return AlignmentState(
+            data["signs_hash"],
+            {chapter["chapter"]: chapter["signs_hash"] for chapter in data["chapters"]},
+            data["parameters_hash"],
+        )
@@ -0,0 +1,89 @@
+from collections import Counter, defaultdict
+from itertools import product
+from typing import (
+    Counter as CounterType,
+    DefaultDict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from ebl.alignment.domain.scoring import break_match, curated_substitutions, match
+from ebl.alignment.domain.sequence import LINE_BREAK
+from ebl.transliteration.domain.atf import VARIANT_SEPARATOR
+
+
+Seed = Tuple[str, ...]
+
+
+def split_variant(sign: str) -> FrozenSet[str]:
+    return frozenset(sign.split(VARIANT_SEPARATOR))
+
+
+def expand_sign(sign: str) -> FrozenSet[str]:
+    parts = split_variant(sign)
+    return parts.union(
+        other
+        for substitution in curated_substitutions
+        if parts & substitution
+        for other in substitution
+    )
+
+
+def split_lines(signs: Iterable[str]) -> List[List[str]]:
+    lines: List[List[str]] = [[]]
+    for sign in signs:
+        if sign == LINE_BREAK:
+            lines.append([])
+        else:
+            lines[-1].append(sign)
+    return [line for line in lines if line]
+
+
+def create_seeds(
+    signs: Sequence[FrozenSet[str]], length: int
+) -> Iterator[FrozenSet[Seed]]:
+    for start in range(len(signs) - length + 1):
+        yield frozenset(product(*signs[start : start + length]))
+
+
+class SeedIndex:
+    def __init__(self, length: int = 1) -> None:
+        self._length = length
+        self._index: DefaultDict[Seed, Set[Hashable]] = defaultdict(set)
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    def add(self, key: Hashable, signs: Iterable[str]) -> None:
+        for line in split_lines(signs):
+            for seeds in create_seeds(
+                [split_variant(sign) for sign in line], self._length
+            ):
+                for seed in seeds:
+                    self._index[seed].add(key)
+
+    def count_seeds(self, signs: Iterable[str]) -> CounterType[Hashable]:
+        counts: CounterType[Hashable] = Counter()
+        for line in split_lines(signs):
+            for seeds in create_seeds(
+                [expand_sign(sign) for sign in line], self._length
+            ):
+                counts.update(
+                    set().union(*(self._index.get(seed, ()) for seed in seeds))
+                )
+        return counts
+
+
+def count_line_breaks(signs: Iterable[str]) -> int:
+    return sum(1 for sign in signs if sign == LINE_BREAK)
+
+
+def get_minimum_seeds(min_score: int, signs: Sequence[str]) -> int:
+    return max(0, -(-(min_score - break_match * count_line_breaks(signs)) // match))
@@ -0,0 +1,49 @@
+import hashlib
+from typing import Iterable, Mapping, Optional, Sequence
+
+import attr
+
+
+def hash_signs(signs: Iterable[str]) -> str:
+    digest = hashlib.sha1()
+    for part in signs:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def hash_parameters(parameters: Mapping[str, object]) -> str:
+    return hash_signs(f"{key}={value!r}" for key, value in sorted(parameters.items()))
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class ManuscriptAlignment:
+    manuscript: str
+    score: int
+    preserved_identity: Optional[float] = None
+    preserved_similarity: Optional[float] = None
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class ChapterAlignment:
+    chapter: str
+    signs_hash: str
+    manuscripts: Sequence[ManuscriptAlignment] = tuple()
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class AlignmentState:
+    signs_hash: str
+    chapters: Mapping[str, str] = attr.ib(factory=dict)
+    parameters_hash: str = ""
+
+    def is_current(self, signs_hash: str, parameters_hash: str) -> bool:
+        return self.signs_hash == signs_hash and self.parameters_hash == parameters_hash
+
+    def is_outdated(
+        self, signs_hash: str, parameters_hash: str, chapter: str, chapter_hash: str
+    ) -> bool:
+        return (
+            not self.is_current(signs_hash, parameters_hash)
+            or self.chapters.get(chapter) != chapter_hash
+        )
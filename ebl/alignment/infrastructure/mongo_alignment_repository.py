@@ -0,0 +1,126 @@
+from typing import Collection, Iterable, Optional, Sequence, Tuple
+
+import pymongo
+from marshmallow import EXCLUDE
+from pymongo.database import Database
+
+from ebl.alignment.application.alignment_repository import AlignmentRepository
+from ebl.alignment.application.stored_alignment_schema import (
+    AlignmentStateSchema,
+    ManuscriptAlignmentSchema,
+)
+from ebl.alignment.domain.stored_alignment import (
+    AlignmentState,
+    ChapterAlignment,
+    ManuscriptAlignment,
+)
+from ebl.errors import NotFoundError
+from ebl.mongo_collection import MongoCollection
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+COLLECTION = "alignments"
+STATE_COLLECTION = "aligned_fragments"
+
+
+class MongoAlignmentRepository(AlignmentRepository):
+    def __init__(self, database: Database) -> None:
+        self._collection = MongoCollection(database, COLLECTION)
+        self._states = MongoCollection(database, STATE_COLLECTION)
+
+    def create_indexes(self) -> None:
+        self._collection.create_index(
+            [
+                ("fragment", pymongo.ASCENDING),
+                ("chapter", pymongo.ASCENDING),
+                ("manuscript", pymongo.ASCENDING),
+            ],
+            unique=True,
+        )
+
+    def query_state(self, number: MuseumNumber) -> Optional[AlignmentState]:
+        try:
+            document = self._states.find_one_by_id(str(number))
+        except NotFoundError:
+            return None
+        return AlignmentStateSchema().load(document, unknown=EXCLUDE)
+
+    def query_alignments(
+        self,
+    ) -> Iterable[Tuple[MuseumNumber, str, ManuscriptAlignment]]:
+        return (
+            (
+                MuseumNumber.of(document["fragment"]),
+                document["chapter"],
+                ManuscriptAlignmentSchema().load(document, unknown=EXCLUDE),
+            )
+            for document in self._collection.find_many(
+                {}, sort=[("fragment", 1), ("chapter", 1), ("score", -1)]
+            )
+        )
+
+    def update(
+        self,
+        number: MuseumNumber,
+        signs_hash: str,
+        parameters_hash: str,
+        chapters: Sequence[ChapterAlignment],
+        removed_chapters: Collection[str] = frozenset(),
+    ) -> None:
+        state = self.query_state(number)
+        is_current = state is not None and state.is_current(signs_hash, parameters_hash)
+        previous = state.chapters if state is not None and is_current else {}
+
+        self._collection.delete_many(
+            {
+                "fragment": str(number),
+                **(
+                    {
+                        "chapter": {
+                            "$in": [
+                                *(chapter.chapter for chapter in chapters),
+                                *removed_chapters,
+                            ]
+                        }
+                    }
+                    if is_current
+                    else {}
+                ),
+            }
+        )
+        documents = [
+            {
+                "fragment": str(number),
+                "chapter": chapter.chapter,
+                "fragmentHash": signs_hash,
+                "chapterHash": chapter.signs_hash,
+                **ManuscriptAlignmentSchema().dump(manuscript),
+            }
+            for chapter in chapters
+            for manuscript in chapter.manuscripts
+        ]
+        if documents:
+            self._collection.insert_many(documents)
+
+        self._states.replace_one(
+            {
+                "_id": str(number),
+                **AlignmentStateSchema().dump(
+                    AlignmentState(
+                        signs_hash,
+                        {
+                            **{
+                                chapter: chapter_hash
+                                for chapter, chapter_hash in previous.items()
+                                if chapter not in removed_chapters
+                            },
+                            **{
+                                chapter.chapter: chapter.signs_hash
+                                for chapter in chapters
+                            },
+                        },
+                        parameters_hash,
+                    )
+                ),
+            },
+            upsert=True,
+        )
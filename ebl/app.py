@@ -10,6 +10,9 @@ from sentry_sdk import configure_scope
 from sentry_sdk.integrations.falcon import FalconIntegration
 import althaia
 import ebl.error_handler
+from ebl.alignment.infrastructure.mongo_alignment_repository import (
+    MongoAlignmentRepository,
+)
 from ebl.bibliography.infrastructure.bibliography import MongoBibliographyRepository
 from ebl.bibliography.web.bootstrap import create_bibliography_routes
 from ebl.cache import create_cache
@@ -32,6 +35,9 @@ from ebl.fragmentarium.infrastructure.mongo_annotations_repository import (
 from ebl.fragmentarium.infrastructure.mongo_fragment_repository import (
     MongoFragmentRepository,
 )
+from ebl.fragmentarium.infrastructure.mongo_line_to_vec_matches_repository import (
+    MongoLineToVecMatchesRepository,
+)
 from ebl.fragmentarium.web.bootstrap import create_fragmentarium_routes
 from ebl.lemmatization.infrastrcuture.mongo_suggestions_finder import (
     MongoLemmaRepository,
@@ -84,6 +90,8 @@ def create_context():
         text_repository=MongoTextRepository(database),
         annotations_repository=MongoAnnotationsRepository(database),
         lemma_repository=MongoLemmaRepository(database),
+        line_to_vec_matches_repository=MongoLineToVecMatchesRepository(database),
+        alignment_repository=MongoAlignmentRepository(database),
         cache=cache,
         parallel_line_injector=ParallelLineInjector(MongoParallelRepository(database)),
     )
@@ -1,4 +1,5 @@
 import codecs
+from functools import lru_cache
 import logging
 import re
 import traceback
@@ -15,19 +16,17 @@ from ebl.atf_importer.domain.atf_conversions import (
     Line_Serializer,
 )
 from ebl.atf_importer.domain.atf_preprocessor_util import Util
+from ebl.transliteration.domain.lark_grammar_cache import open_cached
+from ebl.transliteration.domain.lark_parser import LINE_PARSER, StartRuleParser
+
+
+@lru_cache(maxsize=None)
+def get_oracc_parser() -> Lark:
+    return open_cached("lark-oracc/oracc_atf.lark", __file__, maybe_placeholders=True)
 
 
 class ATFPreprocessor:
     def __init__(self, logdir, style):
-        self.EBL_PARSER = Lark.open(
-            "../../transliteration/domain/ebl_atf.lark",
-            maybe_placeholders=True,
-            rel_to=__file__,
-        )
-        self.ORACC_PARSER = Lark.open(
-            "lark-oracc/oracc_atf.lark", maybe_placeholders=True, rel_to=__file__
-        )
-
         self.logger = logging.getLogger("Atf-Preprocessor")
         self.logger.setLevel(10)
         self.skip_next_lem_line = False
@@ -47,6 +46,14 @@ class ATFPreprocessor:
         self.logdir = logdir
         self.style = style
 
+    @property
+    def EBL_PARSER(self) -> StartRuleParser:
+        return LINE_PARSER
+
+    @property
+    def ORACC_PARSER(self) -> Lark:
+        return get_oracc_parser()
+
     def do_oracc_replacements(self, atf):
         atf = re.sub(
             r"([\[<])([*:])(.*)", r"\1 \2\3", atf
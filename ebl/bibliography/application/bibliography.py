@@ -1,8 +1,9 @@
 import re
-from typing import Optional, Sequence
+from typing import Dict, Iterable, Mapping, Optional, Sequence
 
 from pydash import uniq_with
 
+from ebl.bibliography.application.bibliography_cache import BibliographyCache
 from ebl.bibliography.application.bibliography_repository import BibliographyRepository
 from ebl.bibliography.application.serialization import create_mongo_entry
 from ebl.bibliography.domain.reference import Reference
@@ -14,18 +15,53 @@ COLLECTION = "bibliography"
 
 
 class Bibliography:
-    def __init__(self, repository: BibliographyRepository, changelog: Changelog):
+    def __init__(
+        self,
+        repository: BibliographyRepository,
+        changelog: Changelog,
+        cache: Optional[BibliographyCache] = None,
+    ):
         self._repository = repository
         self._changelog = changelog
+        self._cache = BibliographyCache() if cache is None else cache
 
     def create(self, entry, user: User) -> str:
         self._changelog.create(
             COLLECTION, user.profile, {"_id": entry["id"]}, create_mongo_entry(entry)
         )
-        return self._repository.create(entry)
+        id_ = self._repository.create(entry)
+        self._cache.invalidate(entry["id"])
+        return id_
 
     def find(self, id_: str):
-        return self._repository.query_by_id(id_)
+        cached = self._cache.get_many([id_])
+        if id_ in cached:
+            return cached[id_]
+        entry = self._repository.query_by_id(id_)
+        self._cache.set_many({id_: entry})
+        return entry
+
+    def find_many(self, ids: Iterable[str]) -> Mapping[str, dict]:
+        unique_ids = list(dict.fromkeys(ids))
+        entries = self._find_entries(unique_ids)
+        missing_ids = [id_ for id_ in unique_ids if id_ not in entries]
+        if missing_ids:
+            raise NotFoundError(
+                f'Bibliography entries {", ".join(missing_ids)} not found.'
+            )
+        return entries
+
+    def _find_entries(self, ids: Sequence[str]) -> Dict[str, dict]:
+        entries = self._cache.get_many(ids)
+        missing_ids = [id_ for id_ in ids if id_ not in entries]
+        if missing_ids:
+            found = {
+                entry["id"]: entry
+                for entry in self._repository.query_by_ids(missing_ids)
+            }
+            self._cache.set_many(found)
+            entries.update(found)
+        return entries
 
     def update(self, entry, user: User):
         old_entry = self._repository.query_by_id(entry["id"])
@@ -36,6 +72,7 @@ class Bibliography:
             create_mongo_entry(entry),
         )
         self._repository.update(entry)
+        self._cache.invalidate(entry["id"])
 
     def search(self, query: str) -> Sequence[dict]:
         author_query_result = []
@@ -94,15 +131,11 @@ class Bibliography:
         )
 
     def validate_references(self, references: Sequence[Reference]):
-        def is_invalid(reference):
-            try:
-                self.find(reference.id)
-                return False
-            except NotFoundError:
-                return True
-
+        valid_ids = self._find_entries(
+            list(dict.fromkeys(reference.id for reference in references))
+        )
         invalid_references = [
-            reference.id for reference in references if is_invalid(reference)
+            reference.id for reference in references if reference.id not in valid_ids
         ]
         if invalid_references:
             raise DataError(
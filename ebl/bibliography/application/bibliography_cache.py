@@ -0,0 +1,17 @@
+import time
+from typing import Callable
+
+from ebl.cache import DEFAULT_TIMEOUT, LruCache
+
+
+DEFAULT_MAX_SIZE: int = 10000
+
+
+class BibliographyCache(LruCache[str, dict]):
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_size: int = DEFAULT_MAX_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(max_size, timeout, clock)
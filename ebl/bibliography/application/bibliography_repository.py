@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Sequence
 
 
 class BibliographyRepository(ABC):
@@ -11,6 +11,10 @@ class BibliographyRepository(ABC):
     def query_by_id(self, id_: str):
         ...
 
+    @abstractmethod
+    def query_by_ids(self, ids: Sequence[str]) -> Sequence[dict]:
+        ...
+
     @abstractmethod
     def update(self, entry) -> None:
         ...
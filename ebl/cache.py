@@ -1,6 +1,24 @@
 import json
+import logging
+import math
 import os
-from typing import Callable, Sequence
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from threading import Lock
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from falcon import after, Request, Response
 from falcon_caching import Cache
@@ -9,6 +27,10 @@ from falcon_caching import Cache
 DEFAULT_TIMEOUT: int = 600
 CONFIG_ENVIRONMENT_VARIABLE: str = "CACHE_CONFIG"
 DEFAULT_CONFIG: str = '{"CACHE_TYPE": "null"}'
+COUNT_WORKERS: int = 2
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
 
 
 def load_config() -> dict:
@@ -28,3 +50,136 @@ def cache_control(
             resp.cache_control = directives
 
     return after(add_header)
+
+
+class LruCache(Generic[K, V]):
+    def __init__(
+        self,
+        max_size: int,
+        timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_size = max_size
+        self._timeout = timeout
+        self._clock = clock
+        self._entries: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, create: Callable[[], V]) -> V:
+        entries = self.get_many([key])
+        if key in entries:
+            return entries[key]
+        value = create()
+        self.set(key, value)
+        return value
+
+    def get_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        now = self._clock()
+        entries = {}
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    expires, value = self._entries[key]
+                    if expires > now:
+                        self._entries.move_to_end(key)
+                        entries[key] = value
+                    else:
+                        del self._entries[key]
+        return entries
+
+    def set(self, key: K, value: V) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, entries: Mapping[K, V]) -> None:
+        expires = math.inf if self._timeout is None else self._clock() + self._timeout
+        with self._lock:
+            for key, value in entries.items():
+                self._entries[key] = (expires, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def get_exact_count(page_size: int, page_index: int, page_length: int) -> Optional[int]:
+    """Return the total of a paginated search if a page reveals it.
+
+    A short page is the last one. An empty page after the first one may lie
+    beyond the end and reveals nothing.
+    """
+    return (
+        page_size * page_index + page_length
+        if page_length < page_size and (page_length or not page_index)
+        else None
+    )
+
+
+def estimate_count(page_size: int, page_index: int, page_length: int) -> int:
+    return page_size * page_index + page_length + (1 if page_length == page_size else 0)
+
+
+class CountCache(LruCache[Hashable, int]):
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_size: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        super().__init__(max_size, timeout, clock)
+        self._executor = executor
+        self._pending: Set[Hashable] = set()
+
+    def estimate(self, key: Hashable, count: Callable[[], int], estimate: int) -> int:
+        return self.get_total(key, count, None, estimate)[0]
+
+    def get_total(
+        self,
+        key: Hashable,
+        count: Callable[[], int],
+        exact: Optional[int],
+        estimate: int,
+    ) -> Tuple[int, bool]:
+        """Return the total and whether it is an estimate.
+
+        An estimate is returned while the exact count runs in the background.
+        """
+        if exact is not None:
+            self.set(key, exact)
+            return exact, False
+        counts = self.get_many([key])
+        if key in counts:
+            return counts[key], False
+        self._count_in_background(key, count)
+        return estimate, True
+
+    def _count_in_background(self, key: Hashable, count: Callable[[], int]) -> None:
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    COUNT_WORKERS, thread_name_prefix="count"
+                )
+            executor = self._executor
+        executor.submit(self._count, key, count)
+
+    def _count(self, key: Hashable, count: Callable[[], int]) -> None:
+        try:
+            self.set(key, count())
+        except Exception:
+            logging.exception("Counting %s failed.", key)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
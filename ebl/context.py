@@ -2,8 +2,11 @@ import attr
 from falcon_auth.backends import AuthBackend
 from falcon_caching import Cache
 
+from ebl.alignment.application.alignment_repository import AlignmentRepository
 from ebl.bibliography.application.bibliography import Bibliography
+from ebl.bibliography.application.bibliography_cache import BibliographyCache
 from ebl.bibliography.application.bibliography_repository import BibliographyRepository
+from ebl.cache import CountCache
 from ebl.changelog import Changelog
 from ebl.corpus.infrastructure.mongo_text_repository import MongoTextRepository
 from ebl.dictionary.application.word_repository import WordRepository
@@ -12,6 +15,10 @@ from ebl.files.application.file_repository import FileRepository
 from ebl.fragmentarium.application.annotations_repository import AnnotationsRepository
 from ebl.fragmentarium.application.fragment_repository import FragmentRepository
 from ebl.fragmentarium.application.fragment_updater import FragmentUpdater
+from ebl.fragmentarium.application.line_to_vec_matches_repository import (
+    LineToVecMatchesRepository,
+)
+from ebl.fragmentarium.application.line_to_vec_store import LineToVecStore
 from ebl.fragmentarium.application.transliteration_update_factory import (
     TransliterationUpdateFactory,
 )
@@ -19,8 +26,12 @@ from ebl.fragmentarium.infrastructure.cropped_sign_images_repository import (
     MongoCroppedSignImagesRepository,
 )
 from ebl.lemmatization.application.suggestion_finder import LemmaRepository
+from ebl.transliteration.application.line_signs_cache import LineSignsCache
 from ebl.transliteration.application.parallel_line_injector import ParallelLineInjector
 from ebl.transliteration.application.sign_repository import SignRepository
+from ebl.transliteration.application.transliteration_query_cache import (
+    TransliterationQueryCache,
+)
 from ebl.transliteration.application.transliteration_query_factory import (
     TransliterationQueryFactory,
 )
@@ -42,11 +53,22 @@ class Context:
     text_repository: MongoTextRepository
     annotations_repository: AnnotationsRepository
     lemma_repository: LemmaRepository
+    line_to_vec_matches_repository: LineToVecMatchesRepository
+    alignment_repository: AlignmentRepository
     cache: Cache
     parallel_line_injector: ParallelLineInjector
+    transliteration_query_cache: TransliterationQueryCache = attr.ib(
+        factory=TransliterationQueryCache
+    )
+    count_cache: CountCache = attr.ib(factory=CountCache)
+    bibliography_cache: BibliographyCache = attr.ib(factory=BibliographyCache)
+    line_to_vec_store: LineToVecStore = attr.ib(factory=LineToVecStore)
+    line_signs_cache: LineSignsCache = attr.ib(factory=LineSignsCache)
 
     def get_bibliography(self):
-        return Bibliography(self.bibliography_repository, self.changelog)
+        return Bibliography(
+            self.bibliography_repository, self.changelog, self.bibliography_cache
+        )
 
     def get_fragment_updater(self):
         return FragmentUpdater(
@@ -55,10 +77,14 @@ class Context:
             self.get_bibliography(),
             self.photo_repository,
             self.parallel_line_injector,
+            self.line_to_vec_store,
+            self.line_to_vec_matches_repository,
         )
 
     def get_transliteration_update_factory(self):
-        return TransliterationUpdateFactory(self.sign_repository)
+        return TransliterationUpdateFactory(self.sign_repository, self.line_signs_cache)
 
     def get_transliteration_query_factory(self):
-        return TransliterationQueryFactory(self.sign_repository)
+        return TransliterationQueryFactory(
+            self.sign_repository, self.transliteration_query_cache
+        )
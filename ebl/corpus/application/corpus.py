@@ -3,6 +3,7 @@ from typing import List, Optional, Sequence, Tuple
 
 import attr
 
+from ebl.cache import CountCache, estimate_count, get_exact_count
 from ebl.corpus.application.alignment_updater import AlignmentUpdater
 from ebl.corpus.application.manuscript_reference_injector import (
     ManuscriptReferenceInjector,
@@ -25,6 +26,7 @@ from ebl.corpus.domain.manuscript import Manuscript
 from ebl.corpus.domain.parser import parse_chapter
 from ebl.corpus.domain.text import Text, TextId
 from ebl.errors import DataError, Defect, NotFoundError
+from ebl.transliteration.application.line_signs_cache import LineSignsCache
 from ebl.transliteration.application.parallel_line_injector import ParallelLineInjector
 from ebl.transliteration.domain.genre import Genre
 from ebl.transliteration.domain.museum_number import MuseumNumber
@@ -34,6 +36,7 @@ from ebl.transliteration.domain.transliteration_query import TransliterationQuer
 from ebl.users.domain.user import User
 
 COLLECTION = "chapters"
+TRANSLITERATION_SEARCH_PAGE_SIZE: int = 30
 
 
 class TextRepository(ABC):
@@ -72,7 +75,11 @@ class TextRepository(ABC):
     @abstractmethod
     def query_by_transliteration(
         self, query: TransliterationQuery, pagination_index: int
-    ) -> Tuple[Sequence[Chapter], int]:
+    ) -> Sequence[Chapter]:
+        ...
+
+    @abstractmethod
+    def count_by_transliteration(self, query: TransliterationQuery) -> int:
         ...
 
     @abstractmethod
@@ -106,12 +113,18 @@ class Corpus:
         changelog,
         sign_repository: SignRepository,
         parallel_injector: ParallelLineInjector,
+        count_cache: Optional[CountCache] = None,
+        line_signs_cache: Optional[LineSignsCache] = None,
     ):
         self._repository: TextRepository = repository
         self._bibliography = bibliography
         self._changelog = changelog
         self._sign_repository = sign_repository
         self._parallel_injector = parallel_injector
+        self._count_cache = CountCache() if count_cache is None else count_cache
+        self._line_signs_cache = (
+            LineSignsCache() if line_signs_cache is None else line_signs_cache
+        )
 
     def find(self, id_: TextId) -> Text:
         return self._repository.find(id_)
@@ -155,7 +168,7 @@ class Corpus:
     ) -> Sequence[Manuscript]:
         injector = ManuscriptReferenceInjector(self._bibliography)
         try:
-            return tuple(map(injector.inject_manuscript, manuscripts))
+            return injector.inject_manuscripts(manuscripts)
         except NotFoundError as error:
             raise Defect(error) from error
 
@@ -164,11 +177,28 @@ class Corpus:
     ) -> ChapterInfosPagination:
         if query.is_empty():
             return ChapterInfosPagination([], 0)
-        chapters, total_count = self._repository.query_by_transliteration(
-            query, pagination_index
+        chapters = self._repository.query_by_transliteration(query, pagination_index)
+        total_count, is_estimate = self._count_transliteration(
+            query, pagination_index, len(chapters)
         )
         return ChapterInfosPagination(
-            [ChapterInfo.of(chapter, query) for chapter in chapters], total_count
+            [ChapterInfo.of(chapter, query) for chapter in chapters],
+            total_count,
+            is_estimate,
+        )
+
+    def _count_transliteration(
+        self, query: TransliterationQuery, pagination_index: int, page_length: int
+    ) -> Tuple[int, bool]:
+        return self._count_cache.get_total(
+            query.regexp,
+            lambda: self._repository.count_by_transliteration(query),
+            get_exact_count(
+                TRANSLITERATION_SEARCH_PAGE_SIZE, pagination_index, page_length
+            ),
+            estimate_count(
+                TRANSLITERATION_SEARCH_PAGE_SIZE, pagination_index, page_length
+            ),
         )
 
     def search_lemma(
@@ -204,15 +234,18 @@ class Corpus:
     ) -> Chapter:
         try:
             injector = ManuscriptReferenceInjector(self._bibliography)
-            manuscripts = tuple(
-                injector.inject_manuscript(manuscript) for manuscript in manuscripts
-            )
+            manuscripts = injector.inject_manuscripts(manuscripts)
         except NotFoundError as error:
             raise DataError(error) from error
 
         return self._update_chapter(
             id_,
-            ManuscriptUpdater(manuscripts, uncertain_fragments, self._sign_repository),
+            ManuscriptUpdater(
+                manuscripts,
+                uncertain_fragments,
+                self._sign_repository,
+                self._line_signs_cache,
+            ),
             user,
         )
 
@@ -223,7 +256,9 @@ class Corpus:
 
     def update_lines(self, id_: ChapterId, lines: LinesUpdate, user: User) -> Chapter:
         return self._update_chapter(
-            id_, LinesUpdater(lines, self._sign_repository), user
+            id_,
+            LinesUpdater(lines, self._sign_repository, self._line_signs_cache),
+            user,
         )
 
     def _update_chapter(
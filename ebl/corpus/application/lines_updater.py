@@ -1,18 +1,26 @@
+from typing import Optional
+
 import attr
 
 from ebl.corpus.application.chapter_updater import ChapterUpdater
 from ebl.corpus.application.signs_updater import SignsUpdater
 from ebl.corpus.domain.chapter import Chapter
 from ebl.corpus.domain.lines_update import LinesUpdate
+from ebl.transliteration.application.line_signs_cache import LineSignsCache
 from ebl.transliteration.application.sign_repository import SignRepository
 from ebl.transliteration.domain.atf import ATF_PARSER_VERSION
 
 
 class LinesUpdater(ChapterUpdater):
-    def __init__(self, lines: LinesUpdate, sign_repository: SignRepository):
+    def __init__(
+        self,
+        lines: LinesUpdate,
+        sign_repository: SignRepository,
+        cache: Optional[LineSignsCache] = None,
+    ):
         super().__init__()
         self._lines_update = lines
-        self._sign_updater = SignsUpdater(sign_repository)
+        self._sign_updater = SignsUpdater(sign_repository, cache)
         self._lines = []
 
     def _visit_lines(self, chapter: Chapter) -> None:
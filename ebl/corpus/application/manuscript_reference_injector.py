@@ -1,5 +1,5 @@
 from functools import singledispatchmethod
-from typing import Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import attr
 
@@ -15,6 +15,7 @@ class ManuscriptReferenceInjector(ChapterVisitor):
         self._bibliography: Bibliography = bibliography
         self._chapter: Optional[Chapter] = None
         self._manuscripts: List[Manuscript] = []
+        self._documents: Dict[str, dict] = {}
 
     @property
     def chapter(self) -> Chapter:
@@ -29,6 +30,7 @@ class ManuscriptReferenceInjector(ChapterVisitor):
 
     @visit.register(Chapter)
     def _visit_chapter(self, chapter: Chapter) -> None:
+        self._load_documents(chapter.manuscripts)
         for manuscript in chapter.manuscripts:
             self.visit(manuscript)
 
@@ -39,7 +41,14 @@ class ManuscriptReferenceInjector(ChapterVisitor):
     def _visit_manuscript(self, manuscript: Manuscript) -> None:
         self._manuscripts.append(self.inject_manuscript(manuscript))
 
+    def inject_manuscripts(
+        self, manuscripts: Sequence[Manuscript]
+    ) -> Tuple[Manuscript, ...]:
+        self._load_documents(manuscripts)
+        return tuple(self.inject_manuscript(manuscript) for manuscript in manuscripts)
+
     def inject_manuscript(self, manuscript: Manuscript) -> Manuscript:
+        self._load_documents([manuscript])
         references = self._inject_references(manuscript.references)
         old_sigla = self._inject_old_sigla(manuscript.old_sigla)
         return attr.evolve(manuscript, references=references, old_sigla=old_sigla)
@@ -49,9 +58,21 @@ class ManuscriptReferenceInjector(ChapterVisitor):
     ) -> Sequence[Reference]:
         return tuple(self._inject_reference(reference) for reference in references)
 
+    def _load_documents(self, manuscripts: Iterable[Manuscript]) -> None:
+        ids = [
+            reference.id
+            for manuscript in manuscripts
+            for reference in [
+                *manuscript.references,
+                *(old_siglum.reference for old_siglum in manuscript.old_sigla),
+            ]
+            if reference.id not in self._documents
+        ]
+        if ids:
+            self._documents.update(self._bibliography.find_many(ids))
+
     def _inject_reference(self, reference: Reference) -> Reference:
-        document = self._bibliography.find(reference.id)
-        return attr.evolve(reference, document=document)
+        return attr.evolve(reference, document=self._documents[reference.id])
 
     def _inject_old_sigla(self, old_sigla: Sequence[OldSiglum]) -> Sequence[OldSiglum]:
         return tuple(
@@ -1,4 +1,4 @@
-from typing import Sequence
+from typing import Optional, Sequence
 
 import attr
 
@@ -7,6 +7,7 @@ from ebl.corpus.application.signs_updater import SignsUpdater
 from ebl.corpus.domain.chapter import Chapter
 from ebl.corpus.domain.manuscript import Manuscript
 from ebl.transliteration.domain.museum_number import MuseumNumber
+from ebl.transliteration.application.line_signs_cache import LineSignsCache
 from ebl.transliteration.application.sign_repository import SignRepository
 
 
@@ -16,11 +17,12 @@ class ManuscriptUpdater(ChapterUpdater):
         manuscripts: Sequence[Manuscript],
         uncertain_fragments: Sequence[MuseumNumber],
         sign_repository: SignRepository,
+        cache: Optional[LineSignsCache] = None,
     ):
         super().__init__()
         self._manuscripts = manuscripts
         self._uncertain_fragments = uncertain_fragments
-        self._sign_updater = SignsUpdater(sign_repository)
+        self._sign_updater = SignsUpdater(sign_repository, cache)
 
     def _update_chapter(self, chapter: Chapter) -> Chapter:
         return self._sign_updater.update(
@@ -1,8 +1,10 @@
-from typing import Sequence
+from functools import partial
+from typing import Optional, Sequence
 
 import attr
 
 from ebl.corpus.domain.chapter import Chapter
+from ebl.transliteration.application.line_signs_cache import LineSignsCache
 from ebl.transliteration.application.sign_repository import SignRepository
 from ebl.transliteration.application.signs_visitor import SignsVisitor
 from ebl.transliteration.domain.atf import WORD_SEPARATOR
@@ -11,8 +13,11 @@ from ebl.signs.infrastructure.memoizing_sign_repository import MemoizingSignRepo
 
 
 class SignsUpdater:
-    def __init__(self, sign_repository: SignRepository):
+    def __init__(
+        self, sign_repository: SignRepository, cache: Optional[LineSignsCache] = None
+    ):
         self._sign_repository = MemoizingSignRepository(sign_repository)
+        self._cache = LineSignsCache() if cache is None else cache
 
     def update(self, chapter: Chapter) -> Chapter:
         return attr.evolve(chapter, signs=self._create_signs(chapter))
@@ -24,7 +29,9 @@ class SignsUpdater:
         )
 
     def _map_lines(self, lines: Sequence[TextLine]) -> str:
-        return "\n".join(self._map_line(line) for line in lines)
+        return "\n".join(
+            self._cache.get(line, partial(self._map_line, line)) for line in lines
+        )
 
     def _map_line(self, line: TextLine) -> str:
         visitor = SignsVisitor(self._sign_repository)
@@ -35,3 +35,4 @@ class ChapterInfo:
 class ChapterInfosPagination:
     chapter_infos: Sequence[ChapterInfo]
     total_count: int
+    is_estimate: bool = False
@@ -1,14 +1,24 @@
-from typing import Tuple, List, Dict, Mapping
+from typing import Tuple, List, Dict, Mapping, Optional, Sequence
+from bson.objectid import ObjectId
 from pymongo.collection import Collection
 from ebl.transliteration.domain.transliteration_query import TransliterationQuery
 
 
 def filter_query_by_transliteration(
-    query: TransliterationQuery, cursor: Collection
+    query: TransliterationQuery,
+    cursor: Collection,
+    candidates: Optional[Mapping[ObjectId, Sequence[int]]] = None,
 ) -> List:
     _cursor = []
     for chapter in cursor:
-        manuscript_matches = find_manuscript_matches(query, chapter)
+        chapter_id = chapter.pop("_id", None)
+        manuscript_matches = find_manuscript_matches(
+            query,
+            chapter,
+            range(len(chapter["signs"]))
+            if candidates is None
+            else sorted(set(candidates.get(chapter_id, []))),
+        )
         text_lines, colophon_lines = find_chapter_query_lines(
             manuscript_matches, chapter["lines"]
         )
@@ -21,30 +31,33 @@ def filter_query_by_transliteration(
     return _cursor
 
 
-def find_manuscript_matches(query: TransliterationQuery, chapter: Mapping) -> List:
+def find_manuscript_matches(
+    query: TransliterationQuery, chapter: Mapping, manuscript_indexes: Sequence[int]
+) -> List:
     match_indexes = [
-        (query.match(signs), idx) for idx, signs in enumerate(chapter["signs"])
+        (query.match(chapter["signs"][idx]), idx) for idx in manuscript_indexes
     ]
+    match_indexes = [(match, idx) for match, idx in match_indexes if match]
+    line_indexes = get_text_line_indexes(chapter) if match_indexes else {}
     return [
         (
             chapter["manuscripts"][idx]["id"],
             dict.fromkeys(match),
-            get_line_indexes(chapter, idx),
+            line_indexes.get(chapter["manuscripts"][idx]["id"], []),
         )
         for match, idx in match_indexes
-        if match
     ]
 
 
-def get_line_indexes(chapter: Mapping, idx: int) -> List:
-    return remove_duplicates(
-        [
-            lineIdx
-            for lineIdx, manuscript in get_all_line_manuscript_indexes(chapter)
-            if manuscript["manuscriptId"] == chapter["manuscripts"][idx]["id"]
-            and manuscript["line"]["type"] == "TextLine"
-        ]
-    )
+def get_text_line_indexes(chapter: Mapping) -> Dict[int, List[int]]:
+    line_indexes: Dict[int, List[int]] = {}
+    for lineIdx, manuscript in get_all_line_manuscript_indexes(chapter):
+        if manuscript["line"]["type"] == "TextLine":
+            line_indexes.setdefault(manuscript["manuscriptId"], []).append(lineIdx)
+    return {
+        manuscript_id: remove_duplicates(indexes)
+        for manuscript_id, indexes in line_indexes.items()
+    }
 
 
 def get_all_line_manuscript_indexes(chapter: Mapping) -> List:
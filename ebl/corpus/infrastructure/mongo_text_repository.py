@@ -1,10 +1,15 @@
-from typing import List, Optional, Tuple, Sequence
+from collections import defaultdict
+from typing import List, Mapping, Optional, Sequence
 
 import pymongo
+from bson.objectid import ObjectId
 from pymongo.database import Database
 
 from ebl.bibliography.infrastructure.bibliography import join_reference_documents
-from ebl.corpus.application.corpus import TextRepository
+from ebl.corpus.application.corpus import (
+    TRANSLITERATION_SEARCH_PAGE_SIZE,
+    TextRepository,
+)
 from ebl.corpus.application.display_schemas import ChapterDisplaySchema
 from ebl.corpus.application.schemas import (
     ChapterSchema,
@@ -40,11 +45,14 @@ from ebl.mongo_collection import MongoCollection
 from ebl.transliteration.application.museum_number_schema import MuseumNumberSchema
 from ebl.transliteration.domain.genre import Genre
 from ebl.transliteration.domain.museum_number import MuseumNumber
+from ebl.transliteration.domain.sign_ngrams import extract_ngrams
 from ebl.transliteration.domain.transliteration_query import TransliterationQuery
 from ebl.transliteration.infrastructure.collections import (
+    CHAPTER_SIGN_NGRAMS_COLLECTION,
     CHAPTERS_COLLECTION,
     TEXTS_COLLECTION,
 )
+from ebl.transliteration.infrastructure.queries import ngrams_match
 
 
 def text_not_found(id_: TextId) -> Exception:
@@ -63,6 +71,7 @@ class MongoTextRepository(TextRepository):
     def __init__(self, database: Database):
         self._texts = MongoCollection(database, TEXTS_COLLECTION)
         self._chapters = MongoCollection(database, CHAPTERS_COLLECTION)
+        self._sign_ngrams = MongoCollection(database, CHAPTER_SIGN_NGRAMS_COLLECTION)
 
     def create_indexes(self) -> None:
         self._texts.create_index(
@@ -98,12 +107,15 @@ class MongoTextRepository(TextRepository):
             ],
             unique=True,
         )
+        self._sign_ngrams.create_index([("ngrams", pymongo.ASCENDING)])
+        self._sign_ngrams.create_index([("chapterId", pymongo.ASCENDING)])
 
     def create(self, text: Text) -> None:
         self._texts.insert_one(TextSchema(exclude=["chapters"]).dump(text))
 
     def create_chapter(self, chapter: Chapter) -> None:
-        self._chapters.insert_one(ChapterSchema().dump(chapter))
+        chapter_id = self._chapters.insert_one(ChapterSchema().dump(chapter))
+        self._update_sign_ngrams(chapter_id, chapter)
 
     def find(self, id_: TextId) -> Text:
         try:
@@ -186,7 +198,7 @@ class MongoTextRepository(TextRepository):
         )
 
     def update(self, id_: ChapterId, chapter: Chapter) -> None:
-        self._chapters.update_one(
+        updated = self._chapters.find_one_and_update(
             chapter_id_query(id_),
             {
                 "$set": ChapterSchema(
@@ -199,13 +211,62 @@ class MongoTextRepository(TextRepository):
                     ]
                 ).dump(chapter)
             },
+            projection=["_id"],
+        )
+        self._update_sign_ngrams(updated["_id"], chapter)
+
+    def _update_sign_ngrams(self, chapter_id: ObjectId, chapter: Chapter) -> None:
+        """Insert the new generation of n-grams before removing the old one.
+
+        A search running in between finds the chapter through either
+        generation, so it is never missing from the results.
+        """
+        generation = ObjectId()
+        if chapter.signs:
+            self._sign_ngrams.insert_many(
+                [
+                    {
+                        "chapterId": chapter_id,
+                        "generation": generation,
+                        "manuscriptIndex": index,
+                        "ngrams": sorted(extract_ngrams(signs)),
+                    }
+                    for index, signs in enumerate(chapter.signs)
+                ]
+            )
+        self._sign_ngrams.delete_many(
+            {"chapterId": chapter_id, "generation": {"$ne": generation}}
         )
 
+    def _find_manuscript_candidates(
+        self, query: TransliterationQuery
+    ) -> Optional[Mapping[ObjectId, Sequence[int]]]:
+        plan = query.plan
+        if not plan.has_prefilter:
+            return None
+        candidates = defaultdict(list)
+        for entry in self._sign_ngrams.find_many(
+            ngrams_match("ngrams", plan),
+            projection={"_id": False, "chapterId": True, "manuscriptIndex": True},
+        ):
+            candidates[entry["chapterId"]].append(entry["manuscriptIndex"])
+        return candidates
+
+    def _create_transliteration_query(
+        self,
+        query: TransliterationQuery,
+        candidates: Optional[Mapping[ObjectId, Sequence[int]]],
+    ) -> dict:
+        return {
+            **({} if candidates is None else {"_id": {"$in": list(candidates)}}),
+            "signs": {"$regex": query.regexp},
+        }
+
     def query_by_transliteration(
         self, query: TransliterationQuery, pagination_index: int
-    ) -> Tuple[Sequence[Chapter], int]:
-        LIMIT = 30
-        mongo_query = {"signs": {"$regex": query.regexp}}
+    ) -> Sequence[Chapter]:
+        candidates = self._find_manuscript_candidates(query)
+        mongo_query = self._create_transliteration_query(query, candidates)
         cursor = self._chapters.aggregate(
             [
                 {"$match": mongo_query},
@@ -234,18 +295,24 @@ class MongoTextRepository(TextRepository):
                         "as": "textNames",
                     }
                 },
-                {"$project": {"_id": False}},
                 {"$addFields": {"textName": {"$first": "$textNames"}}},
                 {"$addFields": {"textName": "$textName.name"}},
                 {"$project": {"textNames": False}},
-                {"$skip": LIMIT * pagination_index},
-                {"$limit": LIMIT},
+                {"$skip": TRANSLITERATION_SEARCH_PAGE_SIZE * pagination_index},
+                {"$limit": TRANSLITERATION_SEARCH_PAGE_SIZE},
             ],
             allowDiskUse=True,
         )
         return ChapterSchema().load(
-            filter_query_by_transliteration(query, cursor), many=True
-        ), self._chapters.count_documents(mongo_query)
+            filter_query_by_transliteration(query, cursor, candidates), many=True
+        )
+
+    def count_by_transliteration(self, query: TransliterationQuery) -> int:
+        return self._chapters.count_documents(
+            self._create_transliteration_query(
+                query, self._find_manuscript_candidates(query)
+            )
+        )
 
     def query_by_lemma(
         self, lemma: str, genre: Optional[Genre] = None
@@ -15,9 +15,6 @@ from ebl.corpus.web.lines import LinesImportResource, LinesResource, LineResourc
 from ebl.corpus.web.manuscripts import ManuscriptsResource
 from ebl.corpus.web.texts import TextResource, TextSearchResource, TextsResource
 from ebl.corpus.web.unplaced_lines import UnplacedLinesResource
-from ebl.transliteration.application.transliteration_query_factory import (
-    TransliterationQueryFactory,
-)
 
 
 def create_corpus_routes(api: falcon.App, context: Context):
@@ -27,13 +24,15 @@ def create_corpus_routes(api: falcon.App, context: Context):
         context.changelog,
         context.sign_repository,
         context.parallel_line_injector,
+        context.count_cache,
+        context.line_signs_cache,
     )
     context.text_repository.create_indexes()
 
     texts = TextsResource(corpus)
     text = TextResource(corpus)
     text_search = TextSearchResource(
-        corpus, TransliterationQueryFactory(context.sign_repository)
+        corpus, context.get_transliteration_query_factory()
     )
     chapters = ChaptersResource(corpus)
     chapters_display = ChaptersDisplayResource(corpus, context.cache)
@@ -37,3 +37,4 @@ class ChapterInfosPaginationSchema(Schema):
         data_key="chapterInfos",
     )
     total_count = fields.Integer(required=True, dump_only=True, data_key="totalCount")
+    is_estimate = fields.Boolean(required=True, dump_only=True, data_key="isEstimate")
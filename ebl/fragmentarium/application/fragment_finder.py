@@ -1,6 +1,9 @@
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
+
+import attr
 
 from ebl.bibliography.application.bibliography import Bibliography
+from ebl.cache import CountCache
 from ebl.dictionary.application.dictionary import Dictionary
 from ebl.files.application.file_repository import File, FileRepository
 from ebl.fragmentarium.application.fragment_repository import FragmentRepository
@@ -9,7 +12,9 @@ from ebl.fragmentarium.domain.fragment import Fragment
 from ebl.fragmentarium.domain.fragment_info import FragmentInfo
 from ebl.fragmentarium.domain.fragment_infos_pagination import FragmentInfosPagination
 from ebl.fragmentarium.domain.fragment_pager_info import FragmentPagerInfo
+from ebl.fragmentarium.domain.search_cursor import SearchCursor
 from ebl.fragmentarium.application.fragmentarium_search_query import (
+    PAGE_SIZE,
     FragmentariumSearchQuery,
 )
 from ebl.transliteration.application.parallel_line_injector import ParallelLineInjector
@@ -25,6 +30,7 @@ class FragmentFinder:
         photos: FileRepository,
         folios: FileRepository,
         parallel_injector: ParallelLineInjector,
+        count_cache: Optional[CountCache] = None,
     ):
 
         self._bibliography = bibliography
@@ -33,6 +39,7 @@ class FragmentFinder:
         self._photos = photos
         self._folios = folios
         self._parallel_injector = parallel_injector
+        self._count_cache = CountCache() if count_cache is None else count_cache
 
     def find(self, number: MuseumNumber) -> Tuple[Fragment, bool]:
         fragment = self._repository.query_by_museum_number(number)
@@ -44,45 +51,56 @@ class FragmentFinder:
         )
 
     def search(self, query: FragmentariumSearchQuery) -> FragmentInfosPagination:
-        query_results, total_count = self._repository.query_fragmentarium(query)
-        if query.transliteration.is_empty():
-            fragmentInfosResult = list(map(FragmentInfo.of, query_results))
-        else:
-            fragmentInfosResult = [
-                FragmentInfo.of(
-                    fragment, fragment.get_matching_lines(query.transliteration)
-                )
-                for fragment in query_results
-            ]
-        return FragmentInfosPagination(fragmentInfosResult, total_count)
+        query_results = self._repository.query_fragmentarium(query)
+        total_count, is_estimate = self._count(query, query_results)
+        return FragmentInfosPagination(
+            query_results,
+            total_count,
+            SearchCursor.of(query_results[-1])
+            if len(query_results) == PAGE_SIZE
+            else None,
+            is_estimate,
+        )
+
+    def _count(
+        self, query: FragmentariumSearchQuery, query_results: Sequence[FragmentInfo]
+    ) -> Tuple[int, bool]:
+        return self._count_cache.get_total(
+            query.count_key,
+            lambda: self._repository.count_fragmentarium(query),
+            query.get_exact_count(len(query_results)),
+            query.estimate_count(len(query_results)),
+        )
 
     def search_fragmentarium(
         self, query: FragmentariumSearchQuery
     ) -> FragmentInfosPagination:
         fragment_infos_pagination = self.search(query)
         fragment_infos = fragment_infos_pagination.fragment_infos
-        total_count = fragment_infos_pagination.total_count
-
-        fragment_infos_with_documents = []
-        for fragment_info in fragment_infos:
-            references_with_documents = [
-                reference.set_document(self._bibliography.find(reference.id))
-                for reference in fragment_info.references
-            ]
-            fragment_infos_with_documents.append(
-                fragment_info.set_references(references_with_documents)
+        documents = self._bibliography.find_many(
+            reference.id
+            for fragment_info in fragment_infos
+            for reference in fragment_info.references
+        )
+
+        fragment_infos_with_documents = [
+            fragment_info.set_references(
+                [
+                    reference.set_document(documents[reference.id])
+                    for reference in fragment_info.references
+                ]
             )
-        return FragmentInfosPagination(fragment_infos_with_documents, total_count)
+            for fragment_info in fragment_infos
+        ]
+        return attr.evolve(
+            fragment_infos_pagination, fragment_infos=fragment_infos_with_documents
+        )
 
     def find_random(self) -> List[FragmentInfo]:
-        return list(
-            map(FragmentInfo.of, self._repository.query_random_by_transliterated())
-        )
+        return self._repository.query_random_by_transliterated()
 
     def find_interesting(self) -> List[FragmentInfo]:
-        return list(
-            map(FragmentInfo.of, (self._repository.query_path_of_the_pioneers()))
-        )
+        return self._repository.query_path_of_the_pioneers()
 
     def folio_pager(
         self, folio_name: str, folio_number: str, number: MuseumNumber
@@ -1,13 +1,24 @@
-from marshmallow import Schema, fields
+import base64
+import json
+
+from marshmallow import EXCLUDE, Schema, ValidationError, fields, post_load
 
 from ebl.bibliography.application.reference_schema import (
     ReferenceSchema,
     ApiReferenceSchema,
 )
+from ebl.fragmentarium.application.fragment_schema import RecordSchema
 from ebl.fragmentarium.application.genre_schema import GenreSchema
+from ebl.fragmentarium.domain.fragment import select_matching_lines
+from ebl.fragmentarium.domain.fragment_info import FragmentInfo
 from ebl.fragmentarium.domain.fragment_infos_pagination import FragmentInfosPagination
+from ebl.fragmentarium.domain.record import Record
+from ebl.fragmentarium.domain.search_cursor import SearchCursor
 from ebl.transliteration.application.museum_number_schema import MuseumNumberSchema
+from ebl.transliteration.application.one_of_line_schema import OneOfLineSchema
 from ebl.transliteration.application.text_schema import TextSchema
+from ebl.transliteration.domain.text import Text
+from ebl.transliteration.domain.transliteration_query import TransliterationQuery
 
 
 class FragmentInfoSchema(Schema):
@@ -24,11 +35,79 @@ class FragmentInfoSchema(Schema):
     genres = fields.Nested(GenreSchema, many=True, load_default=tuple())
 
 
+class FragmentInfoDocumentSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    number = fields.Nested(MuseumNumberSchema, required=True, data_key="museumNumber")
+    accession = fields.String(required=True)
+    script = fields.String(required=True)
+    description = fields.String(required=True)
+    record = fields.Pluck(RecordSchema, "entries", load_default=Record())
+    references = fields.Nested(ReferenceSchema, many=True, required=True)
+    genres = fields.Nested(GenreSchema, many=True, load_default=tuple())
+    signs = fields.String(load_default="")
+    text = fields.Dict(load_default=dict)
+
+    @post_load
+    def make_fragment_info(self, data, **kwargs):
+        query = self.context.get("query")
+        matching_lines = (
+            None
+            if query is None or query.is_empty()
+            else self._load_matching_lines(data["text"], data["signs"], query)
+        )
+        return FragmentInfo.of_record(
+            data["number"],
+            data["accession"],
+            data["script"],
+            data["description"],
+            data["record"],
+            matching_lines,
+            data["references"],
+            data["genres"],
+        )
+
+    @staticmethod
+    def _load_matching_lines(
+        text: dict, signs: str, query: TransliterationQuery
+    ) -> Text:
+        text_lines = [
+            line for line in text.get("lines", []) if line["type"] == "TextLine"
+        ]
+        return Text(
+            lines=tuple(
+                OneOfLineSchema(many=True).load(
+                    select_matching_lines(text_lines, signs, query)
+                )
+            )
+        )
+
+
 class ApiFragmentInfoSchema(FragmentInfoSchema):
     number = fields.String(dump_only=True)
     references = fields.Nested(ApiReferenceSchema, many=True, required=True)
 
 
+class SearchCursorToken(fields.String):
+    def _serialize(self, value, attr, obj, **kwargs):
+        return (
+            base64.urlsafe_b64encode(
+                json.dumps([value.script, value.number]).encode()
+            ).decode()
+            if value
+            else None
+        )
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        deserialized = super()._deserialize(value, attr, data, **kwargs)
+        try:
+            script, number = json.loads(base64.urlsafe_b64decode(deserialized))
+            return SearchCursor(str(script), str(number))
+        except (ValueError, TypeError) as error:
+            raise ValidationError("Invalid pagination token.", attr) from error
+
+
 class ApiFragmentInfosPaginationSchema(Schema):
     class Meta:
         model = FragmentInfosPagination
@@ -41,3 +120,7 @@ class ApiFragmentInfosPaginationSchema(Schema):
         data_key="fragmentInfos",
     )
     total_count = fields.Integer(required=True, dump_only=True, data_key="totalCount")
+    is_estimate = fields.Boolean(required=True, dump_only=True, data_key="isEstimate")
+    next_cursor = SearchCursorToken(
+        allow_none=True, dump_only=True, data_key="paginationToken"
+    )
@@ -1,49 +1,82 @@
-from typing import ClassVar, List, Tuple
+import heapq
+from typing import ClassVar, Iterator, List, Optional, Sequence, Tuple
 
 import attr
+import numpy as np
 
+from ebl.errors import NotFoundError
 from ebl.fragmentarium.application.fragment_repository import FragmentRepository
-from ebl.fragmentarium.application.line_to_vec import LineToVecScore
-from ebl.fragmentarium.application.matches.line_to_vec_score import (
-    score,
-    score_weighted,
+from ebl.fragmentarium.application.line_to_vec import LineToVecRanking, LineToVecScore
+from ebl.fragmentarium.application.line_to_vec_matches_repository import (
+    LineToVecMatchesRepository,
+)
+from ebl.fragmentarium.application.line_to_vec_store import (
+    LineToVecMatrix,
+    LineToVecRow,
+    LineToVecStore,
+)
+from ebl.fragmentarium.application.matches.line_to_vec_scorer import LineToVecScorer
+from ebl.fragmentarium.domain.line_to_vec_encoding import (
+    LineToVecEncoding,
+    LineToVecEncodings,
 )
-from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncodings
 from ebl.transliteration.domain.museum_number import MuseumNumber
 
 
 def sort_scores_to_list(results: List[LineToVecScore]) -> List[LineToVecScore]:
-    return sorted(results, key=lambda item: -item.score)
+    return sorted(results, key=lambda item: (-item.score, item.museum_number))
 
 
-@attr.s(auto_attribs=True, frozen=True)
-class LineToVecRanking:
-    score: List[LineToVecScore]
-    score_weighted: List[LineToVecScore]
+@attr.s(auto_attribs=True, frozen=True, order=False)
+class RankedScore:
+    line_to_vec_score: LineToVecScore
+
+    def __lt__(self, other: "RankedScore") -> bool:
+        return (self.line_to_vec_score.score, other.line_to_vec_score.museum_number) < (
+            other.line_to_vec_score.score,
+            self.line_to_vec_score.museum_number,
+        )
 
 
 @attr.s(auto_attribs=True, frozen=True)
 class LineToVecRanker:
     NUMBER_OF_RESULTS_TO_RETURN: ClassVar[int] = 15
-    _score_results: List[LineToVecScore] = attr.ib(factory=list, init=False)
-    _score_weighted_results: List[LineToVecScore] = attr.ib(factory=list, init=False)
+    _score_results: List[RankedScore] = attr.ib(factory=list, init=False)
+    _score_weighted_results: List[RankedScore] = attr.ib(factory=list, init=False)
 
     @property
     def score(self) -> List[LineToVecScore]:
-        return sort_scores_to_list(self._score_results)[
-            : LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN
-        ]
+        return sort_scores_to_list(
+            [result.line_to_vec_score for result in self._score_results]
+        )
 
     @property
     def score_weighted(self) -> List[LineToVecScore]:
-        return sort_scores_to_list(self._score_weighted_results)[
-            : LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN
-        ]
+        return sort_scores_to_list(
+            [result.line_to_vec_score for result in self._score_weighted_results]
+        )
 
     @property
     def ranking(self) -> LineToVecRanking:
         return LineToVecRanking(self.score, self.score_weighted)
 
+    def is_candidate(
+        self,
+        line_to_vec_score: LineToVecScore,
+        line_to_vec_score_weighted: LineToVecScore,
+    ) -> bool:
+        return self._is_candidate(
+            line_to_vec_score, self._score_results
+        ) or self._is_candidate(
+            line_to_vec_score_weighted, self._score_weighted_results
+        )
+
+    def _is_candidate(
+        self, line_to_vec_score: LineToVecScore, score_results: List[RankedScore]
+    ) -> bool:
+        is_full = len(score_results) >= LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN
+        return not is_full or score_results[0] < RankedScore(line_to_vec_score)
+
     def insert_score(
         self,
         line_to_vec_score: LineToVecScore,
@@ -53,42 +86,146 @@ class LineToVecRanker:
         self._insert_score(line_to_vec_score_weighted, self._score_weighted_results)
 
     def _insert_score(
-        self, line_to_vec_score: LineToVecScore, score_results: List[LineToVecScore]
+        self, line_to_vec_score: LineToVecScore, score_results: List[RankedScore]
     ) -> None:
-        score_results.append(line_to_vec_score)
+        ranked_score = RankedScore(line_to_vec_score)
+        if len(score_results) < LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN:
+            heapq.heappush(score_results, ranked_score)
+        elif score_results[0] < ranked_score:
+            heapq.heapreplace(score_results, ranked_score)
+
+
+def merge_scores(
+    scores: List[LineToVecScore],
+    museum_number: MuseumNumber,
+    line_to_vec_score: Optional[LineToVecScore],
+) -> Optional[List[LineToVecScore]]:
+    others = [score for score in scores if score.museum_number != museum_number]
+    is_full = len(scores) >= LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN
+    if is_full and len(others) < len(scores):
+        if line_to_vec_score is None or RankedScore(line_to_vec_score) < RankedScore(
+            scores[-1]
+        ):
+            return None
+    return sort_scores_to_list(
+        others if line_to_vec_score is None else [*others, line_to_vec_score]
+    )[: LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN]
+
+
+def merge_ranking(
+    ranking: LineToVecRanking,
+    museum_number: MuseumNumber,
+    line_to_vec_score: Optional[LineToVecScore] = None,
+    line_to_vec_score_weighted: Optional[LineToVecScore] = None,
+) -> Optional[LineToVecRanking]:
+    score = merge_scores(ranking.score, museum_number, line_to_vec_score)
+    score_weighted = merge_scores(
+        ranking.score_weighted, museum_number, line_to_vec_score_weighted
+    )
+    return (
+        None
+        if score is None or score_weighted is None
+        else LineToVecRanking(score, score_weighted)
+    )
+
+
+def score_lines_against(
+    matrix: LineToVecMatrix, museum_number: MuseumNumber, lines: Sequence[bytes]
+) -> Iterator[Tuple[LineToVecRow, int, int]]:
+    scores, scores_weighted = LineToVecScorer(lines).score_rows(matrix.index)
+    for row, score, score_weighted in zip(
+        matrix.rows, scores.tolist(), scores_weighted.tolist()
+    ):
+        if row.museum_number != museum_number:
+            yield row, score, score_weighted
+
+
+def select_rows(
+    matrix: LineToVecMatrix, museum_number: MuseumNumber, scorer: LineToVecScorer
+) -> np.ndarray:
+    """Select the rows that can enter the top results.
+
+    The rows with the highest upper bounds are scored first. At least
+    NUMBER_OF_RESULTS_TO_RETURN of them reach the worst of their top scores,
+    so a row whose bounds are below it in both rankings cannot enter either.
+    """
+    number_of_results = LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN
+    others = np.ones(len(matrix.rows), dtype=bool)
+    if museum_number in matrix.positions:
+        others[matrix.positions[museum_number]] = False
+    if others.sum() <= number_of_results:
+        return others
+
+    bounds = scorer.bound_rows(matrix.index)
+    best = np.zeros(len(matrix.rows), dtype=bool)
+    for bound in bounds:
+        best[np.argsort(np.where(others, -bound, 1))[:number_of_results]] = True
+    selected = best.copy()
+    for bound, score in zip(bounds, scorer.score_rows(matrix.index, best)):
+        threshold = np.sort(score[best])[-number_of_results]
+        selected |= others & (bound >= threshold)
+    return selected
+
+
+def rank_lines(
+    matrix: LineToVecMatrix, museum_number: MuseumNumber, lines: Sequence[bytes]
+) -> LineToVecRanking:
+    ranker = LineToVecRanker()
+    if lines:
+        scorer = LineToVecScorer(lines)
+        rows = select_rows(matrix, museum_number, scorer)
+        scores, scores_weighted = scorer.score_rows(matrix.index, rows)
+        for position in np.flatnonzero(rows).tolist():
+            row = matrix.rows[position]
+            score = int(scores[position])
+            score_weighted = int(scores_weighted[position])
+            line_to_vec_score = LineToVecScore(row.museum_number, row.script, score)
+            line_to_vec_score_weighted = LineToVecScore(
+                row.museum_number, row.script, score_weighted
+            )
+            if ranker.is_candidate(line_to_vec_score, line_to_vec_score_weighted):
+                ranker.insert_score(line_to_vec_score, line_to_vec_score_weighted)
+    return ranker.ranking
 
 
 class FragmentMatcher:
-    def __init__(self, fragment_repository: FragmentRepository):
+    def __init__(
+        self,
+        fragment_repository: FragmentRepository,
+        line_to_vec_store: Optional[LineToVecStore] = None,
+        line_to_vec_matches_repository: Optional[LineToVecMatchesRepository] = None,
+    ):
         self._fragment_repository = fragment_repository
+        self._line_to_vec_store = (
+            LineToVecStore() if line_to_vec_store is None else line_to_vec_store
+        )
+        self._line_to_vec_matches_repository = line_to_vec_matches_repository
 
     def _parse_candidate(self, candidate: str) -> Tuple[LineToVecEncodings, ...]:
         return self._fragment_repository.query_by_museum_number(
             MuseumNumber.of(candidate)
         ).line_to_vec
 
+    def _query_precomputed(self, candidate: str) -> Optional[LineToVecRanking]:
+        if self._line_to_vec_matches_repository is None:
+            return None
+        try:
+            return self._line_to_vec_matches_repository.query_by_museum_number(
+                MuseumNumber.of(candidate)
+            )
+        except NotFoundError:
+            return None
+
     def rank_line_to_vec(self, candidate: str) -> LineToVecRanking:
+        precomputed = self._query_precomputed(candidate)
+        if precomputed is not None:
+            return precomputed
         candidate_line_to_vecs = self._parse_candidate(candidate)
-        line_to_vec_entries = (
-            self._fragment_repository.query_transliterated_line_to_vec()
+        matrix = self._line_to_vec_store.get_matrix(
+            self._fragment_repository.query_transliterated_line_to_vec
+        )
+        return rank_lines(
+            matrix,
+            MuseumNumber.of(candidate),
+            [LineToVecEncoding.to_bytes(line) for line in candidate_line_to_vecs],
         )
-        ranker = LineToVecRanker()
-        if candidate_line_to_vecs:
-            for entry in filter(
-                lambda line_to_vec_entry: line_to_vec_entry.museum_number
-                != MuseumNumber.of(candidate),
-                line_to_vec_entries,
-            ):
-                line_to_vec_score = LineToVecScore(
-                    entry.museum_number,
-                    entry.script,
-                    score(candidate_line_to_vecs, entry.line_to_vec),
-                )
-                line_to_vec_weighted_score = LineToVecScore(
-                    entry.museum_number,
-                    entry.script,
-                    score_weighted(candidate_line_to_vecs, entry.line_to_vec),
-                )
-                ranker.insert_score(line_to_vec_score, line_to_vec_weighted_score)
-
-        return ranker.ranking
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Sequence, Tuple
+from typing import List, Sequence
 
-from ebl.fragmentarium.application.line_to_vec import LineToVecEntry
+from ebl.fragmentarium.application.line_to_vec import PackedLineToVecEntry
 from ebl.fragmentarium.domain.fragment import Fragment
 from ebl.fragmentarium.domain.fragment_info import FragmentInfo
 from ebl.fragmentarium.domain.fragment_pager_info import FragmentPagerInfo
@@ -37,15 +37,15 @@ class FragmentRepository(ABC):
         ...
 
     @abstractmethod
-    def query_random_by_transliterated(self) -> List[Fragment]:
+    def query_random_by_transliterated(self) -> List[FragmentInfo]:
         ...
 
     @abstractmethod
-    def query_path_of_the_pioneers(self) -> List[Fragment]:
+    def query_path_of_the_pioneers(self) -> List[FragmentInfo]:
         ...
 
     @abstractmethod
-    def query_by_transliterated_sorted_by_date(self) -> List[Fragment]:
+    def query_by_transliterated_sorted_by_date(self) -> List[FragmentInfo]:
         ...
 
     @abstractmethod
@@ -59,7 +59,7 @@ class FragmentRepository(ABC):
     @abstractmethod
     def query_transliterated_line_to_vec(
         self,
-    ) -> List[LineToVecEntry]:
+    ) -> List[PackedLineToVecEntry]:
         ...
 
     @abstractmethod
@@ -96,5 +96,9 @@ class FragmentRepository(ABC):
 
     def query_fragmentarium(
         self, query: FragmentariumSearchQuery
-    ) -> Tuple[Sequence[Fragment], int]:
+    ) -> Sequence[FragmentInfo]:
+        ...
+
+    @abstractmethod
+    def count_fragmentarium(self, query: FragmentariumSearchQuery) -> int:
         ...
@@ -1,5 +1,7 @@
+import struct
+
 import pydash
-from marshmallow import Schema, fields, post_dump, post_load
+from marshmallow import Schema, ValidationError, fields, post_dump, post_load
 
 from ebl.bibliography.application.reference_schema import ReferenceSchema
 from ebl.fragmentarium.application.genre_schema import GenreSchema
@@ -12,7 +14,11 @@ from ebl.fragmentarium.domain.fragment import (
     UncuratedReference,
     Scope,
 )
-from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
+from ebl.fragmentarium.domain.line_to_vec_encoding import (
+    LineToVecEncoding,
+    pack_line_to_vec,
+    unpack_line_to_vec,
+)
 from ebl.fragmentarium.domain.record import Record, RecordEntry, RecordType
 from ebl.schemas import ValueEnum
 from ebl.transliteration.application.note_line_part_schemas import (
@@ -23,6 +29,18 @@ from ebl.fragmentarium.application.joins_schema import JoinsSchema
 from ebl.fragmentarium.domain.joins import Joins
 
 
+class PackedLineToVec(fields.Field):
+    def _serialize(self, value, attr, obj, **kwargs) -> bytes:
+        return pack_line_to_vec(LineToVecEncoding.to_bytes(line) for line in value)
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        try:
+            lines = unpack_line_to_vec(value) if isinstance(value, bytes) else value
+            return tuple(LineToVecEncoding.from_list(line) for line in lines)
+        except (struct.error, TypeError, ValueError) as error:
+            raise ValidationError("Invalid lineToVec.") from error
+
+
 class MeasureSchema(Schema):
     value = fields.Float(load_default=None)
     note = fields.String(load_default=None)
@@ -120,11 +138,7 @@ class FragmentSchema(Schema):
         load_default=None,
     )
     genres = fields.Nested(GenreSchema, many=True, load_default=tuple())
-    line_to_vec = fields.List(
-        fields.List(ValueEnum(LineToVecEncoding)),
-        load_default=tuple(),
-        data_key="lineToVec",
-    )
+    line_to_vec = PackedLineToVec(load_default=tuple(), data_key="lineToVec")
     authorized_scopes = fields.List(ValueEnum(Scope), data_key="authorizedScopes")
     introduction = fields.Nested(IntroductionSchema, default=Introduction("", tuple()))
 
@@ -132,7 +146,6 @@ class FragmentSchema(Schema):
     def make_fragment(self, data, **kwargs):
         data["references"] = tuple(data["references"])
         data["genres"] = tuple(data["genres"])
-        data["line_to_vec"] = tuple(map(tuple, data["line_to_vec"]))
         if data["uncurated_references"] is not None:
             data["uncurated_references"] = tuple(data["uncurated_references"])
         if "authorized_scopes" in data:
@@ -1,4 +1,4 @@
-from typing import Sequence, Tuple
+from typing import Optional, Sequence, Tuple
 
 from ebl.bibliography.application.bibliography import Bibliography
 from ebl.bibliography.domain.reference import Reference
@@ -6,6 +6,10 @@ from ebl.changelog import Changelog
 from ebl.files.application.file_repository import FileRepository
 from ebl.fragmentarium.application.fragment_repository import FragmentRepository
 from ebl.fragmentarium.application.fragment_schema import FragmentSchema
+from ebl.fragmentarium.application.line_to_vec_matches_repository import (
+    LineToVecMatchesRepository,
+)
+from ebl.fragmentarium.application.line_to_vec_store import LineToVecStore
 from ebl.fragmentarium.domain.fragment import Fragment, Genre
 from ebl.transliteration.application.parallel_line_injector import ParallelLineInjector
 from ebl.transliteration.domain.museum_number import MuseumNumber
@@ -24,6 +28,8 @@ class FragmentUpdater:
         bibliography: Bibliography,
         photos: FileRepository,
         parallel_injector: ParallelLineInjector,
+        line_to_vec_store: Optional[LineToVecStore] = None,
+        line_to_vec_matches_repository: Optional[LineToVecMatchesRepository] = None,
     ):
 
         self._repository = repository
@@ -31,6 +37,8 @@ class FragmentUpdater:
         self._bibliography = bibliography
         self._photos = photos
         self._parallel_injector = parallel_injector
+        self._line_to_vec_store = line_to_vec_store
+        self._line_to_vec_matches_repository = line_to_vec_matches_repository
 
     def update_transliteration(
         self,
@@ -48,6 +56,10 @@ class FragmentUpdater:
         )
         self._create_changlelog(user, fragment, updated_fragment)
         self._repository.update_transliteration(updated_fragment)
+        if self._line_to_vec_store is not None:
+            self._line_to_vec_store.update(updated_fragment)
+        if self._line_to_vec_matches_repository is not None:
+            self._line_to_vec_matches_repository.mark_stale(number)
 
         return self._create_result(updated_fragment)
 
@@ -19,12 +19,7 @@ class Fragmentarium:
         }
 
     def find_latest(self) -> List[FragmentInfo]:
-        return list(
-            map(
-                FragmentInfo.of,
-                self._repository.query_by_transliterated_sorted_by_date(),
-            )
-        )
+        return self._repository.query_by_transliterated_sorted_by_date()
 
     def find_needs_revision(self) -> List[FragmentInfo]:
         return self._repository.query_by_transliterated_not_revised_by_other()
@@ -1,10 +1,17 @@
+from typing import Optional
+
 import attr
 
+from ebl.cache import estimate_count, get_exact_count
+from ebl.fragmentarium.domain.search_cursor import SearchCursor
+
 from ebl.transliteration.application.transliteration_query_factory import (
     TransliterationQueryFactory,
 )
 from ebl.transliteration.domain.transliteration_query import TransliterationQuery
 
+PAGE_SIZE: int = 30
+
 
 @attr.attrs(auto_attribs=True, frozen=True)
 class FragmentariumSearchQuery:
@@ -15,3 +22,23 @@ class FragmentariumSearchQuery:
     bibliography_id: str = ""
     pages: str = ""
     paginationIndex: int = 0
+    after: Optional[SearchCursor] = None
+
+    @property
+    def count_key(self) -> tuple:
+        return (
+            self.number,
+            self.transliteration.regexp,
+            self.bibliography_id,
+            self.pages,
+        )
+
+    def get_exact_count(self, page_length: int) -> Optional[int]:
+        return (
+            get_exact_count(PAGE_SIZE, self.paginationIndex, page_length)
+            if self.after is None
+            else None
+        )
+
+    def estimate_count(self, page_length: int) -> int:
+        return estimate_count(PAGE_SIZE, self.paginationIndex, page_length)
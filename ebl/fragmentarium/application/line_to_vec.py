@@ -1,8 +1,12 @@
-from typing import Tuple
+from typing import List, Tuple, Union
 
 import attr
 
-from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncodings
+from ebl.fragmentarium.domain.line_to_vec_encoding import (
+    LineToVecEncoding,
+    LineToVecEncodings,
+    unpack_line_to_vec,
+)
 from ebl.transliteration.domain.museum_number import MuseumNumber
 
 
@@ -12,9 +16,37 @@ class LineToVecEntry:
     script: str
     line_to_vec: Tuple[LineToVecEncodings, ...]
 
+    @property
+    def lines(self) -> Tuple[bytes, ...]:
+        return tuple(LineToVecEncoding.to_bytes(line) for line in self.line_to_vec)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class PackedLineToVecEntry:
+    museum_number: MuseumNumber
+    script: str
+    packed: bytes
+
+    @property
+    def lines(self) -> Tuple[bytes, ...]:
+        return unpack_line_to_vec(self.packed)
+
+    @property
+    def line_to_vec(self) -> Tuple[LineToVecEncodings, ...]:
+        return tuple(LineToVecEncoding.from_list(line) for line in self.lines)
+
+
+AnyLineToVecEntry = Union[LineToVecEntry, PackedLineToVecEntry]
+
 
 @attr.s(auto_attribs=True, frozen=True)
 class LineToVecScore:
     museum_number: MuseumNumber
     script: str
     score: int
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class LineToVecRanking:
+    score: List[LineToVecScore]
+    score_weighted: List[LineToVecScore]
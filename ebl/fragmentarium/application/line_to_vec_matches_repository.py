@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Mapping, Sequence, Tuple
+
+from ebl.fragmentarium.application.line_to_vec import LineToVecRanking
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+
+class LineToVecMatchesRepository(ABC):
+    @abstractmethod
+    def query_by_museum_number(self, number: MuseumNumber) -> LineToVecRanking:
+        ...
+
+    @abstractmethod
+    def query_rankings(self) -> Iterable[Tuple[MuseumNumber, LineToVecRanking]]:
+        ...
+
+    @abstractmethod
+    def query_stale_numbers(self) -> Sequence[MuseumNumber]:
+        ...
+
+    @abstractmethod
+    def query_revisions(self) -> Mapping[MuseumNumber, int]:
+        ...
+
+    @abstractmethod
+    def create_or_update(
+        self, number: MuseumNumber, ranking: LineToVecRanking, revision: int = 0
+    ) -> bool:
+        ...
+
+    @abstractmethod
+    def mark_stale(self, number: MuseumNumber) -> None:
+        ...
@@ -1,6 +1,7 @@
-from marshmallow import Schema, fields, pre_dump
+from marshmallow import Schema, fields, post_load, pre_dump
 
-from ebl.fragmentarium.application.line_to_vec import LineToVecScore
+from ebl.fragmentarium.application.line_to_vec import LineToVecRanking, LineToVecScore
+from ebl.transliteration.domain.museum_number import MuseumNumber
 
 
 class LineToVecScoreSchema(Schema):
@@ -16,9 +17,19 @@ class LineToVecScoreSchema(Schema):
             "score": line_to_vec_score.score,
         }
 
+    @post_load
+    def make_line_to_vec_score(self, data: dict, **kwargs) -> LineToVecScore:
+        return LineToVecScore(
+            MuseumNumber.of(data["museum_number"]), data["script"], data["score"]
+        )
+
 
 class LineToVecRankingSchema(Schema):
     score = fields.Nested(LineToVecScoreSchema, many=True)
     score_weighted = fields.Nested(
         LineToVecScoreSchema, many=True, required=True, data_key="scoreWeighted"
     )
+
+    @post_load
+    def make_line_to_vec_ranking(self, data: dict, **kwargs) -> LineToVecRanking:
+        return LineToVecRanking(data.get("score", []), data["score_weighted"])
@@ -0,0 +1,163 @@
+import time
+from array import array
+from functools import cached_property
+from threading import Lock
+from typing import Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+import attr
+import numpy as np
+
+from ebl.cache import DEFAULT_TIMEOUT
+from ebl.fragmentarium.application.line_to_vec import (
+    AnyLineToVecEntry,
+    LineToVecEntry,
+)
+from ebl.fragmentarium.application.matches.line_to_vec_scorer import LineToVecIndex
+from ebl.fragmentarium.domain.fragment import Fragment
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class LineToVecRow:
+    museum_number: MuseumNumber
+    script: str
+    first_offset: int
+    number_of_lines: int
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class LineToVecMatrix:
+    rows: Sequence[LineToVecRow]
+    encodings: bytearray
+    offsets: array
+
+    def get_lines(self, row: LineToVecRow) -> Tuple[bytes, ...]:
+        offsets = self.offsets[
+            row.first_offset : row.first_offset + row.number_of_lines + 1
+        ]
+        return tuple(
+            bytes(self.encodings[start:end]) for start, end in zip(offsets, offsets[1:])
+        )
+
+    @cached_property
+    def positions(self) -> Mapping[MuseumNumber, int]:
+        return {row.museum_number: position for position, row in enumerate(self.rows)}
+
+    @cached_property
+    def index(self) -> LineToVecIndex:
+        row_lengths = np.array(
+            [row.number_of_lines for row in self.rows], dtype=np.int64
+        )
+        first_offsets = np.array(
+            [row.first_offset for row in self.rows], dtype=np.int64
+        )
+        line_offsets = np.repeat(
+            first_offsets - (np.cumsum(row_lengths) - row_lengths), row_lengths
+        ) + np.arange(row_lengths.sum())
+        offsets = np.asarray(self.offsets, dtype=np.int64)
+        return LineToVecIndex.of(
+            np.frombuffer(bytes(self.encodings), dtype=np.uint8),
+            offsets[line_offsets],
+            offsets[line_offsets + 1],
+            row_lengths,
+        )
+
+
+class LineToVecStore:
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._timeout = timeout
+        self._clock = clock
+        self._expires: Optional[float] = None
+        self._encodings = bytearray()
+        self._offsets = array("L")
+        self._rows: Dict[str, LineToVecRow] = {}
+        self._garbage = 0
+        self._matrix: Optional[LineToVecMatrix] = None
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_matrix(
+        self, load: Callable[[], Iterable[AnyLineToVecEntry]]
+    ) -> LineToVecMatrix:
+        with self._lock:
+            if self._expires is None or self._expires <= self._clock():
+                self._load(load())
+            return self._get_matrix()
+
+    def update(self, fragment: Fragment) -> None:
+        with self._lock:
+            if self._expires is None:
+                return
+            self._remove(str(fragment.number))
+            if fragment.text.lines:
+                self._append(
+                    LineToVecEntry(
+                        fragment.number, fragment.script, fragment.line_to_vec
+                    )
+                )
+            if self._garbage > len(self._offsets) // 2:
+                self._compact()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+            self._expires = None
+
+    def _load(self, entries: Iterable[AnyLineToVecEntry]) -> None:
+        self._clear()
+        for entry in entries:
+            self._append(entry)
+        self._expires = self._clock() + self._timeout
+
+    def _clear(self) -> None:
+        self._encodings = bytearray()
+        self._offsets = array("L")
+        self._rows = {}
+        self._garbage = 0
+        self._matrix = None
+
+    def _append(self, entry: AnyLineToVecEntry) -> None:
+        lines = entry.lines
+        self._matrix = None
+        self._rows[str(entry.museum_number)] = LineToVecRow(
+            entry.museum_number,
+            entry.script,
+            len(self._offsets),
+            len(lines),
+        )
+        self._offsets.append(len(self._encodings))
+        for line in lines:
+            self._encodings.extend(line)
+            self._offsets.append(len(self._encodings))
+
+    def _remove(self, key: str) -> None:
+        row = self._rows.pop(key, None)
+        if row is not None:
+            self._garbage += row.number_of_lines + 1
+            self._matrix = None
+
+    def _get_matrix(self) -> LineToVecMatrix:
+        if self._matrix is None:
+            self._matrix = LineToVecMatrix(
+                tuple(self._rows.values()), self._encodings, self._offsets
+            )
+        return self._matrix
+
+    def _compact(self) -> None:
+        matrix = self._get_matrix()
+        rows = [(row, matrix.get_lines(row)) for row in matrix.rows]
+        self._clear()
+        for row, lines in rows:
+            self._rows[str(row.museum_number)] = attr.evolve(
+                row, first_offset=len(self._offsets)
+            )
+            self._offsets.append(len(self._encodings))
+            for line in lines:
+                self._encodings.extend(line)
+                self._offsets.append(len(self._encodings))
@@ -0,0 +1,273 @@
+from functools import cached_property
+from itertools import accumulate
+from typing import Iterable, Optional, Sequence, Tuple
+
+import attr
+import numpy as np
+
+from ebl.fragmentarium.application.matches.line_to_vec_score import WEIGHTING
+from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
+
+WEIGHTS: Tuple[int, ...] = tuple(WEIGHTING[encoding] for encoding in LineToVecEncoding)
+WEIGHT_TABLE = np.zeros(256, dtype=np.int64)
+WEIGHT_TABLE[: len(WEIGHTS)] = WEIGHTS
+WEIGHT_ARRAY = np.array(WEIGHTS, dtype=np.int64)
+PADDING = 255
+CANDIDATE_PADDING = 254
+
+
+def _cumulative_weights(line: bytes) -> Tuple[int, ...]:
+    return (0, *accumulate(WEIGHTS[encoding] for encoding in line))
+
+
+def _longest_overlap(shorter: bytes, longer: bytes) -> Tuple[int, int]:
+    suffix = next(
+        (
+            length
+            for length in range(len(shorter), 0, -1)
+            if longer.startswith(shorter[-length:])
+        ),
+        0,
+    )
+    prefix = next(
+        (
+            length
+            for length in range(len(shorter), 0, -1)
+            if longer.endswith(shorter[:length])
+        ),
+        0,
+    )
+    return suffix, prefix
+
+
+def score_lines(first: bytes, second: bytes) -> Tuple[int, int]:
+    shorter, longer = (first, second) if len(first) <= len(second) else (second, first)
+    weights = _cumulative_weights(shorter)
+    if shorter in longer:
+        return len(shorter), weights[-1]
+    suffix, prefix = _longest_overlap(shorter, longer)
+    return (
+        max(suffix, prefix),
+        max(weights[-1] - weights[len(shorter) - suffix], weights[prefix]),
+    )
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class LineToVecIndex:
+    """Distinct lines of a set of rows as padded arrays.
+
+    Lines are stored once however often they occur. line_ids maps the lines
+    of the rows, concatenated, to the distinct lines.
+    """
+
+    lines: np.ndarray
+    right_aligned: np.ndarray
+    lengths: np.ndarray
+    weights: np.ndarray
+    line_ids: np.ndarray
+    row_lengths: np.ndarray
+
+    @property
+    def width(self) -> int:
+        return self.lines.shape[1]
+
+    @staticmethod
+    def of(
+        codes: np.ndarray, starts: np.ndarray, ends: np.ndarray, row_lengths: np.ndarray
+    ) -> "LineToVecIndex":
+        lengths = ends - starts
+        columns = np.arange(lengths.max(initial=0))
+        positions = np.minimum(starts[:, None] + columns, max(len(codes) - 1, 0))
+        padded = np.where(
+            columns < lengths[:, None],
+            codes[positions] if len(codes) else PADDING,
+            PADDING,
+        ).astype(np.uint8)
+        lines, line_ids = np.unique(padded, axis=0, return_inverse=True)
+        distinct_lengths = (lines != PADDING).sum(axis=1)
+        shifted = columns - (len(columns) - distinct_lengths)[:, None]
+        weights = np.zeros((len(lines), len(columns) + 1), dtype=np.int64)
+        weights[:, 1:] = np.cumsum(
+            np.where(lines != PADDING, WEIGHT_TABLE[lines], 0), axis=1
+        )
+        return LineToVecIndex(
+            lines,
+            np.where(
+                shifted >= 0,
+                np.take_along_axis(lines, np.maximum(shifted, 0), axis=1),
+                PADDING,
+            ).astype(np.uint8),
+            distinct_lengths,
+            weights,
+            line_ids.reshape(-1),
+            row_lengths,
+        )
+
+    @staticmethod
+    def of_rows(rows: Sequence[Sequence[bytes]]) -> "LineToVecIndex":
+        lines = [line for row in rows for line in row]
+        lengths = np.array([len(line) for line in lines], dtype=np.int64)
+        ends = np.cumsum(lengths)
+        return LineToVecIndex.of(
+            np.frombuffer(b"".join(lines), dtype=np.uint8),
+            ends - lengths,
+            ends,
+            np.array([len(row) for row in rows], dtype=np.int64),
+        )
+
+    @cached_property
+    def max_lengths(self) -> np.ndarray:
+        """Length of the longest line of every row."""
+        return self.reduce(self.lengths)
+
+    @cached_property
+    def max_counts(self) -> np.ndarray:
+        """Highest number of every encoding in one line of every row."""
+        return self.reduce(
+            np.stack(
+                [(self.lines == code).sum(axis=1) for code in range(len(WEIGHTS))],
+                axis=1,
+            )
+        )
+
+    def get_line_numbers(self, rows: np.ndarray) -> np.ndarray:
+        """Distinct lines of the rows selected by a boolean mask."""
+        return np.unique(self.line_ids[np.repeat(rows, self.row_lengths)])
+
+    def take(self, line_numbers: np.ndarray) -> "LineToVecIndex":
+        """Index of the given distinct lines, each line being its own row."""
+        return LineToVecIndex(
+            self.lines[line_numbers],
+            self.right_aligned[line_numbers],
+            self.lengths[line_numbers],
+            self.weights[line_numbers],
+            np.arange(len(line_numbers)),
+            np.ones(len(line_numbers), dtype=np.int64),
+        )
+
+    def reduce(self, scores: np.ndarray) -> np.ndarray:
+        """Maximum of the scores of the distinct lines for every row."""
+        result = np.zeros(
+            (len(self.row_lengths), *scores.shape[1:]), dtype=scores.dtype
+        )
+        has_lines = self.row_lengths > 0
+        if has_lines.any():
+            starts = (np.cumsum(self.row_lengths) - self.row_lengths)[has_lines]
+            result[has_lines] = np.maximum.reduceat(scores[self.line_ids], starts)
+        return result
+
+
+class LineToVecScorer:
+    """Scores one candidate against all rows of an index at once.
+
+    Every line of the candidate is compared with every distinct line of
+    the index, one overlap length or offset at a time.
+    """
+
+    def __init__(self, candidate: Sequence[bytes]) -> None:
+        self._candidate = tuple(dict.fromkeys(candidate))
+        self._max_length = max((len(line) for line in self._candidate), default=0)
+        self._max_counts = np.array(
+            [
+                max((line.count(code) for line in self._candidate), default=0)
+                for code in range(len(WEIGHTS))
+            ],
+            dtype=np.int64,
+        )
+
+    def score(self, lines: Iterable[bytes]) -> Tuple[int, int]:
+        score, score_weighted = self.score_rows(LineToVecIndex.of_rows([tuple(lines)]))
+        return int(score[0]), int(score_weighted[0])
+
+    def bound_rows(self, index: LineToVecIndex) -> Tuple[np.ndarray, np.ndarray]:
+        """Upper bounds of the scores of every row.
+
+        An overlap is no longer than either line and holds no more of an
+        encoding than either line does.
+        """
+        counts = np.minimum(index.max_counts, self._max_counts)
+        return (
+            np.minimum(
+                np.minimum(index.max_lengths, self._max_length), counts.sum(axis=1)
+            ),
+            counts @ WEIGHT_ARRAY,
+        )
+
+    def score_rows(
+        self, index: LineToVecIndex, rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Scores of every row, or only of the rows selected by a boolean mask.
+
+        Only the lines of the selected rows are compared. The other rows
+        score 0.
+        """
+        line_numbers = (
+            np.arange(len(index.lines))
+            if rows is None
+            else index.get_line_numbers(rows)
+        )
+        lines = index if rows is None else index.take(line_numbers)
+        score = np.zeros(len(index.lines), dtype=np.int64)
+        score_weighted = np.zeros(len(index.lines), dtype=np.int64)
+        for line in self._candidate:
+            line_score, line_score_weighted = self._score_line(line, lines)
+            score[line_numbers] = np.maximum(score[line_numbers], line_score)
+            score_weighted[line_numbers] = np.maximum(
+                score_weighted[line_numbers], line_score_weighted
+            )
+        row_score = index.reduce(score)
+        row_score_weighted = index.reduce(score_weighted)
+        if rows is not None:
+            row_score[~rows] = 0
+            row_score_weighted[~rows] = 0
+        return row_score, row_score_weighted
+
+    @staticmethod
+    def _score_line(
+        line: bytes, index: LineToVecIndex
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        codes = np.frombuffer(line, dtype=np.uint8)
+        weights = _cumulative_weights(line)
+        length = len(codes)
+        width = index.width
+        score = np.zeros(len(index.lines), dtype=np.int64)
+        score_weighted = np.zeros(len(index.lines), dtype=np.int64)
+
+        # An overlap is never longer or heavier than the shorter line,
+        # so a containment always wins over the overlaps.
+        for overlap in range(1, min(length, width) + 1):
+            is_long_enough = index.lengths >= overlap
+            suffix = is_long_enough & np.all(
+                index.lines[:, :overlap] == codes[length - overlap :], axis=1
+            )
+            prefix = is_long_enough & np.all(
+                index.right_aligned[:, width - overlap :] == codes[:overlap], axis=1
+            )
+            score[suffix | prefix] = overlap
+            score_weighted = np.maximum(
+                score_weighted,
+                np.maximum(
+                    np.where(suffix, weights[length] - weights[length - overlap], 0),
+                    np.where(prefix, weights[overlap], 0),
+                ),
+            )
+
+        for offset in range(width - length + 1):
+            in_line = np.all(index.lines[:, offset : offset + length] == codes, axis=1)
+            score[in_line] = length
+            score_weighted[in_line] = weights[length]
+
+        padded = np.concatenate(
+            [codes, np.full(width, CANDIDATE_PADDING, dtype=np.uint8)]
+        )
+        is_padding = index.lines == PADDING
+        for offset in range(length):
+            contains_line = np.all(
+                (index.lines == padded[offset : offset + width]) | is_padding, axis=1
+            )
+            score[contains_line] = index.lengths[contains_line]
+            score_weighted[contains_line] = index.weights[
+                contains_line, index.lengths[contains_line]
+            ]
+
+        return score, score_weighted
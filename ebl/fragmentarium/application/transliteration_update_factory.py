@@ -1,4 +1,8 @@
+from functools import partial
+from typing import Optional
+
 from ebl.fragmentarium.domain.transliteration_update import TransliterationUpdate
+from ebl.transliteration.application.line_signs_cache import LineSignsCache
 from ebl.transliteration.application.sign_repository import SignRepository
 from ebl.transliteration.application.signs_visitor import SignsVisitor
 from ebl.transliteration.domain.atf import Atf, WORD_SEPARATOR
@@ -7,12 +11,20 @@ from ebl.transliteration.domain.text import TextLine
 
 
 class TransliterationUpdateFactory:
-    def __init__(self, sign_repository: SignRepository):
+    def __init__(
+        self,
+        sign_repository: SignRepository,
+        cache: Optional[LineSignsCache] = None,
+    ):
         self._sign_repository = sign_repository
+        self._cache = LineSignsCache() if cache is None else cache
 
     def create(self, atf: Atf, notes: str = "") -> TransliterationUpdate:
         text = parse_atf_lark(atf)
-        signs = "\n".join(self._map_line(line) for line in text.text_lines)
+        signs = "\n".join(
+            self._cache.get(line, partial(self._map_line, line))
+            for line in text.text_lines
+        )
         return TransliterationUpdate(text, notes, signs)
 
     def _map_line(self, line: TextLine) -> str:
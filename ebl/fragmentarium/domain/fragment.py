@@ -1,5 +1,5 @@
 from itertools import groupby
-from typing import Optional, Sequence, Tuple
+from typing import Optional, Sequence, Tuple, TypeVar
 from enum import Enum
 
 import attr
@@ -157,10 +157,19 @@ class Fragment:
         return attr.evolve(self, text=text)
 
     def get_matching_lines(self, query: TransliterationQuery) -> Text:
-        line_numbers = query.match(self.signs)
+        return Text(
+            lines=tuple(select_matching_lines(self.text.text_lines, self.signs, query))
+        )
+
+
+T = TypeVar("T")
+
 
-        match = [
-            (self.text.text_lines[numbers[0] : numbers[1] + 1])
-            for numbers, _ in groupby(line_numbers)
-        ]
-        return Text(lines=tuple(pydash.flatten(match)))
+def select_matching_lines(
+    text_lines: Sequence[T], signs: str, query: TransliterationQuery
+) -> Sequence[T]:
+    match = [
+        text_lines[numbers[0] : numbers[1] + 1]
+        for numbers, _ in groupby(query.match(signs))
+    ]
+    return pydash.flatten(match)
@@ -4,7 +4,7 @@ import attr
 
 from ebl.bibliography.domain.reference import Reference
 from ebl.fragmentarium.domain.fragment import Fragment, Genre
-from ebl.fragmentarium.domain.record import RecordEntry, RecordType
+from ebl.fragmentarium.domain.record import Record, RecordEntry, RecordType
 from ebl.transliteration.domain.museum_number import MuseumNumber
 from ebl.transliteration.domain.text import Text
 
@@ -26,6 +26,28 @@ class FragmentInfo:
 
     @staticmethod
     def of(fragment: Fragment, matching_lines: Optional[Text] = None) -> "FragmentInfo":
+        return FragmentInfo.of_record(
+            fragment.number,
+            fragment.accession,
+            fragment.script,
+            fragment.description,
+            fragment.record,
+            matching_lines,
+            fragment.references,
+            fragment.genres,
+        )
+
+    @staticmethod
+    def of_record(
+        number: MuseumNumber,
+        accession: str,
+        script: str,
+        description: str,
+        record: Record,
+        matching_lines: Optional[Text] = None,
+        references: Sequence[Reference] = tuple(),
+        genres: Sequence[Genre] = tuple(),
+    ) -> "FragmentInfo":
         def is_transliteration(entry: RecordEntry) -> bool:
             return entry.type == RecordType.TRANSLITERATION
 
@@ -33,7 +55,7 @@ class FragmentInfo:
             return entry.date
 
         sorted_transliterations = [
-            entry for entry in fragment.record.entries if is_transliteration(entry)
+            entry for entry in record.entries if is_transliteration(entry)
         ]
         sorted_transliterations.sort(key=get_date)
 
@@ -44,13 +66,13 @@ class FragmentInfo:
         )
 
         return FragmentInfo(
-            fragment.number,
-            fragment.accession,
-            fragment.script,
-            fragment.description,
+            number,
+            accession,
+            script,
+            description,
             matching_lines,
             first_transliteration.user,
             first_transliteration.date,
-            fragment.references,
-            fragment.genres,
+            tuple(references),
+            tuple(genres),
         )
@@ -1,11 +1,14 @@
-from typing import Sequence
+from typing import Optional, Sequence
 
 import attr
 
 from ebl.fragmentarium.domain.fragment_info import FragmentInfo
+from ebl.fragmentarium.domain.search_cursor import SearchCursor
 
 
 @attr.s(frozen=True, auto_attribs=True)
 class FragmentInfosPagination:
     fragment_infos: Sequence[FragmentInfo]
     total_count: int
+    next_cursor: Optional[SearchCursor] = None
+    is_estimate: bool = False
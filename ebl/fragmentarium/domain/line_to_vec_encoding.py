@@ -1,5 +1,6 @@
+import struct
 from enum import Enum
-from typing import Sequence, Tuple
+from typing import Iterable, List, Sequence, Tuple
 
 
 class LineToVecEncoding(Enum):
@@ -14,5 +15,28 @@ class LineToVecEncoding(Enum):
     def from_list(sequence: Sequence[int]) -> Tuple["LineToVecEncoding", ...]:
         return tuple(map(LineToVecEncoding, sequence))
 
+    @staticmethod
+    def to_bytes(sequence: Sequence["LineToVecEncoding"]) -> bytes:
+        return bytes(encoding.value for encoding in sequence)
+
 
 LineToVecEncodings = Tuple[LineToVecEncoding, ...]
+
+
+LENGTH = struct.Struct("<I")
+
+
+def pack_line_to_vec(lines: Iterable[bytes]) -> bytes:
+    return b"".join(LENGTH.pack(len(line)) + line for line in lines)
+
+
+def unpack_line_to_vec(packed: bytes) -> Tuple[bytes, ...]:
+    view = memoryview(packed)
+    lines: List[bytes] = []
+    offset = 0
+    while offset < len(view):
+        (length,) = LENGTH.unpack_from(view, offset)
+        offset += LENGTH.size
+        lines.append(bytes(view[offset : offset + length]))
+        offset += length
+    return tuple(lines)
@@ -0,0 +1,16 @@
+from typing import Union
+
+import attr
+
+from ebl.fragmentarium.domain.fragment import Fragment
+from ebl.fragmentarium.domain.fragment_info import FragmentInfo
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class SearchCursor:
+    script: str
+    number: str
+
+    @staticmethod
+    def of(fragment: Union[Fragment, FragmentInfo]) -> "SearchCursor":
+        return SearchCursor(fragment.script, str(fragment.number))
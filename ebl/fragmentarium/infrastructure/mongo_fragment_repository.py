@@ -1,5 +1,5 @@
 import operator
-from typing import Callable, List, Optional, Sequence, Tuple, cast
+from typing import Callable, List, Optional, Sequence, Tuple, Union, cast
 
 import pymongo
 from marshmallow import EXCLUDE
@@ -7,35 +7,59 @@ from pymongo.collation import Collation
 
 from ebl.bibliography.infrastructure.bibliography import join_reference_documents
 from ebl.errors import NotFoundError
-from ebl.fragmentarium.application.fragment_info_schema import FragmentInfoSchema
+from ebl.fragmentarium.application.fragment_info_schema import (
+    FragmentInfoDocumentSchema,
+    FragmentInfoSchema,
+)
 from ebl.fragmentarium.application.fragment_repository import FragmentRepository
 from ebl.fragmentarium.application.fragment_schema import FragmentSchema
 from ebl.fragmentarium.application.fragmentarium_search_query import (
+    PAGE_SIZE,
     FragmentariumSearchQuery,
 )
 from ebl.fragmentarium.application.joins_schema import JoinSchema
-from ebl.fragmentarium.application.line_to_vec import LineToVecEntry
+from ebl.fragmentarium.application.line_to_vec import PackedLineToVecEntry
 from ebl.fragmentarium.domain.fragment import Fragment
+from ebl.fragmentarium.domain.fragment_info import FragmentInfo
 from ebl.fragmentarium.domain.fragment_pager_info import FragmentPagerInfo
 from ebl.fragmentarium.domain.joins import Join
-from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
+from ebl.fragmentarium.domain.line_to_vec_encoding import pack_line_to_vec
 from ebl.fragmentarium.infrastructure.collections import JOINS_COLLECTION
 from ebl.fragmentarium.infrastructure.queries import (
+    FRAGMENT_INFO_PROJECTION,
     HAS_TRANSLITERATION,
+    after_cursor,
     aggregate_latest,
     aggregate_needs_revision,
     aggregate_path_of_the_pioneers,
     aggregate_random,
+    fragment_info_projection,
     fragment_is,
     join_joins,
     number_is,
+    signs_match,
 )
 from ebl.mongo_collection import MongoCollection
 from ebl.transliteration.application.museum_number_schema import MuseumNumberSchema
 from ebl.transliteration.domain.museum_number import MuseumNumber
+from ebl.transliteration.domain.sign_ngrams import extract_ngrams
 from ebl.transliteration.infrastructure.collections import FRAGMENTS_COLLECTION
 from ebl.transliteration.infrastructure.queries import museum_number_is
 
+SEARCH_COLLATION = Collation(locale="en", numericOrdering=True, alternate="shifted")
+
+
+def _dump_sign_ngrams(fragment: Fragment) -> dict:
+    return {"signNgrams": sorted(extract_ngrams(fragment.signs))}
+
+
+def _pack_line_to_vec(line_to_vec: Union[bytes, Sequence[Sequence[int]]]) -> bytes:
+    return (
+        line_to_vec
+        if isinstance(line_to_vec, bytes)
+        else pack_line_to_vec(bytes(line) for line in line_to_vec)
+    )
+
 
 def has_none_values(dictionary: dict) -> bool:
     return not all(dictionary.values())
@@ -122,6 +146,11 @@ class MongoFragmentRepository(FragmentRepository):
         )
         self._fragments.create_index([("text.lines.type", pymongo.ASCENDING)])
         self._fragments.create_index([("record.type", pymongo.ASCENDING)])
+        self._fragments.create_index([("signNgrams", pymongo.ASCENDING)])
+        self._fragments.create_index(
+            [("script", pymongo.ASCENDING), ("_id", pymongo.ASCENDING)],
+            collation=SEARCH_COLLATION,
+        )
         self._fragments.create_index(
             [
                 ("publication", pymongo.ASCENDING),
@@ -154,6 +183,7 @@ class MongoFragmentRepository(FragmentRepository):
             {
                 "_id": str(fragment.number),
                 **FragmentSchema(exclude=["joins"]).dump(fragment),
+                **_dump_sign_ngrams(fragment),
             }
         )
 
@@ -161,7 +191,11 @@ class MongoFragmentRepository(FragmentRepository):
         schema = FragmentSchema(exclude=["joins"])
         return self._fragments.insert_many(
             [
-                {"_id": str(fragment.number), **schema.dump(fragment)}
+                {
+                    "_id": str(fragment.number),
+                    **schema.dump(fragment),
+                    **_dump_sign_ngrams(fragment),
+                }
                 for fragment in fragments
             ]
         )
@@ -202,7 +236,7 @@ class MongoFragmentRepository(FragmentRepository):
         signs_query = (
             {}
             if query.transliteration.is_empty()
-            else {"signs": {"$regex": query.transliteration.regexp}}
+            else signs_match(query.transliteration)
         )
 
         id_query = (
@@ -218,23 +252,32 @@ class MongoFragmentRepository(FragmentRepository):
 
     def query_fragmentarium(
         self, query: FragmentariumSearchQuery
-    ) -> Tuple[Sequence[Fragment], int]:
-        LIMIT = 30
+    ) -> Sequence[FragmentInfo]:
         mongo_query = self._query_fragmentarium_create_query(query)
+        page_query = (
+            {"$and": [mongo_query, after_cursor(query.after)]}
+            if query.after
+            else mongo_query
+        )
         cursor = (
             self._fragments.find_many(
-                mongo_query,
-                projection={"joins": False},
+                page_query,
+                projection=fragment_info_projection(query.transliteration),
             )
             .sort([("script", pymongo.ASCENDING), ("_id", pymongo.ASCENDING)])
-            .skip(LIMIT * query.paginationIndex)
-            .limit(LIMIT)
-            .collation(
-                Collation(locale="en", numericOrdering=True, alternate="shifted")
-            )
+            .skip(PAGE_SIZE * query.paginationIndex)
+            .limit(PAGE_SIZE)
+            .collation(SEARCH_COLLATION)
             .allow_disk_use(True)
         )
-        return self._map_fragments(cursor), self._fragments.count_documents(mongo_query)
+        return FragmentInfoDocumentSchema(
+            many=True, context={"query": query.transliteration}
+        ).load(cursor)
+
+    def count_fragmentarium(self, query: FragmentariumSearchQuery) -> int:
+        return self._fragments.count_documents(
+            self._query_fragmentarium_create_query(query)
+        )
 
     def query_by_id_and_page_in_references(self, id_: str, pages: str):
         match: dict = {"references": {"$elemMatch": {"id": id_}}}
@@ -245,19 +288,22 @@ class MongoFragmentRepository(FragmentRepository):
         cursor = self._fragments.find_many(match, projection={"joins": False})
         return self._map_fragments(cursor)
 
-    def query_random_by_transliterated(self):
+    def query_random_by_transliterated(self) -> List[FragmentInfo]:
         cursor = self._fragments.aggregate(
-            [*aggregate_random(), {"$project": {"joins": False}}]
+            [*aggregate_random(), {"$project": FRAGMENT_INFO_PROJECTION}]
         )
 
-        return self._map_fragments(cursor)
+        return FragmentInfoDocumentSchema(many=True).load(cursor)
 
-    def query_path_of_the_pioneers(self):
+    def query_path_of_the_pioneers(self) -> List[FragmentInfo]:
         cursor = self._fragments.aggregate(
-            [*aggregate_path_of_the_pioneers(), {"$project": {"joins": False}}]
+            [
+                *aggregate_path_of_the_pioneers(),
+                {"$project": FRAGMENT_INFO_PROJECTION},
+            ]
         )
 
-        return self._map_fragments(cursor)
+        return FragmentInfoDocumentSchema(many=True).load(cursor)
 
     def query_transliterated_numbers(self):
         cursor = self._fragments.find_many(
@@ -268,25 +314,38 @@ class MongoFragmentRepository(FragmentRepository):
             fragment["museumNumber"] for fragment in cursor
         )
 
-    def query_transliterated_line_to_vec(self) -> List[LineToVecEntry]:
-        cursor = self._fragments.find_many(HAS_TRANSLITERATION, {"text": False})
+    def query_transliterated_line_to_vec(self) -> List[PackedLineToVecEntry]:
+        cursor = self._fragments.find_many(
+            HAS_TRANSLITERATION,
+            {"museumNumber": True, "script": True, "lineToVec": True},
+        )
         return [
-            LineToVecEntry(
+            PackedLineToVecEntry(
                 MuseumNumberSchema().load(fragment["museumNumber"]),
                 fragment["script"],
-                tuple(
-                    LineToVecEncoding.from_list(line_to_vec)
-                    for line_to_vec in fragment["lineToVec"]
-                ),
+                _pack_line_to_vec(fragment.get("lineToVec", b"")),
             )
             for fragment in cursor
         ]
 
-    def query_by_transliterated_sorted_by_date(self):
+    def pack_line_to_vec(self) -> int:
+        cursor = self._fragments.find_many(
+            {"lineToVec": {"$type": "array"}}, {"lineToVec": True}
+        )
+        packed = 0
+        for fragment in cursor:
+            self._fragments.update_one(
+                {"_id": fragment["_id"]},
+                {"$set": {"lineToVec": _pack_line_to_vec(fragment["lineToVec"])}},
+            )
+            packed += 1
+        return packed
+
+    def query_by_transliterated_sorted_by_date(self) -> List[FragmentInfo]:
         cursor = self._fragments.aggregate(
-            [*aggregate_latest(), {"$project": {"joins": False}}]
+            [*aggregate_latest(), {"$project": FRAGMENT_INFO_PROJECTION}]
         )
-        return self._map_fragments(cursor)
+        return FragmentInfoDocumentSchema(many=True).load(cursor)
 
     def query_by_transliterated_not_revised_by_other(self):
         cursor = self._fragments.aggregate(
@@ -299,15 +358,18 @@ class MongoFragmentRepository(FragmentRepository):
         self._fragments.update_one(
             fragment_is(fragment),
             {
-                "$set": FragmentSchema(
-                    only=(
-                        "text",
-                        "notes",
-                        "signs",
-                        "record",
-                        "line_to_vec",
-                    )
-                ).dump(fragment)
+                "$set": {
+                    **FragmentSchema(
+                        only=(
+                            "text",
+                            "notes",
+                            "signs",
+                            "record",
+                            "line_to_vec",
+                        )
+                    ).dump(fragment),
+                    **_dump_sign_ngrams(fragment),
+                }
             },
         )
 
@@ -0,0 +1,78 @@
+from typing import Iterable, Mapping, Sequence, Tuple
+
+from marshmallow import EXCLUDE
+from pymongo.database import Database
+from pymongo.errors import DuplicateKeyError
+
+from ebl.errors import NotFoundError
+from ebl.fragmentarium.application.line_to_vec import LineToVecRanking
+from ebl.fragmentarium.application.line_to_vec_matches_repository import (
+    LineToVecMatchesRepository,
+)
+from ebl.fragmentarium.application.line_to_vec_ranking_schema import (
+    LineToVecRankingSchema,
+)
+from ebl.mongo_collection import MongoCollection
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+COLLECTION = "line_to_vec_matches"
+
+
+class MongoLineToVecMatchesRepository(LineToVecMatchesRepository):
+    def __init__(self, database: Database) -> None:
+        self._collection = MongoCollection(database, COLLECTION)
+
+    def query_by_museum_number(self, number: MuseumNumber) -> LineToVecRanking:
+        document = self._collection.find_one({"_id": str(number)})
+        if document["stale"]:
+            raise NotFoundError(f"Line to vec matches for {number} are stale.")
+        return LineToVecRankingSchema().load(document, unknown=EXCLUDE)
+
+    def query_rankings(self) -> Iterable[Tuple[MuseumNumber, LineToVecRanking]]:
+        return (
+            (
+                MuseumNumber.of(document["_id"]),
+                LineToVecRankingSchema().load(document, unknown=EXCLUDE),
+            )
+            for document in self._collection.find_many({"stale": False})
+        )
+
+    def query_stale_numbers(self) -> Sequence[MuseumNumber]:
+        return [
+            MuseumNumber.of(document["_id"])
+            for document in self._collection.find_many({"stale": True}, {"_id": True})
+        ]
+
+    def query_revisions(self) -> Mapping[MuseumNumber, int]:
+        return {
+            MuseumNumber.of(document["_id"]): document.get("revision", 0)
+            for document in self._collection.find_many(
+                {}, {"_id": True, "revision": True}
+            )
+        }
+
+    def create_or_update(
+        self, number: MuseumNumber, ranking: LineToVecRanking, revision: int = 0
+    ) -> bool:
+        # mark_stale increments the revision, so a ranking computed before
+        # the fragment was re-transliterated no longer matches and is dropped.
+        try:
+            self._collection.update_one(
+                {"_id": str(number), "revision": {"$in": [revision, None]}},
+                {"$set": {"stale": False, **LineToVecRankingSchema().dump(ranking)}},
+                upsert=True,
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+
+    def mark_stale(self, number: MuseumNumber) -> None:
+        self._collection.update_one(
+            {"_id": str(number)},
+            {
+                "$set": {"stale": True},
+                "$inc": {"revision": 1},
+                "$unset": {"score": "", "scoreWeighted": ""},
+            },
+            upsert=True,
+        )
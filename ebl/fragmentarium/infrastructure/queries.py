@@ -2,15 +2,30 @@ from typing import List
 
 from ebl.fragmentarium.domain.fragment import Fragment
 from ebl.fragmentarium.domain.record import RecordType
+from ebl.fragmentarium.domain.search_cursor import SearchCursor
 from ebl.fragmentarium.infrastructure.collections import JOINS_COLLECTION
 from ebl.transliteration.domain.museum_number import MuseumNumber
+from ebl.transliteration.domain.transliteration_query import TransliterationQuery
 from ebl.transliteration.infrastructure.collections import FRAGMENTS_COLLECTION
-from ebl.transliteration.infrastructure.queries import museum_number_is
+from ebl.transliteration.infrastructure.queries import (
+    museum_number_is,
+    ngrams_match,
+)
 
 HAS_TRANSLITERATION: dict = {"text.lines.type": {"$exists": True}}
 NUMBER_OF_LATEST_TRANSLITERATIONS: int = 20
 NUMBER_OF_NEEDS_REVISION: int = 20
 PATH_OF_THE_PIONEERS_MAX_UNCURATED_REFERENCES: int = 10
+FRAGMENT_INFO_PROJECTION: dict = {
+    "museumNumber": True,
+    "accession": True,
+    "script": True,
+    "description": True,
+    "record": True,
+    "references": True,
+    "genres": True,
+}
+MATCHING_LINES_PROJECTION: dict = {"signs": True, "text.lines": True}
 
 
 def fragment_is(fragment: Fragment) -> dict:
@@ -26,6 +41,28 @@ def number_is(number: str) -> dict:
     return {"$or": or_}
 
 
+def signs_match(query: TransliterationQuery) -> dict:
+    plan = query.plan
+    return {**ngrams_match("signNgrams", plan), "signs": {"$regex": plan.regexp}}
+
+
+def fragment_info_projection(query: TransliterationQuery) -> dict:
+    return (
+        FRAGMENT_INFO_PROJECTION
+        if query.is_empty()
+        else {**FRAGMENT_INFO_PROJECTION, **MATCHING_LINES_PROJECTION}
+    )
+
+
+def after_cursor(cursor: SearchCursor) -> dict:
+    return {
+        "$or": [
+            {"script": {"$gt": cursor.script}},
+            {"script": cursor.script, "_id": {"$gt": cursor.number}},
+        ]
+    }
+
+
 def sample_size_one() -> dict:
     return {"$sample": {"size": 1}}
 
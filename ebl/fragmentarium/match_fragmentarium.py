@@ -0,0 +1,213 @@
+import argparse
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
+
+from tqdm import tqdm
+
+from ebl.app import create_context
+from ebl.fragmentarium.application.fragment_matcher import (
+    merge_ranking,
+    rank_lines,
+    score_lines_against,
+)
+from ebl.fragmentarium.application.line_to_vec import LineToVecRanking, LineToVecScore
+from ebl.fragmentarium.application.line_to_vec_matches_repository import (
+    LineToVecMatchesRepository,
+)
+from ebl.fragmentarium.application.line_to_vec_store import (
+    LineToVecMatrix,
+    LineToVecRow,
+    LineToVecStore,
+)
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+Rankings = Iterable[Tuple[MuseumNumber, LineToVecRanking]]
+Rank = Callable[[Sequence[int]], Rankings]
+Revisions = Mapping[MuseumNumber, int]
+
+_matrix: Optional[LineToVecMatrix] = None
+
+
+def initialize_worker(matrix: LineToVecMatrix) -> None:
+    global _matrix
+    _matrix = matrix
+
+
+def rank_rows(
+    matrix: LineToVecMatrix, indices: Iterable[int]
+) -> List[Tuple[MuseumNumber, LineToVecRanking]]:
+    rows = [matrix.rows[index] for index in indices]
+    return [
+        (
+            row.museum_number,
+            rank_lines(matrix, row.museum_number, matrix.get_lines(row)),
+        )
+        for row in rows
+    ]
+
+
+def rank_shard(shard: Sequence[int]) -> List[Tuple[MuseumNumber, LineToVecRanking]]:
+    return rank_rows(cast(LineToVecMatrix, _matrix), shard)
+
+
+def rank_in_parallel(
+    executor: Executor, shard_size: int, indices: Sequence[int]
+) -> Iterator[Tuple[MuseumNumber, LineToVecRanking]]:
+    shards = [
+        indices[start : start + shard_size]
+        for start in range(0, len(indices), shard_size)
+    ]
+    for results in tqdm(executor.map(rank_shard, shards), total=len(shards)):
+        yield from results
+
+
+def merge_column(
+    matrix: LineToVecMatrix,
+    rankings: Dict[str, LineToVecRanking],
+    number: MuseumNumber,
+    row: Optional[LineToVecRow],
+) -> Tuple[Set[str], Set[str]]:
+    scores = (
+        {}
+        if row is None
+        else {
+            str(other.museum_number): (
+                LineToVecScore(number, row.script, score),
+                LineToVecScore(number, row.script, score_weighted),
+            )
+            for other, score, score_weighted in score_lines_against(
+                matrix, number, matrix.get_lines(row)
+            )
+        }
+    )
+    changed = set()
+    outdated = set()
+    for key, ranking in rankings.items():
+        merged = merge_ranking(ranking, number, *scores.get(key, (None, None)))
+        if merged is None:
+            outdated.add(key)
+        elif merged != ranking:
+            rankings[key] = merged
+            changed.add(key)
+    for key in outdated:
+        del rankings[key]
+    return changed - outdated, outdated
+
+
+def update_all(
+    repository: LineToVecMatchesRepository,
+    matrix: LineToVecMatrix,
+    rank: Rank,
+    revisions: Optional[Revisions] = None,
+) -> int:
+    revisions = repository.query_revisions() if revisions is None else revisions
+    for number, ranking in rank(range(len(matrix.rows))):
+        repository.create_or_update(number, ranking, revisions.get(number, 0))
+    return len(matrix.rows)
+
+
+def update_stale(
+    repository: LineToVecMatchesRepository,
+    matrix: LineToVecMatrix,
+    rank: Rank,
+    revisions: Optional[Revisions] = None,
+) -> int:
+    revisions = repository.query_revisions() if revisions is None else revisions
+    stale = repository.query_stale_numbers()
+    indices = {str(row.museum_number): index for index, row in enumerate(matrix.rows)}
+    rankings = {str(number): ranking for number, ranking in repository.query_rankings()}
+
+    changed: Set[str] = set()
+    outdated = {str(number) for number in stale}
+    for number in stale:
+        index = indices.get(str(number))
+        column_changed, column_outdated = merge_column(
+            matrix, rankings, number, None if index is None else matrix.rows[index]
+        )
+        changed = (changed | column_changed) - column_outdated
+        outdated |= column_outdated
+
+    for key in changed:
+        number = MuseumNumber.of(key)
+        repository.create_or_update(number, rankings[key], revisions.get(number, 0))
+    for key in outdated - set(indices):
+        number = MuseumNumber.of(key)
+        repository.create_or_update(
+            number, LineToVecRanking([], []), revisions.get(number, 0)
+        )
+    for number, ranking in rank(
+        sorted(indices[key] for key in outdated if key in indices)
+    ):
+        repository.create_or_update(number, ranking, revisions.get(number, 0))
+    return len(outdated)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--stale",
+        action="store_true",
+        help="Only rank re-transliterated fragments and the rankings they affect.",
+    )
+    parser.add_argument(
+        "--shardSize",
+        dest="shard_size",
+        type=int,
+        default=100,
+        help="Number of fragments ranked per task.",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=4, help="Number of parallel workers."
+    )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        action="store_true",
+        help="Use threads instead of processes.",
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+
+    context = create_context()
+    repository = context.line_to_vec_matches_repository
+
+    t0 = time.time()
+
+    revisions = repository.query_revisions()
+    matrix = LineToVecStore().get_matrix(
+        context.fragment_repository.query_transliterated_line_to_vec
+    )
+
+    PoolExecutor = ThreadPoolExecutor if args.threads else ProcessPoolExecutor
+
+    with PoolExecutor(
+        max_workers=args.workers, initializer=initialize_worker, initargs=(matrix,)
+    ) as executor:
+        rank = partial(rank_in_parallel, executor, args.shard_size)
+        ranked = (
+            update_stale(repository, matrix, rank, revisions)
+            if args.stale
+            else update_all(repository, matrix, rank, revisions)
+        )
+
+    t = time.time()
+    print(f"\nRanked fragments: {ranked}")
+    print(f"Time: {round((t-t0)/60, 2)} min")
@@ -0,0 +1,15 @@
+from typing import cast
+
+from ebl.app import create_context
+from ebl.fragmentarium.infrastructure.mongo_fragment_repository import (
+    MongoFragmentRepository,
+)
+
+
+if __name__ == "__main__":
+    context = create_context()
+    fragment_repository = cast(MongoFragmentRepository, context.fragment_repository)
+
+    packed = fragment_repository.pack_line_to_vec()
+
+    print(f"Packed lineToVec of {packed} fragments.")
@@ -1,7 +1,7 @@
 import argparse
 from functools import reduce
 from multiprocessing import Pool
-from typing import List
+from typing import List, Optional
 
 import attr
 from tqdm import tqdm
@@ -21,6 +21,8 @@ from ebl.transliteration.domain.transliteration_error import TransliterationErro
 
 from ebl.users.domain.user import ApiUser
 
+_context: Optional[Context] = None
+
 
 def update_fragment(
     transliteration_factory: TransliterationUpdateFactory,
@@ -99,8 +101,13 @@ class State:
         )
 
 
+def initialize_worker() -> None:
+    global _context
+    _context = create_context_()
+
+
 def update(number: MuseumNumber) -> State:
-    context = create_context_()
+    context = create_context_() if _context is None else _context
     fragment_repository = context.fragment_repository
     transliteration_factory = context.get_transliteration_update_factory()
     updater = context.get_fragment_updater()
@@ -139,7 +146,7 @@ if __name__ == "__main__":
 
     numbers = find_transliterated(create_context_().fragment_repository)
 
-    with Pool(processes=args.workers) as pool:
+    with Pool(processes=args.workers, initializer=initialize_worker) as pool:
         states = tqdm(pool.imap_unordered(update, numbers), total=len(numbers))
         final_state = reduce(
             lambda accumulator, state: accumulator.merge(state), states, State()
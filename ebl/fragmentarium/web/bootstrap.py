@@ -35,6 +35,7 @@ def create_fragmentarium_routes(api: falcon.App, context: Context):
         context.photo_repository,
         context.folio_repository,
         context.parallel_line_injector,
+        context.count_cache,
     )
     updater = context.get_fragment_updater()
     annotations_service = AnnotationsService(
@@ -52,6 +53,8 @@ def create_fragmentarium_routes(api: falcon.App, context: Context):
         context.changelog,
         context.sign_repository,
         context.parallel_line_injector,
+        context.count_cache,
+        context.line_signs_cache,
     )
 
     statistics = make_statistics_resource(context.cache, fragmentarium)
@@ -59,7 +62,11 @@ def create_fragmentarium_routes(api: falcon.App, context: Context):
     fragment_genre = FragmentGenreResource(updater)
 
     fragment_matcher = FragmentMatcherResource(
-        FragmentMatcher(context.fragment_repository)
+        FragmentMatcher(
+            context.fragment_repository,
+            context.line_to_vec_store,
+            context.line_to_vec_matches_repository,
+        )
     )
     fragment_search = FragmentSearch(
         fragmentarium,
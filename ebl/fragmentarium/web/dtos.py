@@ -5,6 +5,8 @@ from ebl.bibliography.application.reference_schema import ApiReferenceSchema
 from ebl.errors import DataError
 from ebl.fragmentarium.application.fragment_schema import FragmentSchema
 from ebl.fragmentarium.domain.fragment import Fragment
+from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
+from ebl.schemas import ValueEnum
 from ebl.transliteration.domain.museum_number import MuseumNumber
 from ebl.users.domain.user import User
 
@@ -15,6 +17,9 @@ class FragmentDtoSchema(FragmentSchema):
         lambda _, context: context["has_photo"], data_key="hasPhoto"
     )
     references = fields.Nested(ApiReferenceSchema, many=True)
+    line_to_vec = fields.List(
+        fields.List(ValueEnum(LineToVecEncoding)), data_key="lineToVec"
+    )
 
     class Meta:
         exclude = ("authorized_scopes",)
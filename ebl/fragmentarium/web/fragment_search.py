@@ -1,7 +1,8 @@
-from typing import Tuple, Dict
+from typing import Optional, Tuple, Dict
 
 import falcon
 from falcon_caching import Cache
+from marshmallow import ValidationError
 
 from ebl.cache import DEFAULT_TIMEOUT, cache_control
 from ebl.dispatcher import create_dispatcher
@@ -10,11 +11,13 @@ from ebl.fragmentarium.application.fragment_finder import FragmentFinder
 from ebl.fragmentarium.application.fragment_info_schema import (
     ApiFragmentInfoSchema,
     ApiFragmentInfosPaginationSchema,
+    SearchCursorToken,
 )
 from ebl.fragmentarium.application.fragmentarium import Fragmentarium
 from ebl.fragmentarium.application.fragmentarium_search_query import (
     FragmentariumSearchQuery,
 )
+from ebl.fragmentarium.domain.search_cursor import SearchCursor
 from ebl.transliteration.application.transliteration_query_factory import (
     TransliterationQueryFactory,
 )
@@ -53,6 +56,15 @@ class FragmentSearch:
                         "paginationIndex",
                     ]
                 ): lambda value: self._search_fragmentarium(finder, value),
+                frozenset(
+                    [
+                        "number",
+                        "transliteration",
+                        "bibliographyId",
+                        "pages",
+                        "paginationToken",
+                    ]
+                ): lambda value: self._search_fragmentarium(finder, value),
                 frozenset(["random"]): lambda _: self.api_fragment_info_schema.dump(
                     finder.find_random()
                 ),
@@ -82,7 +94,8 @@ class FragmentSearch:
         transliteration: str,
         bibliographyId: str,
         pages: str,
-        paginationIndex: str,
+        paginationIndex: str = "0",
+        paginationToken: str = "",
     ) -> FragmentariumSearchQuery:
         parsed_transliteration = (
             self._transliteration_query_factory.create(transliteration)
@@ -99,6 +112,7 @@ class FragmentSearch:
             validated_id,
             validated_pages,
             self._validate_pagination_index(paginationIndex),
+            self._validate_pagination_token(paginationToken),
         )
 
     @staticmethod
@@ -111,6 +125,19 @@ class FragmentSearch:
             ) from error
         return int(paginationIndex)
 
+    @staticmethod
+    def _validate_pagination_token(paginationToken: str) -> Optional[SearchCursor]:
+        try:
+            return (
+                SearchCursorToken().deserialize(paginationToken)
+                if paginationToken
+                else None
+            )
+        except ValidationError as error:
+            raise DataError(
+                f'Pagination Token "{paginationToken}" is not valid.'
+            ) from error
+
     @staticmethod
     def _validate_pages(id: str, pages: str) -> Tuple[str, str]:
         if pages:
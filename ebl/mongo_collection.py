@@ -56,13 +56,26 @@ class MongoCollection:
         else:
             return result
 
-    def update_one(self, query, update):
-        result = self.__get_collection().update_one(query, update)
-        if result.matched_count == 0:
+    def update_one(self, query, update, upsert=False):
+        result = self.__get_collection().update_one(query, update, upsert)
+        if result.matched_count == 0 and not upsert:
             raise self.__not_found_error(query)
         else:
             return result
 
+    def find_one_and_update(self, query, update, *args, **kwargs) -> Any:
+        document = self.__get_collection().find_one_and_update(
+            query, update, *args, **kwargs
+        )
+
+        if document is None:
+            raise self.__not_found_error(query)
+        else:
+            return document
+
+    def delete_many(self, query):
+        return self.__get_collection().delete_many(query)
+
     def count_documents(self, query) -> int:
         return self.__get_collection().count_documents(query)
 
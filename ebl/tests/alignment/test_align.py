@@ -1,7 +1,13 @@
 from alignment.vocabulary import Vocabulary
 from hamcrest import assert_that, has_properties, contains_exactly
+from mockito import spy, verify
 
-from ebl.alignment.application.align import align, align_pair
+from ebl.alignment.application.align import (
+    align,
+    align_pair,
+    create_aligner,
+    score_pair,
+)
 from ebl.alignment.domain.sequence import NamedSequence
 from ebl.alignment.domain.scoring import match
 
@@ -31,3 +37,50 @@ def test_align() -> None:
         result,
         contains_exactly(has_properties({"score": 16}), has_properties({"score": 0})),
     )
+
+
+def test_score_pair() -> None:
+    vocabulary = Vocabulary()
+    sequence_1 = NamedSequence.of_signs("name1", "ABZ001 ABZ002", vocabulary)
+    sequence_2 = NamedSequence.of_signs("name2", "ABZ002 ABZ001", vocabulary)
+
+    assert score_pair(sequence_1, sequence_2, vocabulary) == match
+
+
+def test_align_min_score() -> None:
+    vocabulary = Vocabulary()
+    sequence_1 = NamedSequence.of_signs("name1", "ABZ001", vocabulary)
+    sequence_2 = NamedSequence.of_signs("name2", "ABZ001", vocabulary)
+    sequence_3 = NamedSequence.of_signs("name3", "ABZ002", vocabulary)
+
+    result = align(
+        [(sequence_1, sequence_3), (sequence_1, sequence_2)], vocabulary, match
+    )
+
+    assert_that(
+        result,
+        contains_exactly(has_properties({"score": match, "b": sequence_2})),
+    )
+
+
+def test_align_min_score_backtraces_only_passing_pairs() -> None:
+    vocabulary = Vocabulary()
+    sequence_1 = NamedSequence.of_signs("name1", "ABZ001", vocabulary)
+    sequence_2 = NamedSequence.of_signs("name2", "ABZ001", vocabulary)
+    sequence_3 = NamedSequence.of_signs("name3", "ABZ002", vocabulary)
+    aligner = spy(create_aligner(vocabulary))
+
+    align(
+        [(sequence_1, sequence_3), (sequence_1, sequence_2)],
+        vocabulary,
+        match,
+        aligner,
+    )
+
+    verify(aligner, times=1).align(sequence_1.sequence, sequence_3.sequence)
+    verify(aligner, times=0).align(
+        sequence_1.sequence, sequence_3.sequence, backtrace=True
+    )
+    verify(aligner, times=1).align(
+        sequence_1.sequence, sequence_2.sequence, backtrace=True
+    )
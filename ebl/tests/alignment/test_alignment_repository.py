@@ -0,0 +1,103 @@
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from ebl.alignment.domain.stored_alignment import (
+    AlignmentState,
+    ChapterAlignment,
+    ManuscriptAlignment,
+)
+from ebl.alignment.infrastructure.mongo_alignment_repository import COLLECTION
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+NUMBER = MuseumNumber.of("X.1")
+MANUSCRIPT = ManuscriptAlignment("NinNA1a", 120, 85.71, 92.86)
+CHAPTER = ChapterAlignment("L I.1 OB I", "chapter-hash", [MANUSCRIPT])
+OTHER_CHAPTER = ChapterAlignment("L I.2 OB I", "other-hash")
+PARAMETERS = "parameters-hash"
+
+
+def test_query_state_not_found(alignment_repository) -> None:
+    assert alignment_repository.query_state(NUMBER) is None
+
+
+def test_update(alignment_repository) -> None:
+    alignment_repository.create_indexes()
+    alignment_repository.update(
+        NUMBER, "fragment-hash", PARAMETERS, [CHAPTER, OTHER_CHAPTER]
+    )
+
+    assert alignment_repository.query_state(NUMBER) == AlignmentState(
+        "fragment-hash",
+        {"L I.1 OB I": "chapter-hash", "L I.2 OB I": "other-hash"},
+        PARAMETERS,
+    )
+    assert list(alignment_repository.query_alignments()) == [
+        (NUMBER, "L I.1 OB I", MANUSCRIPT)
+    ]
+
+
+def test_alignments_are_unique(alignment_repository, database) -> None:
+    alignment_repository.create_indexes()
+    alignment_repository.update(NUMBER, "fragment-hash", PARAMETERS, [CHAPTER])
+
+    with pytest.raises(DuplicateKeyError):
+        database[COLLECTION].insert_one(
+            {
+                "fragment": str(NUMBER),
+                "chapter": CHAPTER.chapter,
+                "manuscript": MANUSCRIPT.manuscript,
+            }
+        )
+
+
+def test_update_chapters(alignment_repository) -> None:
+    new_manuscript = ManuscriptAlignment("NinNA1b", 110)
+    alignment_repository.update(
+        NUMBER, "fragment-hash", PARAMETERS, [CHAPTER, OTHER_CHAPTER]
+    )
+    alignment_repository.update(
+        NUMBER,
+        "fragment-hash",
+        PARAMETERS,
+        [ChapterAlignment("L I.2 OB I", "new-hash", [new_manuscript])],
+        {"L I.1 OB I"},
+    )
+
+    assert alignment_repository.query_state(NUMBER) == AlignmentState(
+        "fragment-hash", {"L I.2 OB I": "new-hash"}, PARAMETERS
+    )
+    assert list(alignment_repository.query_alignments()) == [
+        (NUMBER, "L I.2 OB I", new_manuscript)
+    ]
+
+
+def test_update_fragment(alignment_repository) -> None:
+    alignment_repository.update(
+        NUMBER, "fragment-hash", PARAMETERS, [CHAPTER, OTHER_CHAPTER]
+    )
+    alignment_repository.update(NUMBER, "new-hash", PARAMETERS, [OTHER_CHAPTER])
+
+    assert alignment_repository.query_state(NUMBER) == AlignmentState(
+        "new-hash", {"L I.2 OB I": "other-hash"}, PARAMETERS
+    )
+    assert list(alignment_repository.query_alignments()) == []
+
+
+def test_update_parameters(alignment_repository) -> None:
+    alignment_repository.update(NUMBER, "fragment-hash", PARAMETERS, [CHAPTER])
+    alignment_repository.update(
+        NUMBER, "fragment-hash", "new-parameters", [OTHER_CHAPTER]
+    )
+
+    assert alignment_repository.query_state(NUMBER) == AlignmentState(
+        "fragment-hash", {"L I.2 OB I": "other-hash"}, "new-parameters"
+    )
+    assert list(alignment_repository.query_alignments()) == []
+
+
+def test_query_state_without_parameters(alignment_repository, database) -> None:
+    database["aligned_fragments"].insert_one(
+        {"_id": str(NUMBER), "signsHash": "fragment-hash", "chapters": []}
+    )
+
+    assert alignment_repository.query_state(NUMBER) == AlignmentState("fragment-hash")
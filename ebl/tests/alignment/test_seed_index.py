@@ -0,0 +1,54 @@
+import pytest
+
+from ebl.alignment.domain.scoring import break_match, match
+from ebl.alignment.domain.seed_index import (
+    SeedIndex,
+    expand_sign,
+    get_minimum_seeds,
+    split_lines,
+)
+
+
+def test_expand_sign() -> None:
+    assert expand_sign("ABZ001/ABZ545") == frozenset(
+        ["ABZ001", "ABZ545", "ABZ354", "ABZ597"]
+    )
+
+
+def test_split_lines() -> None:
+    assert split_lines(["A", "B", "#", "#", "C", "#"]) == [["A", "B"], ["C"]]
+
+
+def test_count_seeds() -> None:
+    seed_index = SeedIndex()
+    seed_index.add("a", ["ABZ001", "ABZ002", "#", "ABZ003"])
+    seed_index.add("b", ["ABZ354", "ABZ004/ABZ005"])
+
+    assert seed_index.count_seeds(["ABZ001", "ABZ545", "ABZ005", "ABZ003"]) == {
+        "a": 2,
+        "b": 2,
+    }
+
+
+def test_count_seeds_of_length() -> None:
+    seed_index = SeedIndex(2)
+    seed_index.add("a", ["ABZ001", "ABZ002", "#", "ABZ003", "ABZ004"])
+    seed_index.add("b", ["ABZ002", "ABZ003"])
+
+    assert seed_index.count_seeds(
+        ["ABZ001", "ABZ002", "ABZ003", "#", "ABZ003", "ABZ004"]
+    ) == {"a": 2, "b": 1}
+
+
+@pytest.mark.parametrize(
+    "min_score,signs,expected",
+    [
+        (100, ["A"], 7),
+        (match, ["A"], 1),
+        (match + break_match, ["A", "#", "B"], 1),
+        (0, ["A"], 0),
+        (break_match, ["A", "#"], 0),
+    ],
+)
+def test_get_minimum_seeds(min_score, signs, expected) -> None:
+    assert get_minimum_seeds(min_score, signs) == expected
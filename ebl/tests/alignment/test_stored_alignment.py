@@ -0,0 +1,44 @@
+import pytest
+
+from ebl.alignment.domain.stored_alignment import (
+    AlignmentState,
+    hash_parameters,
+    hash_signs,
+)
+
+
+def test_hash_signs() -> None:
+    assert hash_signs(["ABZ001", "ABZ002"]) == hash_signs(["ABZ001", "ABZ002"])
+    assert hash_signs(["ABZ001", "ABZ002"]) != hash_signs(["ABZ001ABZ002"])
+    assert hash_signs(["ABZ001"]) != hash_signs(["ABZ002"])
+
+
+def test_hash_parameters() -> None:
+    assert hash_parameters({"min_score": 100, "min_seeds": None}) == hash_parameters(
+        {"min_seeds": None, "min_score": 100}
+    )
+    assert hash_parameters({"min_score": 100}) != hash_parameters({"min_score": 90})
+    assert hash_parameters({"min_seeds": None}) != hash_parameters(
+        {"min_seeds": "None"}
+    )
+
+
+@pytest.mark.parametrize(
+    "signs_hash,parameters_hash,chapter,chapter_hash,expected",
+    [
+        ("fragment", "parameters", "chapter", "hash", False),
+        ("changed", "parameters", "chapter", "hash", True),
+        ("fragment", "changed", "chapter", "hash", True),
+        ("fragment", "parameters", "chapter", "changed", True),
+        ("fragment", "parameters", "new chapter", "hash", True),
+    ],
+)
+def test_is_outdated(
+    signs_hash, parameters_hash, chapter, chapter_hash, expected
+) -> None:
+    state = AlignmentState("fragment", {"chapter": "hash"}, "parameters")
+
+    assert (
+        state.is_outdated(signs_hash, parameters_hash, chapter, chapter_hash)
+        is expected
+    )
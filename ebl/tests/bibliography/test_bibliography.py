@@ -58,6 +58,83 @@ def test_find(bibliography, bibliography_repository, when):
     assert bibliography.find(bibliography_entry["id"]) == bibliography_entry
 
 
+def test_find_is_cached(bibliography, bibliography_repository, when):
+    bibliography_entry = BibliographyEntryFactory.build()
+    (
+        when(bibliography_repository)
+        .query_by_id(bibliography_entry["id"])
+        .thenReturn(bibliography_entry)
+    )
+    bibliography.find(bibliography_entry["id"])
+
+    assert bibliography.find(bibliography_entry["id"]) == bibliography_entry
+    verify(bibliography_repository, times=1).query_by_id(bibliography_entry["id"])
+
+
+def test_find_many_queries_only_uncached(bibliography, bibliography_repository, when):
+    first = BibliographyEntryFactory.build(id="Q1")
+    second = BibliographyEntryFactory.build(id="Q2")
+    when(bibliography_repository).query_by_id("Q1").thenReturn(first)
+    when(bibliography_repository).query_by_ids(["Q2"]).thenReturn([second])
+    bibliography.find("Q1")
+
+    assert bibliography.find_many(["Q1", "Q2"]) == {"Q1": first, "Q2": second}
+    assert bibliography.find_many(["Q2"]) == {"Q2": second}
+    verify(bibliography_repository, times=1).query_by_ids(...)
+
+
+def test_update_invalidates_cache(bibliography, user):
+    bibliography_entry = BibliographyEntryFactory.build()
+    updated_entry = {**bibliography_entry, "title": "New Title"}
+    bibliography.create(bibliography_entry, user)
+    bibliography.find(bibliography_entry["id"])
+    bibliography.update(updated_entry, user)
+
+    assert bibliography.find(bibliography_entry["id"]) == updated_entry
+
+
+def test_update_invalidates_cache_after_write(
+    bibliography, bibliography_repository, user, monkeypatch
+):
+    bibliography_entry = BibliographyEntryFactory.build()
+    updated_entry = {**bibliography_entry, "title": "New Title"}
+    bibliography.create(bibliography_entry, user)
+    update = bibliography_repository.update
+
+    def update_with_concurrent_find(entry):
+        bibliography.find(entry["id"])
+        update(entry)
+
+    monkeypatch.setattr(bibliography_repository, "update", update_with_concurrent_find)
+    bibliography.update(updated_entry, user)
+
+    assert bibliography.find(bibliography_entry["id"]) == updated_entry
+
+
+def test_find_many(bibliography, bibliography_repository, when):
+    bibliography_entries = [
+        BibliographyEntryFactory.build(id="Q1"),
+        BibliographyEntryFactory.build(id="Q2"),
+    ]
+    ids = [entry["id"] for entry in bibliography_entries]
+    (
+        when(bibliography_repository)
+        .query_by_ids(ids)
+        .thenReturn(list(reversed(bibliography_entries)))
+    )
+    assert bibliography.find_many([*ids, ids[0]]) == {
+        entry["id"]: entry for entry in bibliography_entries
+    }
+
+
+def test_find_many_not_found(bibliography, bibliography_repository, when):
+    bibliography_entry = BibliographyEntryFactory.build()
+    ids = [bibliography_entry["id"], "not found"]
+    when(bibliography_repository).query_by_ids(ids).thenReturn([bibliography_entry])
+    with pytest.raises(NotFoundError, match="not found"):
+        bibliography.find_many(ids)
+
+
 def test_create(
     bibliography,
     bibliography_repository,
@@ -160,8 +237,8 @@ def test_validate_references(
     bibliography_repository, bibliography, user, changelog, when
 ):
     reference = ReferenceFactory.build(with_document=True)
+    bibliography.create(reference.document, user)
 
-    (when(bibliography).find(reference.id).thenReturn(reference))
     bibliography.validate_references([reference])
 
 
@@ -172,9 +249,6 @@ def test_validate_references_invalid(
     first_invalid = ReferenceFactory.build(with_document=True)
     second_invalid = ReferenceFactory.build(with_document=True)
     bibliography.create(valid_reference.document, user)
-    (when(bibliography).find(valid_reference.id).thenReturn(valid_reference))
-    (when(bibliography).find(first_invalid.id).thenRaise(NotFoundError))
-    (when(bibliography).find(second_invalid.id).thenRaise(NotFoundError))
 
     expected_error = (
         "Unknown bibliography entries: "
@@ -0,0 +1,55 @@
+from ebl.bibliography.application.bibliography_cache import BibliographyCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+ENTRY = {"id": "Q1", "title": "Title"}
+
+
+def test_get_many():
+    cache = BibliographyCache()
+    cache.set_many({"Q1": ENTRY})
+
+    assert cache.get_many(["Q1", "Q2"]) == {"Q1": ENTRY}
+
+
+def test_invalidate():
+    cache = BibliographyCache()
+    cache.set_many({"Q1": ENTRY})
+    cache.invalidate("Q1")
+    cache.invalidate("Q2")
+
+    assert cache.get_many(["Q1"]) == {}
+
+
+def test_clear():
+    cache = BibliographyCache()
+    cache.set_many({"Q1": ENTRY, "Q2": ENTRY})
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_expires():
+    clock = FakeClock()
+    cache = BibliographyCache(timeout=10, clock=clock)
+    cache.set_many({"Q1": ENTRY})
+    clock.time = 10
+
+    assert cache.get_many(["Q1"]) == {}
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used():
+    cache = BibliographyCache(max_size=2)
+    cache.set_many({"Q1": ENTRY, "Q2": ENTRY})
+    cache.get_many(["Q1"])
+    cache.set_many({"Q3": ENTRY})
+
+    assert cache.get_many(["Q1", "Q2", "Q3"]) == {"Q1": ENTRY, "Q3": ENTRY}
@@ -35,6 +35,25 @@ def test_find(database, bibliography_repository, create_mongo_bibliography_entry
     )
 
 
+def test_query_by_ids(
+    database, bibliography_repository, create_mongo_bibliography_entry
+):
+    bibliography_entries = [
+        BibliographyEntryFactory.build(id="Q1"),
+        BibliographyEntryFactory.build(id="Q2"),
+    ]
+    database[COLLECTION].insert_many(
+        [create_mongo_bibliography_entry(entry) for entry in bibliography_entries]
+    )
+
+    assert sorted(
+        bibliography_repository.query_by_ids(
+            [entry["id"] for entry in bibliography_entries] + ["not found"]
+        ),
+        key=lambda entry: entry["id"],
+    ) == sorted(bibliography_entries, key=lambda entry: entry["id"])
+
+
 def test_entry_not_found(bibliography_repository):
     with pytest.raises(NotFoundError):
         bibliography_repository.query_by_id("not found")
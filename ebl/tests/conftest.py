@@ -20,6 +20,9 @@ from pymongo_inmemory import MongoClient
 
 import ebl.app
 import ebl.context
+from ebl.alignment.infrastructure.mongo_alignment_repository import (
+    MongoAlignmentRepository,
+)
 from ebl.bibliography.application.bibliography import Bibliography
 from ebl.bibliography.application.serialization import create_object_entry
 from ebl.bibliography.infrastructure.bibliography import MongoBibliographyRepository
@@ -48,6 +51,9 @@ from ebl.fragmentarium.infrastructure.mongo_annotations_repository import (
 from ebl.fragmentarium.infrastructure.mongo_fragment_repository import (
     MongoFragmentRepository,
 )
+from ebl.fragmentarium.infrastructure.mongo_line_to_vec_matches_repository import (
+    MongoLineToVecMatchesRepository,
+)
 from ebl.lemmatization.infrastrcuture.mongo_suggestions_finder import (
     MongoLemmaRepository,
 )
@@ -333,6 +339,16 @@ def lemma_repository(database):
     return MongoLemmaRepository(database)
 
 
+@pytest.fixture
+def line_to_vec_matches_repository(database):
+    return MongoLineToVecMatchesRepository(database)
+
+
+@pytest.fixture
+def alignment_repository(database):
+    return MongoAlignmentRepository(database)
+
+
 @pytest.fixture
 def annotations_service(
     annotations_repository,
@@ -404,6 +420,8 @@ def context(
     bibliography_repository,
     annotations_repository,
     lemma_repository,
+    line_to_vec_matches_repository,
+    alignment_repository,
     user,
     parallel_line_injector,
 ):
@@ -422,6 +440,8 @@ def context(
         text_repository=text_repository,
         annotations_repository=annotations_repository,
         lemma_repository=lemma_repository,
+        line_to_vec_matches_repository=line_to_vec_matches_repository,
+        alignment_repository=alignment_repository,
         cache=Cache({"CACHE_TYPE": "null"}),
         parallel_line_injector=parallel_line_injector,
     )
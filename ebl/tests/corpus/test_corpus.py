@@ -1,9 +1,13 @@
 from typing import cast
 
+from concurrent.futures import ThreadPoolExecutor
+
 import attr
 import pytest
+from mockito import verify
+from ebl.cache import CountCache
 from ebl.corpus.application.id_schemas import TextIdSchema
-from ebl.corpus.application.corpus import Corpus
+from ebl.corpus.application.corpus import TRANSLITERATION_SEARCH_PAGE_SIZE, Corpus
 
 from ebl.corpus.application.lemmatization import (
     ChapterLemmatization,
@@ -33,7 +37,9 @@ from ebl.transliteration.domain.sign_tokens import Reading
 from ebl.transliteration.domain.text import Text as Transliteration
 from ebl.transliteration.domain.text_line import TextLine
 from ebl.transliteration.domain.tokens import Joiner, LanguageShift, ValueToken
+from ebl.transliteration.domain.transliteration_query import TransliterationQuery
 from ebl.transliteration.domain.word_tokens import AbstractWord, Word
+from ebl.transliteration.application.signs_visitor import SignsVisitor
 
 
 CHAPTERS_COLLECTION = "chapters"
@@ -55,17 +61,21 @@ CHAPTER_WITHOUT_DOCUMENTS = attr.evolve(
 
 
 def expect_bibliography(bibliography, when) -> None:
-    for manuscript in CHAPTER.manuscripts:
-        for reference in manuscript.references:
-            (when(bibliography).find(reference.id).thenReturn(reference.document))
-        for old_siglum in manuscript.old_sigla:
-            (when(bibliography)).find(old_siglum.reference.id).thenReturn(
-                old_siglum.reference.document
-            )
+    references = [
+        reference
+        for manuscript in CHAPTER.manuscripts
+        for reference in [
+            *manuscript.references,
+            *(old_siglum.reference for old_siglum in manuscript.old_sigla),
+        ]
+    ]
+    when(bibliography).find_many(...).thenReturn(
+        {reference.id: reference.document for reference in references}
+    )
 
 
 def expect_invalid_references(bibliography, when) -> None:
-    when(bibliography).find(...).thenRaise(NotFoundError())
+    when(bibliography).find_many(...).thenRaise(NotFoundError())
 
 
 def expect_signs(signs, sign_repository) -> None:
@@ -190,6 +200,57 @@ def test_search_lemma(corpus: Corpus, text_repository, when) -> None:
     assert corpus.search_lemma(lemma, None) == (dictionary_line,)
 
 
+def test_search_transliteration(
+    text_repository,
+    bibliography,
+    changelog,
+    sign_repository,
+    parallel_line_injector,
+    signs,
+    when,
+) -> None:
+    for sign in signs:
+        sign_repository.create(sign)
+    executor = ThreadPoolExecutor(1)
+    corpus = Corpus(
+        text_repository,
+        bibliography,
+        changelog,
+        sign_repository,
+        parallel_line_injector,
+        CountCache(executor=executor),
+    )
+    query = TransliterationQuery(string="KU", visitor=SignsVisitor(sign_repository))
+    chapters = [CHAPTER] * TRANSLITERATION_SEARCH_PAGE_SIZE
+    when(text_repository).query_by_transliteration(query, 0).thenReturn(chapters)
+    when(text_repository).count_by_transliteration(query).thenReturn(40)
+
+    estimated = corpus.search_transliteration(query, 0)
+    executor.shutdown(wait=True)
+    result = corpus.search_transliteration(query, 0)
+
+    assert estimated.total_count == TRANSLITERATION_SEARCH_PAGE_SIZE + 1
+    assert estimated.is_estimate is True
+    assert result.total_count == 40
+    assert result.is_estimate is False
+    verify(text_repository, times=1).count_by_transliteration(query)
+
+
+def test_search_transliteration_last_page(
+    corpus: Corpus, text_repository, sign_repository, signs, when
+) -> None:
+    for sign in signs:
+        sign_repository.create(sign)
+    query = TransliterationQuery(string="KU", visitor=SignsVisitor(sign_repository))
+    when(text_repository).query_by_transliteration(query, 1).thenReturn([CHAPTER])
+
+    result = corpus.search_transliteration(query, 1)
+
+    assert result.total_count == TRANSLITERATION_SEARCH_PAGE_SIZE + 1
+    assert result.is_estimate is False
+    verify(text_repository, times=0).count_by_transliteration(query)
+
+
 def test_find_line(corpus, text_repository, bibliography, when) -> None:
     number = 0
     when(text_repository).find_line(CHAPTER.id_, number).thenReturn(
@@ -249,7 +310,7 @@ def test_find_chapter_raises_exception_if_references_not_found(
     when(text_repository).find_chapter(CHAPTER.id_).thenReturn(
         CHAPTER_WITHOUT_DOCUMENTS
     )
-    when(bibliography).find(...).thenRaise(NotFoundError())
+    when(bibliography).find_many(...).thenRaise(NotFoundError())
 
     with pytest.raises(Defect):
         corpus.find_chapter(CHAPTER.id_)
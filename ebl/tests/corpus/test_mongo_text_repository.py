@@ -10,6 +10,7 @@ from ebl.corpus.domain.dictionary_line import DictionaryLine
 from ebl.corpus.domain.text import Text, UncertainFragment
 from ebl.dictionary.domain.word import WordId
 from ebl.errors import DuplicateError, NotFoundError
+from ebl.mongo_collection import MongoCollection
 from ebl.fragmentarium.application.joins_schema import JoinSchema
 from ebl.fragmentarium.domain.fragment import Fragment
 from ebl.fragmentarium.domain.joins import Join, Joins
@@ -28,6 +29,7 @@ from ebl.transliteration.domain.genre import Genre
 from ebl.transliteration.domain.line_number import LineNumber
 from ebl.transliteration.domain.museum_number import MuseumNumber
 from ebl.transliteration.domain.normalized_akkadian import AkkadianWord
+from ebl.transliteration.domain.sign_ngrams import extract_ngrams
 from ebl.transliteration.domain.sign_tokens import Reading
 from ebl.transliteration.domain.text_id import TextId
 from ebl.transliteration.domain.text_line import TextLine
@@ -38,6 +40,7 @@ from ebl.transliteration.application.signs_visitor import SignsVisitor
 
 TEXTS_COLLECTION = "texts"
 CHAPTERS_COLLECTION = "chapters"
+CHAPTER_SIGN_NGRAMS_COLLECTION = "chapter_sign_ngrams"
 JOINS_COLLECTION = "joins"
 MANUSCRIPT_ID = 1
 MUSEUM_NUMBER = MuseumNumber("X", "1")
@@ -172,6 +175,19 @@ def test_creating_chapter(database, text_repository) -> None:
     assert inserted_chapter == ChapterSchema().dump(CHAPTER)
 
 
+def test_creating_chapter_sign_ngrams(database, text_repository) -> None:
+    text_repository.create_chapter(CHAPTER)
+
+    assert list(
+        database[CHAPTER_SIGN_NGRAMS_COLLECTION].find(
+            {}, projection={"_id": False, "chapterId": False, "generation": False}
+        )
+    ) == [
+        {"manuscriptIndex": index, "ngrams": sorted(extract_ngrams(signs))}
+        for index, signs in enumerate(CHAPTER.signs)
+    ]
+
+
 def test_it_is_not_possible_to_create_duplicate_texts(text_repository) -> None:
     text_repository.create_indexes()
     text_repository.create(TEXT)
@@ -278,6 +294,43 @@ def test_updating_chapter(database, text_repository) -> None:
     assert text_repository.find_chapter(CHAPTER.id_) == updated_chapter
 
 
+def test_updating_chapter_sign_ngrams(text_repository, sign_repository, signs) -> None:
+    for sign in signs:
+        sign_repository.create(sign)
+    text_repository.create_chapter(attr.evolve(CHAPTER_FILTERED_QUERY, signs=("MA",)))
+
+    text_repository.update(CHAPTER_FILTERED_QUERY.id_, CHAPTER_FILTERED_QUERY)
+    query = TransliterationQuery(string="KU", visitor=SignsVisitor(sign_repository))
+
+    assert text_repository.query_by_transliteration(query, 0) == [
+        CHAPTER_FILTERED_QUERY
+    ]
+    assert text_repository.count_by_transliteration(query) == 1
+
+
+def test_updating_chapter_sign_ngrams_keeps_chapter_searchable(
+    database, text_repository, sign_repository, signs, monkeypatch
+) -> None:
+    for sign in signs:
+        sign_repository.create(sign)
+    text_repository.create_chapter(CHAPTER_FILTERED_QUERY)
+    query = TransliterationQuery(string="KU", visitor=SignsVisitor(sign_repository))
+    counts = []
+    delete_many = MongoCollection.delete_many
+
+    def count_and_delete_many(self, delete_query):
+        counts.append(text_repository.count_by_transliteration(query))
+        return delete_many(self, delete_query)
+
+    monkeypatch.setattr(MongoCollection, "delete_many", count_and_delete_many)
+    text_repository.update(CHAPTER_FILTERED_QUERY.id_, CHAPTER_FILTERED_QUERY)
+
+    assert counts == [1]
+    assert database[CHAPTER_SIGN_NGRAMS_COLLECTION].count_documents({}) == len(
+        CHAPTER_FILTERED_QUERY.signs
+    )
+
+
 def test_updating_non_existing_chapter_raises_exception(text_repository):
     with pytest.raises(NotFoundError):
         text_repository.update(CHAPTER.id_, CHAPTER)
@@ -293,14 +346,11 @@ def test_query_by_transliteration(
     for sign in signs:
         sign_repository.create(sign)
     text_repository.create_chapter(CHAPTER_FILTERED_QUERY)
-    result = text_repository.query_by_transliteration(
-        query=TransliterationQuery(
-            string=string, visitor=SignsVisitor(sign_repository)
-        ),
-        pagination_index=0,
-    )
+    query = TransliterationQuery(string=string, visitor=SignsVisitor(sign_repository))
+    result = text_repository.query_by_transliteration(query=query, pagination_index=0)
     expected = [CHAPTER_FILTERED_QUERY] if is_match else []
-    assert result == (expected, len(expected))
+    assert result == expected
+    assert text_repository.count_by_transliteration(query) == len(expected)
 
 
 def make_dictionary_line(text: Text, chapter: Chapter, lemma: str) -> DictionaryLine:
@@ -393,11 +443,11 @@ def test_query_by_transliteration_lookup(
     )
     text_repository.create(TEXT)
     text_repository.create_chapter(chapter)
-    result = text_repository.query_by_transliteration(
-        TransliterationQuery(string="KU", visitor=SignsVisitor(sign_repository)), 0
-    )
+    query = TransliterationQuery(string="KU", visitor=SignsVisitor(sign_repository))
+    result = text_repository.query_by_transliteration(query, 0)
     expected = [attr.evolve(CHAPTER_FILTERED_QUERY, text_name=TEXT.name)]
-    assert result == (expected, len(expected))
+    assert result == expected
+    assert text_repository.count_by_transliteration(query) == len(expected)
 
 
 def test_query_manuscripts_by_chapter(database, text_repository) -> None:
@@ -1,12 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from mockito import verify
 
+from ebl.cache import CountCache
 from ebl.errors import NotFoundError
+from ebl.fragmentarium.application.fragment_finder import FragmentFinder
 from ebl.fragmentarium.application.fragmentarium_search_query import (
+    PAGE_SIZE,
     FragmentariumSearchQuery,
 )
 from ebl.fragmentarium.domain.folios import Folio
 from ebl.fragmentarium.domain.fragment_info import FragmentInfo
 from ebl.fragmentarium.domain.fragment_infos_pagination import FragmentInfosPagination
+from ebl.fragmentarium.domain.search_cursor import SearchCursor
 from ebl.tests.factories.bibliography import BibliographyEntryFactory, ReferenceFactory
 from ebl.tests.factories.fragment import FragmentFactory, TransliteratedFragmentFactory
 from ebl.transliteration.domain.lark_parser import parse_atf_lark
@@ -44,15 +51,19 @@ def test_find_not_found(fragment_finder, fragment_repository, when):
 
 
 def test_find_random(fragment_finder, fragment_repository, when):
-    fragment = FragmentFactory.build()
-    (when(fragment_repository).query_random_by_transliterated().thenReturn([fragment]))
-    assert fragment_finder.find_random() == [FragmentInfo.of(fragment)]
+    fragment_info = FragmentInfo.of(FragmentFactory.build())
+    (
+        when(fragment_repository)
+        .query_random_by_transliterated()
+        .thenReturn([fragment_info])
+    )
+    assert fragment_finder.find_random() == [fragment_info]
 
 
 def test_find_interesting(fragment_finder, fragment_repository, when):
-    fragment = FragmentFactory.build()
-    (when(fragment_repository).query_path_of_the_pioneers().thenReturn([fragment]))
-    assert fragment_finder.find_interesting() == [FragmentInfo.of(fragment)]
+    fragment_info = FragmentInfo.of(FragmentFactory.build())
+    (when(fragment_repository).query_path_of_the_pioneers().thenReturn([fragment_info]))
+    assert fragment_finder.find_interesting() == [fragment_info]
 
 
 def test_folio_pager(fragment_finder, fragment_repository, when):
@@ -114,9 +125,11 @@ def test_search_fragmentarium_inject_document_in_fragment_infos(
         .search(FragmentariumSearchQuery(bibliography_id="id", pages="pages"))
         .thenReturn(FragmentInfosPagination([fragment_1, fragment_2], 2))
     )
-    (when(bibliography).find("RN.0").thenReturn(bibliography_entry))
-    (when(bibliography).find("RN.1").thenReturn(bibliography_entry))
-    (when(bibliography).find("RN.2").thenReturn(bibliography_entry))
+    (
+        when(bibliography)
+        .find_many(...)
+        .thenReturn({id_: bibliography_entry for id_ in ["RN.0", "RN.1", "RN.2"]})
+    )
 
     assert fragment_finder.search_fragmentarium(
         FragmentariumSearchQuery(bibliography_id="id", pages="pages")
@@ -135,7 +148,7 @@ def test_search(fragment_finder, fragment_repository, when):
     (
         when(fragment_repository)
         .query_fragmentarium(FragmentariumSearchQuery(number=number))
-        .thenReturn(([fragment], 1))
+        .thenReturn([FragmentInfo.of(fragment)])
     )
 
     assert fragment_finder.search(
@@ -146,6 +159,65 @@ def test_search(fragment_finder, fragment_repository, when):
     )
 
 
+def test_search_counts_full_page(
+    fragment_repository,
+    dictionary,
+    photo_repository,
+    file_repository,
+    bibliography,
+    parallel_line_injector,
+    when,
+):
+    executor = ThreadPoolExecutor(1)
+    fragment_finder = FragmentFinder(
+        bibliography,
+        fragment_repository,
+        dictionary,
+        photo_repository,
+        file_repository,
+        parallel_line_injector,
+        CountCache(executor=executor),
+    )
+    fragments = [
+        FragmentInfo.of(FragmentFactory.build(number=MuseumNumber.of(f"X.{index}")))
+        for index in range(PAGE_SIZE)
+    ]
+    query = FragmentariumSearchQuery(number="X")
+    (when(fragment_repository).query_fragmentarium(query).thenReturn(fragments))
+    (when(fragment_repository).count_fragmentarium(query).thenReturn(40))
+
+    estimated = fragment_finder.search(query)
+    executor.shutdown(wait=True)
+    result = fragment_finder.search(query)
+
+    assert estimated.total_count == PAGE_SIZE + 1
+    assert estimated.is_estimate is True
+    assert estimated.next_cursor == SearchCursor.of(fragments[-1])
+    assert result.total_count == 40
+    assert result.is_estimate is False
+    verify(fragment_repository, times=1).count_fragmentarium(query)
+
+
+def test_search_counts_last_page(fragment_finder, fragment_repository, when):
+    fragment_info = FragmentInfo.of(FragmentFactory.build())
+    query = FragmentariumSearchQuery(number="X", paginationIndex=2)
+    (when(fragment_repository).query_fragmentarium(query).thenReturn([fragment_info]))
+
+    assert fragment_finder.search(query).total_count == 2 * PAGE_SIZE + 1
+    verify(fragment_repository, times=0).count_fragmentarium(query)
+
+
+def test_search_last_page_has_no_cursor(fragment_finder, fragment_repository, when):
+    fragment_info = FragmentInfo.of(FragmentFactory.build())
+    query = FragmentariumSearchQuery(
+        number="X", after=SearchCursor("A", "X.1"), paginationIndex=1
+    )
+    (when(fragment_repository).query_fragmentarium(query).thenReturn([fragment_info]))
+    (when(fragment_repository).count_fragmentarium(query).thenReturn(PAGE_SIZE + 1))
+
+    assert fragment_finder.search(query).next_cursor is None
+
+
 def test_search_fragmentarium_transliteration(
     fragment_finder, fragment_repository, sign_repository, signs, when
 ):
@@ -155,17 +227,17 @@ def test_search_fragmentarium_transliteration(
     string = "MA UD"
 
     query = TransliterationQuery(string=string, visitor=SignsVisitor(sign_repository))
-    matching_fragments = [transliterated_fragment]
+    expected_lines = parse_atf_lark("6'. [...] x# mu ta-ma;-tu₂")
+    matching_fragments = [FragmentInfo.of(transliterated_fragment, expected_lines)]
 
     (
         when(fragment_repository)
         .query_fragmentarium(FragmentariumSearchQuery(transliteration=query))
-        .thenReturn((matching_fragments, 1))
+        .thenReturn(matching_fragments)
     )
 
-    expected_lines = parse_atf_lark("6'. [...] x# mu ta-ma;-tu₂")
     expected = FragmentInfosPagination(
-        [FragmentInfo.of(fragment, expected_lines) for fragment in matching_fragments],
+        matching_fragments,
         1,
     )
     assert (
@@ -0,0 +1,41 @@
+from ebl.fragmentarium.application.fragment_info_schema import (
+    FragmentInfoDocumentSchema,
+)
+from ebl.fragmentarium.application.fragment_schema import FragmentSchema
+from ebl.fragmentarium.domain.fragment_info import FragmentInfo
+from ebl.tests.factories.fragment import TransliteratedFragmentFactory
+from ebl.transliteration.application.signs_visitor import SignsVisitor
+from ebl.transliteration.domain.lark_parser import parse_atf_lark
+from ebl.transliteration.domain.transliteration_query import TransliterationQuery
+
+
+FRAGMENT = TransliteratedFragmentFactory.build()
+
+
+def test_load_document():
+    assert FragmentInfoDocumentSchema().load(
+        FragmentSchema().dump(FRAGMENT)
+    ) == FragmentInfo.of(FRAGMENT)
+
+
+def test_load_document_with_matching_lines(sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    query = TransliterationQuery(string="MA UD", visitor=SignsVisitor(sign_repository))
+    document = FragmentSchema(
+        only=(
+            "number",
+            "accession",
+            "script",
+            "description",
+            "record",
+            "references",
+            "genres",
+            "signs",
+            "text",
+        )
+    ).dump(FRAGMENT)
+
+    assert FragmentInfoDocumentSchema(context={"query": query}).load(
+        document
+    ) == FragmentInfo.of(FRAGMENT, parse_atf_lark("6'. [...] x# mu ta-ma;-tu₂"))
@@ -1,8 +1,20 @@
+import random
+
+import pytest
+
 from ebl.fragmentarium.application.fragment_matcher import (
+    FragmentMatcher,
+    merge_scores,
+    rank_lines,
+    score_lines_against,
+    select_rows,
     sort_scores_to_list,
+    LineToVecRanker,
     LineToVecRanking,
 )
 from ebl.fragmentarium.application.line_to_vec import LineToVecScore, LineToVecEntry
+from ebl.fragmentarium.application.line_to_vec_store import LineToVecStore
+from ebl.fragmentarium.application.matches.line_to_vec_scorer import LineToVecScorer
 from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
 from ebl.transliteration.domain.museum_number import MuseumNumber
 from ebl.tests.factories.fragment import FragmentFactory
@@ -30,6 +42,199 @@ def test_sort_scores_to_list():
     ]
 
 
+def test_sort_scores_to_list_ties():
+    score = [
+        LineToVecScore(MuseumNumber.of("X.10"), "N/A", 4),
+        LineToVecScore(MuseumNumber.of("X.2"), "N/A", 4),
+        LineToVecScore(MuseumNumber.of("X.1"), "N/A", 5),
+    ]
+
+    assert sort_scores_to_list(score) == [
+        LineToVecScore(MuseumNumber.of("X.1"), "N/A", 5),
+        LineToVecScore(MuseumNumber.of("X.2"), "N/A", 4),
+        LineToVecScore(MuseumNumber.of("X.10"), "N/A", 4),
+    ]
+
+
+def test_ranker_keeps_top_results():
+    scores = [
+        LineToVecScore(MuseumNumber.of(f"X.{index}"), "N/A", (index * 7) % 5)
+        for index in reversed(range(40))
+    ]
+    ranker = LineToVecRanker()
+    for score in scores:
+        ranker.insert_score(score, score)
+
+    expected = sort_scores_to_list(scores)[
+        : LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN
+    ]
+    assert ranker.ranking == LineToVecRanking(expected, expected)
+    assert len(ranker._score_results) == LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN
+
+
+def test_ranker_is_candidate():
+    ranker = LineToVecRanker()
+    for index in range(LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN):
+        score = LineToVecScore(MuseumNumber.of(f"X.{index}"), "N/A", 5)
+        ranker.insert_score(score, score)
+
+    below = LineToVecScore(MuseumNumber.of("Y.1"), "N/A", 4)
+    tie_after = LineToVecScore(MuseumNumber.of("Y.1"), "N/A", 5)
+    tie_before = LineToVecScore(MuseumNumber.of("A.1"), "N/A", 5)
+    above = LineToVecScore(MuseumNumber.of("Y.1"), "N/A", 6)
+
+    assert ranker.is_candidate(below, below) is False
+    assert ranker.is_candidate(tie_after, tie_after) is False
+    assert ranker.is_candidate(tie_before, below) is True
+    assert ranker.is_candidate(below, above) is True
+
+
+def test_line_to_vec_ranking_keeps_top_scores(fragment_matcher, when):
+    generator = random.Random(0)
+    encodings = [encoding.value for encoding in LineToVecEncoding]
+
+    def create_line_to_vec():
+        return tuple(
+            LineToVecEncoding.from_list(
+                generator.choices(encodings, k=generator.randint(1, 10))
+            )
+            for _ in range(generator.randint(1, 3))
+        )
+
+    candidate = FragmentFactory.build(
+        number=MuseumNumber.of("BM.1"), line_to_vec=create_line_to_vec()
+    )
+    entries = [
+        LineToVecEntry(MuseumNumber.of(f"X.{index}"), "N/A", create_line_to_vec())
+        for index in range(200)
+    ]
+    scorer = LineToVecScorer(
+        [LineToVecEncoding.to_bytes(line) for line in candidate.line_to_vec]
+    )
+    scores = [
+        (
+            entry,
+            scorer.score(
+                LineToVecEncoding.to_bytes(line) for line in entry.line_to_vec
+            ),
+        )
+        for entry in entries
+    ]
+
+    (
+        when(fragment_matcher._fragment_repository)
+        .query_by_museum_number(candidate.number)
+        .thenReturn(candidate)
+    )
+    (
+        when(fragment_matcher._fragment_repository)
+        .query_transliterated_line_to_vec()
+        .thenReturn(entries)
+    )
+    number_of_results = LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN
+    assert fragment_matcher.rank_line_to_vec("BM.1") == LineToVecRanking(
+        sort_scores_to_list(
+            LineToVecScore(entry.museum_number, entry.script, score)
+            for entry, (score, _) in scores
+        )[:number_of_results],
+        sort_scores_to_list(
+            LineToVecScore(entry.museum_number, entry.script, score_weighted)
+            for entry, (_, score_weighted) in scores
+        )[:number_of_results],
+    )
+
+
+def create_scores(*scores):
+    return [
+        LineToVecScore(MuseumNumber.of(number), "N/A", score)
+        for number, score in scores
+    ]
+
+
+FULL_SCORES = create_scores(
+    *(
+        (f"X.{index}", 20 - index)
+        for index in range(LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN)
+    )
+)
+
+
+@pytest.mark.parametrize(
+    "scores, number, score, expected",
+    [
+        (
+            create_scores(("X.1", 4), ("X.2", 2)),
+            "X.2",
+            ("X.2", 5),
+            create_scores(("X.2", 5), ("X.1", 4)),
+        ),
+        (create_scores(("X.1", 4), ("X.2", 2)), "X.1", None, create_scores(("X.2", 2))),
+        (
+            FULL_SCORES,
+            "Y.1",
+            ("Y.1", 30),
+            [*create_scores(("Y.1", 30)), *FULL_SCORES[:-1]],
+        ),
+        (FULL_SCORES, "Y.1", ("Y.1", 0), FULL_SCORES),
+        (
+            FULL_SCORES,
+            "X.0",
+            ("X.0", 6),
+            [*FULL_SCORES[1:-1], *create_scores(("X.0", 6)), FULL_SCORES[-1]],
+        ),
+        (FULL_SCORES, "X.0", ("X.0", 5), None),
+        (FULL_SCORES, "X.0", None, None),
+    ],
+)
+def test_merge_scores(scores, number, score, expected):
+    assert (
+        merge_scores(
+            scores,
+            MuseumNumber.of(number),
+            None if score is None else create_scores(score)[0],
+        )
+        == expected
+    )
+
+
+def test_line_to_vec_precomputed(fragment_repository, line_to_vec_matches_repository):
+    ranking = LineToVecRanking(create_scores(("X.1", 3)), create_scores(("X.1", 5)))
+    line_to_vec_matches_repository.create_or_update(MuseumNumber.of("BM.11"), ranking)
+    fragment_matcher = FragmentMatcher(
+        fragment_repository,
+        line_to_vec_matches_repository=line_to_vec_matches_repository,
+    )
+
+    assert fragment_matcher.rank_line_to_vec("BM.11") == ranking
+
+
+def test_line_to_vec_stale(fragment_repository, line_to_vec_matches_repository, when):
+    number = MuseumNumber.of("BM.11")
+    line_to_vec = (LineToVecEncoding.from_list([1, 2, 1, 1]),)
+    line_to_vec_matches_repository.create_or_update(
+        number, LineToVecRanking(create_scores(("X.1", 1)), create_scores(("X.1", 1)))
+    )
+    line_to_vec_matches_repository.mark_stale(number)
+    fragment_matcher = FragmentMatcher(
+        fragment_repository,
+        line_to_vec_matches_repository=line_to_vec_matches_repository,
+    )
+    (
+        when(fragment_repository)
+        .query_by_museum_number(number)
+        .thenReturn(FragmentFactory.build(number=number, line_to_vec=line_to_vec))
+    )
+    (
+        when(fragment_repository)
+        .query_transliterated_line_to_vec()
+        .thenReturn([LineToVecEntry(MuseumNumber.of("X.1"), "N/A", line_to_vec)])
+    )
+
+    assert fragment_matcher.rank_line_to_vec("BM.11") == LineToVecRanking(
+        create_scores(("X.1", 4)), create_scores(("X.1", 6))
+    )
+
+
 def test_line_to_vec(fragment_matcher, when):
     parameters = "BM.11"
     fragment_1_line_to_vec = (LineToVecEncoding.from_list([1, 2, 1, 1]),)
@@ -90,3 +295,47 @@ def test_empty_line_to_vec(fragment_matcher, when):
         )
     )
     assert fragment_matcher.rank_line_to_vec(parameters) == LineToVecRanking([], [])
+
+
+def test_rank_lines_prunes_rows_without_changing_the_ranking():
+    generator = random.Random(3)
+    entries = [
+        LineToVecEntry(
+            MuseumNumber.of(f"X.{index}"),
+            "N/A",
+            tuple(
+                LineToVecEncoding.from_list(
+                    generator.choices(
+                        [0, 1, 1, 1, 1, 2, 3, 4, 5], k=generator.randint(1, 12)
+                    )
+                )
+                for _ in range(generator.randint(1, 4))
+            ),
+        )
+        for index in range(300)
+    ]
+    matrix = LineToVecStore().get_matrix(lambda: entries)
+
+    for row in matrix.rows[:30]:
+        lines = matrix.get_lines(row)
+        ranker = LineToVecRanker()
+        for other, score, score_weighted in score_lines_against(
+            matrix, row.museum_number, lines
+        ):
+            ranker.insert_score(
+                LineToVecScore(other.museum_number, other.script, score),
+                LineToVecScore(other.museum_number, other.script, score_weighted),
+            )
+
+        assert rank_lines(matrix, row.museum_number, lines) == ranker.ranking
+        assert not select_rows(matrix, row.museum_number, LineToVecScorer(lines))[
+            matrix.positions[row.museum_number]
+        ]
+
+    assert any(
+        select_rows(
+            matrix, row.museum_number, LineToVecScorer(matrix.get_lines(row))
+        ).sum()
+        < len(matrix.rows) - 1
+        for row in matrix.rows[:30]
+    )
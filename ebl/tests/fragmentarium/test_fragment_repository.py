@@ -1,3 +1,5 @@
+from typing import Sequence, Tuple
+
 import attr
 import pytest
 
@@ -9,9 +11,15 @@ from ebl.fragmentarium.application.fragmentarium_search_query import (
     FragmentariumSearchQuery,
 )
 from ebl.fragmentarium.application.joins_schema import JoinSchema
-from ebl.fragmentarium.application.line_to_vec import LineToVecEntry
+from ebl.fragmentarium.application.line_to_vec import PackedLineToVecEntry
 from ebl.fragmentarium.domain.fragment import Fragment, Genre, Introduction
+from ebl.fragmentarium.domain.fragment_info import FragmentInfo
 from ebl.fragmentarium.domain.joins import Join, Joins
+from ebl.fragmentarium.domain.line_to_vec_encoding import (
+    LineToVecEncoding,
+    pack_line_to_vec,
+)
+from ebl.fragmentarium.domain.search_cursor import SearchCursor
 from ebl.fragmentarium.domain.transliteration_update import TransliterationUpdate
 from ebl.lemmatization.domain.lemmatization import Lemmatization, LemmatizationToken
 from ebl.tests.factories.bibliography import ReferenceFactory
@@ -27,6 +35,7 @@ from ebl.transliteration.domain.line_number import LineNumber
 from ebl.transliteration.domain.museum_number import MuseumNumber
 from ebl.transliteration.domain.normalized_akkadian import AkkadianWord
 from ebl.transliteration.domain.parallel_line import Labels, ParallelFragment
+from ebl.transliteration.domain.sign_ngrams import extract_ngrams
 from ebl.transliteration.domain.sign_tokens import Logogram, Reading
 from ebl.transliteration.domain.text import Text
 from ebl.transliteration.domain.text_line import TextLine
@@ -73,6 +82,32 @@ ANOTHER_LEMMATIZED_FRAGMENT = attr.evolve(
 SCHEMA = FragmentSchema()
 
 
+def query_fragmentarium(
+    fragment_repository: FragmentRepository, query: FragmentariumSearchQuery
+) -> Tuple[Sequence[FragmentInfo], int]:
+    return (
+        fragment_repository.query_fragmentarium(query),
+        fragment_repository.count_fragmentarium(query),
+    )
+
+
+def expected_page(
+    query: FragmentariumSearchQuery, fragments: Sequence[Fragment], count: int
+) -> Tuple[Sequence[FragmentInfo], int]:
+    return (
+        [
+            FragmentInfo.of(
+                fragment,
+                None
+                if query.transliteration.is_empty()
+                else fragment.get_matching_lines(query.transliteration),
+            )
+            for fragment in fragments
+        ],
+        count,
+    )
+
+
 def test_create(database, fragment_repository):
     fragment = LemmatizedFragmentFactory.build()
     fragment_id = fragment_repository.create(fragment)
@@ -80,7 +115,10 @@ def test_create(database, fragment_repository):
     assert fragment_id == str(fragment.number)
     assert database[COLLECTION].find_one(
         {"_id": fragment_id}, projection={"_id": False}
-    ) == FragmentSchema(exclude=["joins"]).dump(fragment)
+    ) == {
+        **FragmentSchema(exclude=["joins"]).dump(fragment),
+        "signNgrams": sorted(extract_ngrams(fragment.signs)),
+    }
 
 
 def test_create_many(database, fragment_repository):
@@ -91,7 +129,10 @@ def test_create_many(database, fragment_repository):
         assert str(fragment.number) in fragment_ids
         assert database[COLLECTION].find_one(
             {"_id": str(fragment.number)}, projection={"_id": False}
-        ) == FragmentSchema(exclude=["joins"]).dump(fragment)
+        ) == {
+            **FragmentSchema(exclude=["joins"]).dump(fragment),
+            "signNgrams": sorted(extract_ngrams(fragment.signs)),
+        }
 
 
 def test_create_join(database, fragment_repository):
@@ -189,7 +230,7 @@ def test_find_random(fragment_repository):
     fragment_repository.create_many([FragmentFactory.build(), transliterated_fragment])
 
     assert fragment_repository.query_random_by_transliterated() == [
-        transliterated_fragment
+        FragmentInfo.of(transliterated_fragment)
     ]
 
 
@@ -262,6 +303,29 @@ def test_update_transliteration_with_record(fragment_repository, user):
     assert result == updated_fragment
 
 
+def test_update_transliteration_sign_ngrams(
+    database, fragment_repository, sign_repository, signs
+):
+    for sign in signs:
+        sign_repository.create(sign)
+    fragment = FragmentFactory.build()
+    fragment_repository.create(fragment)
+    updated_fragment = attr.evolve(fragment, signs="MI DIŠ UD ŠU")
+
+    fragment_repository.update_transliteration(updated_fragment)
+    query = FragmentariumSearchQuery(
+        transliteration=TransliterationQuery(
+            string="DIŠ UD", visitor=SignsVisitor(sign_repository)
+        )
+    )
+    result = query_fragmentarium(fragment_repository, query)
+
+    assert database[COLLECTION].find_one(
+        {"_id": str(fragment.number)}, projection={"signNgrams": True, "_id": False}
+    ) == {"signNgrams": sorted(extract_ngrams(updated_fragment.signs))}
+    assert result == expected_page(query, [updated_fragment], 1)
+
+
 def test_update_update_transliteration_not_found(fragment_repository):
     transliterated_fragment = TransliteratedFragmentFactory.build()
     with pytest.raises(NotFoundError):
@@ -367,15 +431,15 @@ def test_query_fragmentarium_number(database, fragment_repository):
         [SCHEMA.dump(fragment), SCHEMA.dump(FragmentFactory.build())]
     )
 
-    assert fragment_repository.query_fragmentarium(
-        FragmentariumSearchQuery(number=fragment.number)
-    ) == ([fragment], 1)
+    query = FragmentariumSearchQuery(number=fragment.number)
+    assert query_fragmentarium(fragment_repository, query) == expected_page(
+        query, [fragment], 1
+    )
 
 
 def test_query_fragmentarium_not_found(fragment_repository):
-    assert (
-        fragment_repository.query_fragmentarium(FragmentariumSearchQuery(number="K.1"))
-    ) == ([], 0)
+    query = FragmentariumSearchQuery(number="K.1")
+    assert query_fragmentarium(fragment_repository, query) == ([], 0)
 
 
 def test_query_fragmentarium_reference_id(database, fragment_repository):
@@ -383,11 +447,10 @@ def test_query_fragmentarium_reference_id(database, fragment_repository):
         references=(ReferenceFactory.build(), ReferenceFactory.build())
     )
     database[COLLECTION].insert_one(SCHEMA.dump(fragment))
-    assert (
-        fragment_repository.query_fragmentarium(
-            FragmentariumSearchQuery(bibliography_id=fragment.references[0].id)
-        )
-    ) == ([fragment], 1)
+    query = FragmentariumSearchQuery(bibliography_id=fragment.references[0].id)
+    assert query_fragmentarium(fragment_repository, query) == expected_page(
+        query, [fragment], 1
+    )
 
 
 @pytest.mark.parametrize(
@@ -398,14 +461,13 @@ def test_query_fragmentarium_id_and_pages(pages, database, fragment_repository):
         references=(ReferenceFactory.build(pages=pages), ReferenceFactory.build())
     )
     database[COLLECTION].insert_one(SCHEMA.dump(fragment))
-    assert (
-        fragment_repository.query_fragmentarium(
-            FragmentariumSearchQuery(
-                bibliography_id=fragment.references[0].id,
-                pages="163",
-            )
-        )
-    ) == ([fragment], 1)
+    query = FragmentariumSearchQuery(
+        bibliography_id=fragment.references[0].id,
+        pages="163",
+    )
+    assert query_fragmentarium(fragment_repository, query) == expected_page(
+        query, [fragment], 1
+    )
 
 
 @pytest.mark.parametrize("pages", ["1631", "1163", "116311"])
@@ -417,14 +479,11 @@ def test_empty_result_query_reference_id_and_pages(
         references=(ReferenceFactory.build(pages=pages), ReferenceFactory.build())
     )
     database[COLLECTION].insert_one(SCHEMA.dump(fragment))
-    assert (
-        fragment_repository.query_fragmentarium(
-            FragmentariumSearchQuery(
-                bibliography_id=fragment.references[0].id,
-                pages="163",
-            )
-        )
-    ) == ([], 0)
+    query = FragmentariumSearchQuery(
+        bibliography_id=fragment.references[0].id,
+        pages="163",
+    )
+    assert query_fragmentarium(fragment_repository, query) == ([], 0)
 
 
 SEARCH_SIGNS_DATA = [
@@ -433,6 +492,13 @@ SEARCH_SIGNS_DATA = [
     ("UD", True),
     ("MI DIŠ\nU BA MA", True),
     ("IGI UD", False),
+    ("KI DU U BA", True),
+    ("DU ? BA MA", True),
+    ("ŠU", True),
+    ("|BI×IS|", True),
+    ("KI DU U MA", False),
+    ("[KU|TA] MA", True),
+    ("[KU|NU] MA", False),
 ]
 
 
@@ -445,11 +511,15 @@ def test_query_fragmentarium_transliteration(
     transliterated_fragment = TransliteratedFragmentFactory.build()
     fragment_repository.create_many([transliterated_fragment, FragmentFactory.build()])
 
-    query = TransliterationQuery(string=string, visitor=SignsVisitor(sign_repository))
-    result = fragment_repository.query_fragmentarium(
-        FragmentariumSearchQuery(transliteration=query)
+    query = FragmentariumSearchQuery(
+        transliteration=TransliterationQuery(
+            string=string, visitor=SignsVisitor(sign_repository)
+        )
+    )
+    result = query_fragmentarium(fragment_repository, query)
+    expected = (
+        expected_page(query, [transliterated_fragment], 1) if is_match else ([], 0)
     )
-    expected = ([transliterated_fragment], 1) if is_match else ([], 0)
 
     assert result == expected
 
@@ -475,14 +545,14 @@ def test_query_fragmentarium_sorting(fragment_repository, sign_repository, signs
         ]
     )
 
-    result = fragment_repository.query_fragmentarium(
-        FragmentariumSearchQuery(
-            transliteration=TransliterationQuery(
-                string="KU", visitor=SignsVisitor(sign_repository)
-            )
+    query = FragmentariumSearchQuery(
+        transliteration=TransliterationQuery(
+            string="KU", visitor=SignsVisitor(sign_repository)
         )
     )
-    expected = (
+    result = query_fragmentarium(fragment_repository, query)
+    expected = expected_page(
+        query,
         [
             transliterated_fragment_0,
             transliterated_fragment_1,
@@ -507,28 +577,75 @@ def test_query_fragmentarium_pagination(fragment_repository, sign_repository, si
 
     fragment_repository.create_many(transliterated_fragments)
 
-    result_first_page = fragment_repository.query_fragmentarium(
-        FragmentariumSearchQuery(
-            transliteration=TransliterationQuery(
-                string="KU", visitor=SignsVisitor(sign_repository)
-            )
+    query = FragmentariumSearchQuery(
+        transliteration=TransliterationQuery(
+            string="KU", visitor=SignsVisitor(sign_repository)
         )
     )
-    expected_first_page = (transliterated_fragments[:30], 40)
+    result_first_page = query_fragmentarium(fragment_repository, query)
+    expected_first_page = expected_page(query, transliterated_fragments[:30], 40)
     assert result_first_page == expected_first_page
 
-    result_second_page = fragment_repository.query_fragmentarium(
-        FragmentariumSearchQuery(
-            transliteration=TransliterationQuery(
-                string="KU", visitor=SignsVisitor(sign_repository)
-            ),
-            paginationIndex=1,
-        )
+    query = FragmentariumSearchQuery(
+        transliteration=TransliterationQuery(
+            string="KU", visitor=SignsVisitor(sign_repository)
+        ),
+        paginationIndex=1,
     )
-    expected_second_page = (transliterated_fragments[30:], 40)
+    result_second_page = query_fragmentarium(fragment_repository, query)
+    expected_second_page = expected_page(query, transliterated_fragments[30:], 40)
     assert result_second_page == expected_second_page
 
 
+def test_query_fragmentarium_after_cursor(fragment_repository, sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    fragment_0 = TransliteratedFragmentFactory.build(number=MuseumNumber.of("X.0"))
+    transliterated_fragments = [
+        fragment_0,
+        *[
+            attr.evolve(fragment_0, number=MuseumNumber.of(f"X.{i+1}"))
+            for i in range(39)
+        ],
+    ]
+    fragment_repository.create_many(transliterated_fragments)
+    transliteration = TransliterationQuery(
+        string="KU", visitor=SignsVisitor(sign_repository)
+    )
+
+    query = FragmentariumSearchQuery(
+        transliteration=transliteration,
+        after=SearchCursor.of(transliterated_fragments[29]),
+    )
+    result = query_fragmentarium(fragment_repository, query)
+
+    assert result == expected_page(query, transliterated_fragments[30:], 40)
+
+
+def test_query_fragmentarium_after_cursor_script(
+    fragment_repository, sign_repository, signs
+):
+    for sign in signs:
+        sign_repository.create(sign)
+    fragments = [
+        TransliteratedFragmentFactory.build(
+            number=MuseumNumber.of(number), script=script
+        )
+        for number, script in [("X.1", "A"), ("X.3", "A"), ("X.2", "B"), ("X.4", "B")]
+    ]
+    fragment_repository.create_many(fragments)
+
+    query = FragmentariumSearchQuery(
+        transliteration=TransliterationQuery(
+            string="KU", visitor=SignsVisitor(sign_repository)
+        ),
+        after=SearchCursor.of(fragments[1]),
+    )
+    result = query_fragmentarium(fragment_repository, query)
+
+    assert result == expected_page(query, fragments[2:], 4)
+
+
 def test_query_fragmentarium_transliteration_and_number(
     fragment_repository, sign_repository, signs
 ):
@@ -537,15 +654,14 @@ def test_query_fragmentarium_transliteration_and_number(
     transliterated_fragment = TransliteratedFragmentFactory.build()
     fragment_repository.create_many([transliterated_fragment, FragmentFactory.build()])
 
-    result = fragment_repository.query_fragmentarium(
-        FragmentariumSearchQuery(
-            number=transliterated_fragment.number,
-            transliteration=TransliterationQuery(
-                string="DIŠ UD", visitor=SignsVisitor(sign_repository)
-            ),
-        )
+    query = FragmentariumSearchQuery(
+        number=transliterated_fragment.number,
+        transliteration=TransliterationQuery(
+            string="DIŠ UD", visitor=SignsVisitor(sign_repository)
+        ),
     )
-    assert result == ([transliterated_fragment], 1)
+    result = query_fragmentarium(fragment_repository, query)
+    assert result == expected_page(query, [transliterated_fragment], 1)
 
 
 def test_query_fragmentarium_transliteration_and_number_and_references(
@@ -560,17 +676,16 @@ def test_query_fragmentarium_transliteration_and_number_and_references(
 
     fragment_repository.create_many([transliterated_fragment, FragmentFactory.build()])
 
-    result = fragment_repository.query_fragmentarium(
-        FragmentariumSearchQuery(
-            number=transliterated_fragment.number,
-            transliteration=TransliterationQuery(
-                string="DIŠ UD", visitor=SignsVisitor(sign_repository)
-            ),
-            bibliography_id=transliterated_fragment.references[0].id,
-            pages=pages,
-        )
+    query = FragmentariumSearchQuery(
+        number=transliterated_fragment.number,
+        transliteration=TransliterationQuery(
+            string="DIŠ UD", visitor=SignsVisitor(sign_repository)
+        ),
+        bibliography_id=transliterated_fragment.references[0].id,
+        pages=pages,
     )
-    assert result == ([transliterated_fragment], 1)
+    result = query_fragmentarium(fragment_repository, query)
+    assert result == expected_page(query, [transliterated_fragment], 1)
 
 
 def test_query_fragmentarium_transliteration_and_number_and_references_not_found(
@@ -584,16 +699,15 @@ def test_query_fragmentarium_transliteration_and_number_and_references_not_found
     )
     fragment_repository.create_many([transliterated_fragment, FragmentFactory.build()])
 
-    result = fragment_repository.query_fragmentarium(
-        FragmentariumSearchQuery(
-            number=transliterated_fragment.number,
-            transliteration=TransliterationQuery(
-                string="DIŠ UD", visitor=SignsVisitor(sign_repository)
-            ),
-            bibliography_id=transliterated_fragment.references[0].id,
-            pages=f"{pages}123",
-        )
+    query = FragmentariumSearchQuery(
+        number=transliterated_fragment.number,
+        transliteration=TransliterationQuery(
+            string="DIŠ UD", visitor=SignsVisitor(sign_repository)
+        ),
+        bibliography_id=transliterated_fragment.references[0].id,
+        pages=f"{pages}123",
     )
+    result = query_fragmentarium(fragment_repository, query)
     assert result == ([], 0)
 
 
@@ -620,7 +734,36 @@ def test_find_transliterated_line_to_vec(database, fragment_repository):
         [SCHEMA.dump(transliterated_fragment), SCHEMA.dump(FragmentFactory.build())]
     )
     assert fragment_repository.query_transliterated_line_to_vec() == [
-        LineToVecEntry(
+        PackedLineToVecEntry(
+            transliterated_fragment.number,
+            transliterated_fragment.script,
+            pack_line_to_vec(
+                LineToVecEncoding.to_bytes(line)
+                for line in transliterated_fragment.line_to_vec
+            ),
+        )
+    ]
+
+
+def dump_unpacked(fragment: Fragment) -> dict:
+    return {
+        **SCHEMA.dump(fragment),
+        "_id": str(fragment.number),
+        "lineToVec": [
+            [encoding.value for encoding in line] for line in fragment.line_to_vec
+        ],
+    }
+
+
+def test_find_transliterated_unpacked_line_to_vec(database, fragment_repository):
+    transliterated_fragment = TransliteratedFragmentFactory.build()
+    database[COLLECTION].insert_one(dump_unpacked(transliterated_fragment))
+
+    assert [
+        (entry.museum_number, entry.script, entry.line_to_vec)
+        for entry in fragment_repository.query_transliterated_line_to_vec()
+    ] == [
+        (
             transliterated_fragment.number,
             transliterated_fragment.script,
             transliterated_fragment.line_to_vec,
@@ -628,6 +771,22 @@ def test_find_transliterated_line_to_vec(database, fragment_repository):
     ]
 
 
+def test_pack_line_to_vec(database, fragment_repository):
+    unpacked_fragment = TransliteratedFragmentFactory.build()
+    packed_fragment = TransliteratedFragmentFactory.build(number=MuseumNumber.of("X.2"))
+    database[COLLECTION].insert_many(
+        [dump_unpacked(unpacked_fragment), SCHEMA.dump(packed_fragment)]
+    )
+
+    assert fragment_repository.pack_line_to_vec() == 1
+    assert (
+        database[COLLECTION].find_one(
+            {"_id": str(unpacked_fragment.number)}, {"lineToVec": True}
+        )["lineToVec"]
+        == SCHEMA.dump(unpacked_fragment)["lineToVec"]
+    )
+
+
 def test_update_references(fragment_repository):
     reference = ReferenceFactory.build()
     fragment = FragmentFactory.build()
@@ -1,6 +1,13 @@
+import pytest
+from marshmallow import ValidationError
+
 from ebl.fragmentarium.application.fragment_schema import FragmentSchema
 from ebl.transliteration.application.museum_number_schema import MuseumNumberSchema
 from ebl.fragmentarium.domain.joins import Join, Joins
+from ebl.fragmentarium.domain.line_to_vec_encoding import (
+    LineToVecEncoding,
+    pack_line_to_vec,
+)
 from ebl.transliteration.domain.museum_number import MuseumNumber
 from ebl.tests.factories.fragment import LemmatizedFragmentFactory
 
@@ -35,3 +42,32 @@ def test_number_deserialization():
         }
     )
     assert fragment.number == number
+
+
+def test_line_to_vec_serialization():
+    fragment = LemmatizedFragmentFactory.build()
+    data = FragmentSchema().dump(fragment)
+    assert data["lineToVec"] == pack_line_to_vec(
+        LineToVecEncoding.to_bytes(line) for line in fragment.line_to_vec
+    )
+
+
+def test_unpacked_line_to_vec_deserialization():
+    fragment = LemmatizedFragmentFactory.build()
+    data = {
+        **FragmentSchema().dump(fragment),
+        "lineToVec": [
+            [encoding.value for encoding in line] for line in fragment.line_to_vec
+        ],
+    }
+    assert FragmentSchema().load(data) == fragment
+
+
+@pytest.mark.parametrize("line_to_vec", [bytes([1, 0]), bytes([1, 0, 0, 0, 9]), [[9]]])
+def test_invalid_line_to_vec_deserialization(line_to_vec):
+    data = {
+        **FragmentSchema().dump(LemmatizedFragmentFactory.build()),
+        "lineToVec": line_to_vec,
+    }
+    with pytest.raises(ValidationError):
+        FragmentSchema().load(data)
@@ -4,8 +4,11 @@ import pytest
 from ebl.errors import DataError, NotFoundError
 from ebl.fragmentarium.application.fragment_schema import FragmentSchema
 from ebl.fragmentarium.application.fragment_updater import FragmentUpdater
+from ebl.fragmentarium.application.line_to_vec import LineToVecRanking
+from ebl.fragmentarium.application.line_to_vec_store import LineToVecStore
 from ebl.fragmentarium.domain.fragment import Fragment, Genre, NotLowestJoinError
 from ebl.fragmentarium.domain.joins import Join, Joins
+from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
 from ebl.transliteration.domain.museum_number import MuseumNumber
 from ebl.fragmentarium.domain.transliteration_update import TransliterationUpdate
 from ebl.lemmatization.domain.lemmatization import Lemmatization, LemmatizationToken
@@ -87,6 +90,85 @@ def test_update_update_transliteration_not_found(
         )
 
 
+def test_update_transliteration_updates_line_to_vec_store(
+    fragment_repository,
+    changelog,
+    bibliography,
+    photo_repository,
+    parallel_line_injector,
+    user,
+    when,
+):
+    fragment = FragmentFactory.build()
+    when(fragment_repository).query_by_museum_number(fragment.number).thenReturn(
+        fragment
+    )
+    when(fragment_repository).update_transliteration(...).thenReturn()
+    line_to_vec_store = LineToVecStore()
+    line_to_vec_store.get_matrix(lambda: [])
+    fragment_updater = FragmentUpdater(
+        fragment_repository,
+        changelog,
+        bibliography,
+        photo_repository,
+        parallel_line_injector,
+        line_to_vec_store,
+    )
+    transliteration = TransliterationUpdate(
+        parse_atf_lark(Atf("1. x x\n2. x")), "", "X X\nX"
+    )
+
+    updated_fragment, _ = fragment_updater.update_transliteration(
+        fragment.number, transliteration, user
+    )
+
+    matrix = line_to_vec_store.get_matrix(lambda: [])
+    assert [(row.museum_number, matrix.get_lines(row)) for row in matrix.rows] == [
+        (
+            fragment.number,
+            tuple(
+                LineToVecEncoding.to_bytes(line)
+                for line in updated_fragment.line_to_vec
+            ),
+        )
+    ]
+
+
+def test_update_transliteration_marks_line_to_vec_matches_stale(
+    fragment_repository,
+    changelog,
+    bibliography,
+    photo_repository,
+    parallel_line_injector,
+    line_to_vec_matches_repository,
+    user,
+    when,
+):
+    fragment = FragmentFactory.build()
+    when(fragment_repository).query_by_museum_number(fragment.number).thenReturn(
+        fragment
+    )
+    when(fragment_repository).update_transliteration(...).thenReturn()
+    line_to_vec_matches_repository.create_or_update(
+        fragment.number, LineToVecRanking([], [])
+    )
+    fragment_updater = FragmentUpdater(
+        fragment_repository,
+        changelog,
+        bibliography,
+        photo_repository,
+        parallel_line_injector,
+        line_to_vec_matches_repository=line_to_vec_matches_repository,
+    )
+    transliteration = TransliterationUpdate(
+        parse_atf_lark(Atf("1. x x\n2. x")), "", "X X\nX"
+    )
+
+    fragment_updater.update_transliteration(fragment.number, transliteration, user)
+
+    assert line_to_vec_matches_repository.query_stale_numbers() == [fragment.number]
+
+
 def test_update_update_transliteration_not_lowest_join(
     fragment_updater, user, fragment_repository, when
 ):
@@ -188,13 +270,13 @@ def test_update_references(
 
     fragment = FragmentFactory.build()
     number = fragment.number
-    reference = ReferenceFactory.build()
+    reference = ReferenceFactory.build(with_document=True)
+    bibliography.create(reference.document, user)
     references = (reference,)
     updated_fragment = fragment.set_references(references)
     injected_fragment = updated_fragment.set_text(
         parallel_line_injector.inject_transliteration(updated_fragment.text)
     )
-    when(bibliography).find(reference.id).thenReturn(reference)
     when(fragment_repository).query_by_museum_number(number).thenReturn(
         fragment
     ).thenReturn(updated_fragment)
@@ -216,7 +298,6 @@ def test_update_references_invalid(
     fragment = FragmentFactory.build()
     number = fragment.number
     reference = ReferenceFactory.build()
-    when(bibliography).find(reference.id).thenRaise(NotFoundError)
     (when(fragment_repository).query_by_museum_number(number).thenReturn(fragment))
     references = (reference,)
 
@@ -3,13 +3,13 @@ from ebl.tests.factories.fragment import FragmentFactory, TransliteratedFragment
 
 
 def test_find_latest(fragmentarium, fragment_repository, when):
-    fragment = FragmentFactory.build()
+    fragment_info = FragmentInfo.of(FragmentFactory.build())
     (
         when(fragment_repository)
         .query_by_transliterated_sorted_by_date()
-        .thenReturn([fragment])
+        .thenReturn([fragment_info])
     )
-    assert fragmentarium.find_latest() == [FragmentInfo.of(fragment)]
+    assert fragmentarium.find_latest() == [fragment_info]
 
 
 def test_needs_revision(fragmentarium, fragment_repository, when):
@@ -11,6 +11,7 @@ from ebl.fragmentarium.application.fragment_info_schema import (
 from ebl.fragmentarium.domain.fragment import Fragment
 from ebl.fragmentarium.domain.fragment_info import FragmentInfo
 from ebl.fragmentarium.domain.fragment_infos_pagination import FragmentInfosPagination
+from ebl.fragmentarium.domain.search_cursor import SearchCursor
 from ebl.tests.factories.bibliography import ReferenceFactory, BibliographyEntryFactory
 from ebl.tests.factories.fragment import (
     FragmentFactory,
@@ -234,6 +235,71 @@ def test_search_fragmentarium_combined_query(
     assert "Cache-Control" not in result.headers
 
 
+def test_search_fragmentarium_pagination_token(
+    client, fragmentarium, sign_repository, signs
+):
+    first_fragment = TransliteratedFragmentFactory.build(script="A")
+    second_fragment = TransliteratedFragmentFactory.build(
+        number=MuseumNumber.of("X.123"), script="B"
+    )
+    for fragment in [first_fragment, second_fragment]:
+        fragmentarium.create(fragment)
+    for sign in signs:
+        sign_repository.create(sign)
+    params = {
+        "number": "",
+        "transliteration": "ma-tu₂",
+        "pages": "",
+        "bibliographyId": "",
+    }
+
+    first_page = client.simulate_get(
+        "/fragments", params={**params, "paginationToken": ""}
+    )
+    second_page = client.simulate_get(
+        "/fragments",
+        params={
+            **params,
+            "paginationToken": expected_fragment_infos_pagination_dto(
+                FragmentInfosPagination([], 2, SearchCursor.of(first_fragment))
+            )["paginationToken"],
+        },
+    )
+
+    assert first_page.status == falcon.HTTP_OK
+    assert [info["number"] for info in first_page.json["fragmentInfos"]] == [
+        str(first_fragment.number),
+        str(second_fragment.number),
+    ]
+    assert first_page.json["paginationToken"] is None
+    assert second_page.status == falcon.HTTP_OK
+    assert second_page.json == expected_fragment_infos_pagination_dto(
+        FragmentInfosPagination(
+            [
+                FragmentInfo.of(
+                    second_fragment, parse_atf_lark("6'. [...] x# mu ta-ma;-tu₂")
+                )
+            ],
+            2,
+        )
+    )
+
+
+def test_search_fragmentarium_invalid_pagination_token(client):
+    result = client.simulate_get(
+        "/fragments",
+        params={
+            "number": "",
+            "transliteration": "",
+            "bibliographyId": "",
+            "pages": "",
+            "paginationToken": "invalid",
+        },
+    )
+
+    assert result.status == falcon.HTTP_UNPROCESSABLE_ENTITY
+
+
 def test_search_signs_invalid(client, fragmentarium, sign_repository, signs):
     result = client.simulate_get(
         "/fragments",
@@ -0,0 +1,25 @@
+import pytest
+
+from ebl.fragmentarium.domain.line_to_vec_encoding import (
+    pack_line_to_vec,
+    unpack_line_to_vec,
+)
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [
+        (),
+        (bytes([0, 1, 5]),),
+        (bytes([0, 1, 2]), b"", bytes([1, 1, 3, 5])),
+        (bytes([1]) * 300,),
+    ],
+)
+def test_pack_and_unpack(lines):
+    assert unpack_line_to_vec(pack_line_to_vec(lines)) == lines
+
+
+def test_pack_is_length_prefixed():
+    assert pack_line_to_vec([bytes([0, 1]), bytes([5])]) == bytes(
+        [2, 0, 0, 0, 0, 1, 1, 0, 0, 0, 5]
+    )
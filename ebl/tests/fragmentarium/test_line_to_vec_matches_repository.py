@@ -0,0 +1,60 @@
+import pytest
+
+from ebl.errors import NotFoundError
+from ebl.fragmentarium.application.line_to_vec import LineToVecRanking, LineToVecScore
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+NUMBER = MuseumNumber.of("X.1")
+RANKING = LineToVecRanking(
+    [LineToVecScore(MuseumNumber.of("X.2"), "NA", 3)],
+    [LineToVecScore(MuseumNumber.of("X.2"), "NA", 5)],
+)
+
+
+def test_create_and_query(line_to_vec_matches_repository):
+    line_to_vec_matches_repository.create_or_update(NUMBER, RANKING)
+
+    assert line_to_vec_matches_repository.query_by_museum_number(NUMBER) == RANKING
+    assert list(line_to_vec_matches_repository.query_rankings()) == [(NUMBER, RANKING)]
+    assert line_to_vec_matches_repository.query_stale_numbers() == []
+
+
+def test_query_not_found(line_to_vec_matches_repository):
+    with pytest.raises(NotFoundError):
+        line_to_vec_matches_repository.query_by_museum_number(NUMBER)
+
+
+def test_mark_stale(line_to_vec_matches_repository):
+    line_to_vec_matches_repository.create_or_update(NUMBER, RANKING)
+    line_to_vec_matches_repository.mark_stale(NUMBER)
+
+    with pytest.raises(NotFoundError):
+        line_to_vec_matches_repository.query_by_museum_number(NUMBER)
+    assert list(line_to_vec_matches_repository.query_rankings()) == []
+    assert line_to_vec_matches_repository.query_stale_numbers() == [NUMBER]
+
+
+def test_create_or_update_keeps_newer_stale_mark(line_to_vec_matches_repository):
+    line_to_vec_matches_repository.create_or_update(NUMBER, RANKING)
+    revision = line_to_vec_matches_repository.query_revisions()[NUMBER]
+    line_to_vec_matches_repository.mark_stale(NUMBER)
+
+    assert (
+        line_to_vec_matches_repository.create_or_update(NUMBER, RANKING, revision)
+        is False
+    )
+    assert line_to_vec_matches_repository.query_stale_numbers() == [NUMBER]
+    with pytest.raises(NotFoundError):
+        line_to_vec_matches_repository.query_by_museum_number(NUMBER)
+
+
+def test_create_or_update_after_stale_mark(line_to_vec_matches_repository):
+    line_to_vec_matches_repository.mark_stale(NUMBER)
+    revision = line_to_vec_matches_repository.query_revisions()[NUMBER]
+
+    assert (
+        line_to_vec_matches_repository.create_or_update(NUMBER, RANKING, revision)
+        is True
+    )
+    assert line_to_vec_matches_repository.query_by_museum_number(NUMBER) == RANKING
+    assert line_to_vec_matches_repository.query_stale_numbers() == []
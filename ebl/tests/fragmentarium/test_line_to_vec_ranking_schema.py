@@ -27,3 +27,17 @@ def test_line_to_vec_ranking_schema():
             {"museumNumber": "X.1", "score": 7, "script": "N/A"},
         ],
     }
+
+
+def test_load_line_to_vec_ranking_schema():
+    line_to_vec_ranking = LineToVecRanking(
+        score=[LineToVecScore(MuseumNumber.of("X.0"), "N/A", 10)],
+        score_weighted=[LineToVecScore(MuseumNumber.of("X.0"), "N/A", 15)],
+    )
+
+    assert (
+        LineToVecRankingSchema().load(
+            LineToVecRankingSchema().dump(line_to_vec_ranking)
+        )
+        == line_to_vec_ranking
+    )
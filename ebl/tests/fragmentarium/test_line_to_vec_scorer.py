@@ -0,0 +1,161 @@
+import random
+
+import numpy as np
+import pytest
+
+from ebl.fragmentarium.application.matches.line_to_vec_score import (
+    score,
+    score_weighted,
+)
+from ebl.fragmentarium.application.matches.line_to_vec_scorer import (
+    LineToVecIndex,
+    LineToVecScorer,
+    score_lines,
+)
+from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
+
+
+def to_bytes(lines):
+    return [bytes(line) for line in lines]
+
+
+@pytest.mark.parametrize(
+    "seq1, seq2, expected",
+    [
+        [((1, 2, 1),), ((1, 2, 1),), (3, 5)],
+        [((1, 2, 1),), (tuple(),), (0, 0)],
+        [((1, 2, 1),), tuple(), (0, 0)],
+        [((1, 2, 1),), ((2, 1, 2),), (2, 4)],
+        [((1, 2, 1),), ((2, 2, 1),), (1, 1)],
+        [((1, 2, 1),), ((1, 2, 2),), (1, 1)],
+        [((1, 2, 1),), ((2, 2, 2),), (0, 0)],
+        [((1, 2, 1),), ((2, 2, 2), (1, 2, 1)), (3, 5)],
+        [((2, 2, 2), (1, 2, 1)), ((1, 2, 1),), (3, 5)],
+        [((1, 1, 2, 1, 1),), ((1, 2, 1),), (3, 5)],
+        [((0, 1, 2, 1, 1),), ((1, 2, 5),), (1, 1)],
+        [((0, 1, 2, 1), (1, 2, 1, 5)), ((2, 3, 2), (1, 1, 2, 1)), (3, 5)],
+        [((4, 1, 1, 1),), ((1, 1, 1, 4),), (3, 10)],
+    ],
+)
+def test_score(seq1, seq2, expected):
+    assert LineToVecScorer(to_bytes(seq1)).score(to_bytes(seq2)) == expected
+
+
+def test_score_lines_prefers_weight_over_length():
+    assert score_lines(bytes([4, 1, 1, 1]), bytes([1, 1, 1, 4])) == (3, 10)
+
+
+def test_index_stores_distinct_lines():
+    index = LineToVecIndex.of_rows(
+        [[bytes([1, 2]), bytes([1])], [], [bytes([1, 2, 3]), bytes([1, 2])]]
+    )
+
+    assert index.lines.tolist() == [[1, 2, 3], [1, 2, 255], [1, 255, 255]]
+    assert index.right_aligned.tolist() == [[1, 2, 3], [255, 1, 2], [255, 255, 1]]
+    assert index.lengths.tolist() == [3, 2, 1]
+    assert index.weights.tolist() == [[0, 1, 4, 10], [0, 1, 4, 4], [0, 1, 1, 1]]
+    assert index.line_ids.tolist() == [1, 2, 0, 1]
+    assert index.row_lengths.tolist() == [2, 0, 2]
+
+
+def test_score_rows():
+    rows = [
+        [bytes([1, 2, 1])],
+        [],
+        [bytes([2, 2, 2]), bytes([2, 1, 2])],
+        [bytes()],
+        [bytes([4, 1, 1, 1])],
+    ]
+    scores, scores_weighted = LineToVecScorer([bytes([1, 1, 1, 4])]).score_rows(
+        LineToVecIndex.of_rows(rows)
+    )
+
+    assert scores.tolist() == [1, 0, 0, 0, 3]
+    assert scores_weighted.tolist() == [1, 0, 0, 0, 10]
+
+
+def test_same_scores_as_line_to_vec_score():
+    generator = random.Random(0)
+
+    def create_line_to_vec():
+        return tuple(
+            tuple(generator.choice([0, 1, 1, 1, 2, 3, 4, 5]) for _ in range(length))
+            for length in (
+                generator.randint(0, 8) for _ in range(generator.randint(1, 4))
+            )
+        )
+
+    for _ in range(500):
+        seq1 = create_line_to_vec()
+        seq2 = create_line_to_vec()
+        encoded1 = tuple(map(LineToVecEncoding.from_list, seq1))
+        encoded2 = tuple(map(LineToVecEncoding.from_list, seq2))
+
+        assert LineToVecScorer(to_bytes(seq1)).score(to_bytes(seq2)) == (
+            score(encoded1, encoded2),
+            score_weighted(encoded1, encoded2),
+        )
+
+
+def test_score_rows_same_as_score():
+    generator = random.Random(1)
+
+    def create_lines():
+        return [
+            bytes(
+                generator.choices([0, 1, 1, 1, 2, 3, 4, 5], k=generator.randint(0, 8))
+            )
+            for _ in range(generator.randint(0, 4))
+        ]
+
+    candidate = create_lines() + [bytes([1, 2])]
+    rows = [create_lines() for _ in range(300)]
+    scorer = LineToVecScorer(candidate)
+    scores, scores_weighted = scorer.score_rows(LineToVecIndex.of_rows(rows))
+
+    assert list(zip(scores.tolist(), scores_weighted.tolist())) == [
+        scorer.score(lines) for lines in rows
+    ]
+
+
+def test_index_stores_row_features():
+    index = LineToVecIndex.of_rows(
+        [[bytes([1, 2]), bytes([1, 1, 1])], [], [bytes([4, 1, 4])]]
+    )
+
+    assert index.max_lengths.tolist() == [3, 0, 3]
+    assert index.max_counts.tolist() == [
+        [0, 3, 1, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0],
+        [0, 1, 0, 0, 2, 0],
+    ]
+
+
+def test_bounds_and_selected_rows():
+    generator = random.Random(2)
+
+    def create_lines():
+        return [
+            bytes(
+                generator.choices([0, 1, 1, 1, 2, 3, 4, 5], k=generator.randint(0, 8))
+            )
+            for _ in range(generator.randint(0, 4))
+        ]
+
+    rows = [create_lines() for _ in range(300)]
+    index = LineToVecIndex.of_rows(rows)
+    selected = np.array([generator.random() < 0.3 for _ in rows])
+
+    for _ in range(20):
+        scorer = LineToVecScorer(create_lines())
+        scores, scores_weighted = scorer.score_rows(index)
+        bounds, bounds_weighted = scorer.bound_rows(index)
+        selected_scores, selected_scores_weighted = scorer.score_rows(index, selected)
+
+        assert (bounds >= scores).all()
+        assert (bounds_weighted >= scores_weighted).all()
+        assert selected_scores.tolist() == np.where(selected, scores, 0).tolist()
+        assert (
+            selected_scores_weighted.tolist()
+            == np.where(selected, scores_weighted, 0).tolist()
+        )
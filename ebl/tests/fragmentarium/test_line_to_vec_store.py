@@ -0,0 +1,130 @@
+from ebl.fragmentarium.application.line_to_vec import LineToVecEntry
+from ebl.fragmentarium.application.line_to_vec_store import LineToVecStore
+from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
+from ebl.tests.factories.fragment import FragmentFactory, TransliteratedFragmentFactory
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+FIRST = LineToVecEntry(
+    MuseumNumber.of("X.1"),
+    "NA",
+    (LineToVecEncoding.from_list([0, 1, 2]), LineToVecEncoding.from_list([1, 5])),
+)
+SECOND = LineToVecEntry(
+    MuseumNumber.of("X.2"), "NB", (LineToVecEncoding.from_list([1, 1, 3]),)
+)
+
+
+def get_lines(store: LineToVecStore) -> dict:
+    matrix = store.get_matrix(lambda: [])
+    return {str(row.museum_number): matrix.get_lines(row) for row in matrix.rows}
+
+
+def test_get_matrix():
+    store = LineToVecStore()
+    matrix = store.get_matrix(lambda: [FIRST, SECOND])
+
+    assert [(row.museum_number, row.script) for row in matrix.rows] == [
+        (FIRST.museum_number, FIRST.script),
+        (SECOND.museum_number, SECOND.script),
+    ]
+    assert [matrix.get_lines(row) for row in matrix.rows] == [
+        (bytes([0, 1, 2]), bytes([1, 5])),
+        (bytes([1, 1, 3]),),
+    ]
+
+
+def test_matrix_index():
+    store = LineToVecStore()
+    matrix = store.get_matrix(lambda: [FIRST, SECOND])
+
+    assert matrix.index.lines[matrix.index.line_ids].tolist() == [
+        [0, 1, 2],
+        [1, 5, 255],
+        [1, 1, 3],
+    ]
+    assert matrix.index.row_lengths.tolist() == [2, 1]
+
+
+def test_get_matrix_is_reused_until_changed():
+    store = LineToVecStore()
+    matrix = store.get_matrix(lambda: [FIRST, SECOND])
+
+    assert store.get_matrix(lambda: []) is matrix
+    store.update(TransliteratedFragmentFactory.build(number=FIRST.museum_number))
+    assert store.get_matrix(lambda: []) is not matrix
+
+
+def test_get_matrix_loads_once():
+    store = LineToVecStore()
+    store.get_matrix(lambda: [FIRST])
+
+    assert len(store.get_matrix(lambda: [FIRST, SECOND]).rows) == 1
+
+
+def test_get_matrix_reloads_when_expired():
+    clock = FakeClock()
+    store = LineToVecStore(timeout=10, clock=clock)
+    store.get_matrix(lambda: [FIRST])
+    clock.time = 10
+
+    assert len(store.get_matrix(lambda: [FIRST, SECOND]).rows) == 2
+
+
+def test_update():
+    store = LineToVecStore()
+    store.get_matrix(lambda: [FIRST, SECOND])
+    fragment = TransliteratedFragmentFactory.build(number=FIRST.museum_number)
+    store.update(fragment)
+
+    assert get_lines(store) == {
+        "X.1": tuple(LineToVecEncoding.to_bytes(line) for line in fragment.line_to_vec),
+        "X.2": (bytes([1, 1, 3]),),
+    }
+
+
+def test_update_removes_untransliterated():
+    store = LineToVecStore()
+    store.get_matrix(lambda: [FIRST, SECOND])
+    store.update(FragmentFactory.build(number=FIRST.museum_number))
+
+    assert get_lines(store) == {"X.2": (bytes([1, 1, 3]),)}
+
+
+def test_update_compacts():
+    store = LineToVecStore()
+    store.get_matrix(lambda: [FIRST, SECOND])
+    fragment = TransliteratedFragmentFactory.build(number=SECOND.museum_number)
+    matrix = store.get_matrix(lambda: [])
+    for _ in range(10):
+        store.update(fragment)
+
+    assert len(store.get_matrix(lambda: []).encodings) < 3 * len(matrix.encodings)
+    assert get_lines(store)["X.1"] == (bytes([0, 1, 2]), bytes([1, 5]))
+    assert [matrix.get_lines(row) for row in matrix.rows] == [
+        (bytes([0, 1, 2]), bytes([1, 5])),
+        (bytes([1, 1, 3]),),
+    ]
+
+
+def test_update_before_load():
+    store = LineToVecStore()
+    store.update(TransliteratedFragmentFactory.build())
+
+    assert len(store) == 0
+
+
+def test_clear():
+    store = LineToVecStore()
+    store.get_matrix(lambda: [FIRST])
+    store.clear()
+
+    assert len(store.get_matrix(lambda: [FIRST, SECOND]).rows) == 2
@@ -0,0 +1,115 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from ebl.fragmentarium.application.line_to_vec import LineToVecEntry, LineToVecRanking
+from ebl.fragmentarium.application.line_to_vec_store import LineToVecStore
+from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
+from ebl.fragmentarium.match_fragmentarium import (
+    initialize_worker,
+    rank_in_parallel,
+    rank_rows,
+    update_all,
+    update_stale,
+)
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+
+def create_entry(generator: random.Random, index: int) -> LineToVecEntry:
+    encodings = [encoding.value for encoding in LineToVecEncoding]
+    return LineToVecEntry(
+        MuseumNumber.of(f"X.{index}"),
+        "NA",
+        tuple(
+            LineToVecEncoding.from_list(
+                generator.choices(encodings, k=generator.randint(1, 6))
+            )
+            for _ in range(generator.randint(1, 3))
+        ),
+    )
+
+
+def create_matrix(entries):
+    return LineToVecStore().get_matrix(lambda: entries)
+
+
+def query_all(repository, matrix):
+    return {
+        number: repository.query_by_museum_number(number)
+        for number in (row.museum_number for row in matrix.rows)
+    }
+
+
+def test_update_all(line_to_vec_matches_repository):
+    generator = random.Random(0)
+    matrix = create_matrix([create_entry(generator, index) for index in range(30)])
+
+    with ThreadPoolExecutor(
+        max_workers=2, initializer=initialize_worker, initargs=(matrix,)
+    ) as executor:
+        ranked = update_all(
+            line_to_vec_matches_repository,
+            matrix,
+            partial(rank_in_parallel, executor, 7),
+        )
+
+    assert ranked == 30
+    assert query_all(line_to_vec_matches_repository, matrix) == dict(
+        rank_rows(matrix, range(30))
+    )
+
+
+def test_update_stale(line_to_vec_matches_repository):
+    generator = random.Random(1)
+    entries = [create_entry(generator, index) for index in range(60)]
+    matrix = create_matrix(entries)
+    update_all(
+        line_to_vec_matches_repository,
+        matrix,
+        partial(rank_rows, matrix),
+    )
+
+    updated_entries = [
+        create_entry(generator, index) if index % 10 == 0 else entry
+        for index, entry in enumerate(entries)
+        if index != 5
+    ]
+    for index in [0, 5, *range(10, 60, 10)]:
+        line_to_vec_matches_repository.mark_stale(MuseumNumber.of(f"X.{index}"))
+    updated_matrix = create_matrix(updated_entries)
+    ranked = update_stale(
+        line_to_vec_matches_repository,
+        updated_matrix,
+        partial(rank_rows, updated_matrix),
+    )
+
+    assert ranked > 7
+
+    assert line_to_vec_matches_repository.query_stale_numbers() == []
+    assert query_all(line_to_vec_matches_repository, updated_matrix) == dict(
+        rank_rows(updated_matrix, range(len(updated_entries)))
+    )
+    assert line_to_vec_matches_repository.query_by_museum_number(
+        MuseumNumber.of("X.5")
+    ) == LineToVecRanking([], [])
+
+
+def test_update_all_keeps_fragments_marked_stale_while_ranking(
+    line_to_vec_matches_repository,
+):
+    generator = random.Random(2)
+    matrix = create_matrix([create_entry(generator, index) for index in range(10)])
+    number = MuseumNumber.of("X.3")
+
+    def rank_and_mark_stale(indices):
+        line_to_vec_matches_repository.mark_stale(number)
+        return rank_rows(matrix, indices)
+
+    update_all(
+        line_to_vec_matches_repository,
+        matrix,
+        rank_and_mark_stale,
+        line_to_vec_matches_repository.query_revisions(),
+    )
+
+    assert line_to_vec_matches_repository.query_stale_numbers() == [number]
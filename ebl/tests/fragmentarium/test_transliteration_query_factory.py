@@ -1,6 +1,9 @@
 import pytest
 
 from ebl.errors import DataError
+from ebl.transliteration.application.transliteration_query_cache import (
+    TransliterationQueryCache,
+)
 from ebl.transliteration.application.transliteration_query_factory import (
     TransliterationQueryFactory,
 )
@@ -28,3 +31,20 @@ def test_create_query_invalid(sign_repository):
     factory = TransliterationQueryFactory(sign_repository)
     with pytest.raises(DataError):
         factory.create("$ (invalid query)")
+
+
+def test_create_query_is_cached(sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    factory = TransliterationQueryFactory(sign_repository)
+
+    assert factory.create("šu\ngid₂") is factory.create(" šu\ngid₂ ")
+
+
+def test_create_query_uses_shared_cache(sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    cache = TransliterationQueryCache()
+    query = TransliterationQueryFactory(sign_repository, cache).create("šu")
+
+    assert TransliterationQueryFactory(sign_repository, cache).create("šu") is query
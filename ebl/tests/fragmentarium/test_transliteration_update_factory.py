@@ -4,8 +4,11 @@ from ebl.fragmentarium.application.transliteration_update_factory import (
     TransliterationUpdateFactory,
 )
 from ebl.fragmentarium.domain.transliteration_update import TransliterationUpdate
+from ebl.signs.infrastructure.mongo_sign_repository import COLLECTION
+from ebl.transliteration.application.line_signs_cache import LineSignsCache
 from ebl.transliteration.domain.atf import Atf
 from ebl.transliteration.domain.lark_parser import parse_atf_lark
+from ebl.transliteration.domain.sign import Sign, SignName, Value
 from ebl.transliteration.domain.transliteration_error import TransliterationError
 
 
@@ -44,3 +47,34 @@ def test_create_invalid_atf(sign_repository):
             "lineNumber": 1,
         }
     ]
+
+
+def test_create_reuses_line_signs(sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+
+    cache = LineSignsCache()
+    factory = TransliterationUpdateFactory(sign_repository, cache)
+    factory.create(Atf("1. šu gid₂\n2. šu"))
+
+    assert len(cache) == 2
+    assert factory.create(Atf("1. šu gid₂\n2. gid₂")).signs == "ŠU BU\nBU"
+    assert len(cache) == 3
+
+
+def test_create_expires_line_signs(database, sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    now = [0.0]
+    factory = TransliterationUpdateFactory(
+        sign_repository, LineSignsCache(timeout=10, clock=lambda: now[0])
+    )
+    atf = Atf("1. šu gid₂")
+    factory.create(atf)
+
+    database[COLLECTION].delete_one({"_id": "BU"})
+    sign_repository.create(Sign(SignName("GID"), values=(Value("gid", 2),)))
+
+    assert factory.create(atf).signs == "ŠU BU"
+    now[0] = 11.0
+    assert factory.create(atf).signs == "ŠU GID"
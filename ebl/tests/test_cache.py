@@ -1,7 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import falcon
+import pytest
 from falcon import testing
 
-from ebl.cache import cache_control
+from ebl.cache import (
+    CountCache,
+    LruCache,
+    cache_control,
+    estimate_count,
+    get_exact_count,
+)
 
 
 DIRECTIVES = ["public", "max-age=600"]
@@ -38,3 +47,124 @@ def test_cache_control_when():
     result = do_get(TestResourceWhen())
 
     assert "Cache-Control" not in result.headers
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+def test_count_cache_get():
+    cache = CountCache()
+    counts = iter([1, 2])
+
+    assert cache.get("key", lambda: next(counts)) == 1
+    assert cache.get("key", lambda: next(counts)) == 1
+
+
+def test_count_cache_set():
+    cache = CountCache()
+    cache.set("key", 3)
+
+    assert cache.get("key", lambda: 4) == 3
+
+
+def test_count_cache_timeout():
+    clock = FakeClock()
+    cache = CountCache(timeout=10, clock=clock)
+    cache.set("key", 1)
+    clock.time = 10
+
+    assert cache.get("key", lambda: 2) == 2
+
+
+def test_count_cache_max_size():
+    cache = CountCache(max_size=1)
+    cache.set("key", 1)
+    cache.set("another key", 2)
+
+    assert cache.get("key", lambda: 3) == 3
+
+
+def test_count_cache_estimate():
+    executor = ThreadPoolExecutor(1)
+    cache = CountCache(executor=executor)
+
+    assert cache.estimate("key", lambda: 40, 31) == 31
+    executor.shutdown(wait=True)
+    assert cache.estimate("key", lambda: 50, 31) == 40
+
+
+def test_count_cache_estimate_failed_count():
+    executor = ThreadPoolExecutor(1)
+    cache = CountCache(executor=executor)
+
+    def fail() -> int:
+        raise ValueError("count failed")
+
+    cache.estimate("key", fail, 31)
+    executor.shutdown(wait=True)
+
+    assert len(cache) == 0
+
+
+def test_lru_cache_get_many():
+    cache = LruCache(2)
+    cache.set_many({"a": 1, "b": 2})
+
+    assert cache.get_many(["a", "c"]) == {"a": 1}
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LruCache(2)
+    cache.set_many({"a": 1, "b": 2})
+    cache.get_many(["a"])
+    cache.set("c", 3)
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+def test_lru_cache_invalidate():
+    cache = LruCache(2)
+    cache.set("a", 1)
+    cache.invalidate("a")
+
+    assert cache.get("a", lambda: 2) == 2
+
+
+def test_lru_cache_without_timeout():
+    clock = FakeClock()
+    cache = LruCache(2, clock=clock)
+    cache.set("a", 1)
+    clock.time = 10**9
+
+    assert cache.get("a", lambda: 2) == 1
+
+
+def test_count_cache_get_total():
+    executor = ThreadPoolExecutor(1)
+    cache = CountCache(executor=executor)
+
+    assert cache.get_total("key", lambda: 40, None, 31) == (31, True)
+    executor.shutdown(wait=True)
+    assert cache.get_total("key", lambda: 50, None, 31) == (40, False)
+    assert cache.get_total("key", lambda: 50, 12, 31) == (12, False)
+    assert cache.get_total("key", lambda: 50, None, 31) == (12, False)
+
+
+@pytest.mark.parametrize(
+    "page_index,page_length,expected",
+    [(0, 0, 0), (0, 5, 5), (2, 5, 65), (0, 30, None), (1, 0, None)],
+)
+def test_get_exact_count(page_index, page_length, expected):
+    assert get_exact_count(30, page_index, page_length) == expected
+
+
+@pytest.mark.parametrize(
+    "page_index,page_length,expected", [(0, 30, 31), (1, 0, 30), (2, 30, 91)]
+)
+def test_estimate_count(page_index, page_length, expected):
+    assert estimate_count(30, page_index, page_length) == expected
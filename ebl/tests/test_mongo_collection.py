@@ -115,3 +115,14 @@ def test_count(collection):
     collection.insert_one({"data": "another payload"})
 
     assert collection.count_documents({"data": "payload"}) == 2
+
+
+def test_delete_many(collection):
+    collection.insert_one({"data": "payload"})
+    collection.insert_one({"data": "payload"})
+    another_document = {"data": "another payload"}
+    collection.insert_one(another_document)
+
+    collection.delete_many({"data": "payload"})
+
+    assert list(collection.find_many({})) == [another_document]
@@ -82,3 +82,18 @@ def test_invalid_atf(atf, line_numbers) -> None:
 def test_duplicate_labels(atf, line_numbers) -> None:
     with pytest.raises(DataError, match="Duplicate labels."):
         parse_atf_lark(atf)
+
+
+def test_unchanged_lines_are_reused() -> None:
+    first = parse_atf_lark("1. kur\n2. ra")
+    second = parse_atf_lark("1. kur\n2. ku")
+
+    assert second.lines[0] is first.lines[0]
+    assert second.lines[1] is not first.lines[1]
+
+
+def test_invalid_lines_are_not_reused() -> None:
+    with pytest.raises(TransliterationError):
+        parse_atf_lark("1. [kur")
+    with pytest.raises(TransliterationError):
+        parse_atf_lark("1. [kur")
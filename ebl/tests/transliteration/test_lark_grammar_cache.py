@@ -0,0 +1,110 @@
+import pickle
+
+from lark.lark import Lark
+
+from ebl.transliteration.domain.lark_grammar_cache import (
+    CACHE_DIRECTORY_VARIABLE,
+    get_cache_directory,
+    get_cache_path,
+    hash_grammar,
+    is_private,
+    load_cached_grammar,
+)
+
+GRAMMAR = """
+start: WORD ("," WORD)*
+%import .words (WORD)
+"""
+WORDS = "WORD: /[a-z]+/\n"
+
+
+def write_grammar(tmp_path):
+    (tmp_path / "words.lark").write_text(WORDS)
+    path = tmp_path / "grammar.lark"
+    path.write_text(GRAMMAR)
+    return path
+
+
+def test_load_cached_grammar(tmp_path) -> None:
+    path = write_grammar(tmp_path)
+    cache_directory = tmp_path / "cache"
+
+    grammar = load_cached_grammar(path, cache_directory)
+    cached = load_cached_grammar(path, cache_directory)
+
+    assert get_cache_path(path, cache_directory).exists()
+    assert is_private(cache_directory)
+    assert Lark(cached).parse("a,b") == Lark(grammar).parse("a,b")
+
+
+def test_hash_grammar_includes_imports(tmp_path) -> None:
+    path = write_grammar(tmp_path)
+    original = hash_grammar(path)
+
+    (tmp_path / "words.lark").write_text("WORD: /[a-z0-9]+/\n")
+
+    assert hash_grammar(path) != original
+
+
+def test_invalid_cache_is_replaced(tmp_path) -> None:
+    path = write_grammar(tmp_path)
+    cache_directory = tmp_path / "cache"
+    cache_directory.mkdir(mode=0o700)
+    cache_path = get_cache_path(path, cache_directory)
+    cache_path.write_bytes(b"invalid")
+
+    grammar = load_cached_grammar(path, cache_directory)
+
+    assert Lark(grammar).parse("a").children[0] == "a"
+    assert cache_path.read_bytes() != b"invalid"
+
+
+def test_cache_of_other_type_is_replaced(tmp_path) -> None:
+    path = write_grammar(tmp_path)
+    cache_directory = tmp_path / "cache"
+    cache_directory.mkdir(mode=0o700)
+    cache_path = get_cache_path(path, cache_directory)
+    cache_path.write_bytes(pickle.dumps("not a grammar"))
+
+    grammar = load_cached_grammar(path, cache_directory)
+
+    assert Lark(grammar).parse("a").children[0] == "a"
+    assert pickle.loads(cache_path.read_bytes()) != "not a grammar"
+
+
+def test_shared_directory_is_not_used(tmp_path) -> None:
+    path = write_grammar(tmp_path)
+    cache_directory = tmp_path / "cache"
+    cache_directory.mkdir()
+    cache_directory.chmod(0o777)
+    cache_path = get_cache_path(path, cache_directory)
+    cache_path.write_bytes(b"invalid")
+
+    grammar = load_cached_grammar(path, cache_directory)
+
+    assert Lark(grammar).parse("a").children[0] == "a"
+    assert cache_path.read_bytes() == b"invalid"
+    assert not is_private(cache_directory)
+
+
+def test_symbolic_link_is_not_private(tmp_path) -> None:
+    cache_directory = tmp_path / "cache"
+    cache_directory.mkdir(mode=0o700)
+    link = tmp_path / "link"
+    link.symlink_to(cache_directory)
+
+    assert is_private(cache_directory)
+    assert not is_private(link)
+
+
+def test_get_cache_directory(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv(CACHE_DIRECTORY_VARIABLE, raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert get_cache_directory() == tmp_path / "ebl"
+
+
+def test_get_configured_cache_directory(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv(CACHE_DIRECTORY_VARIABLE, str(tmp_path / "grammars"))
+
+    assert get_cache_directory() == tmp_path / "grammars"
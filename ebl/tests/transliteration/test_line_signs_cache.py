@@ -0,0 +1,41 @@
+from ebl.transliteration.application.line_signs_cache import LineSignsCache
+from ebl.transliteration.domain.lark_parser import parse_text_line
+
+FIRST = parse_text_line("1. ku")
+SECOND = parse_text_line("2. nu")
+THIRD = parse_text_line("3. igi")
+
+
+def test_get_creates_signs() -> None:
+    cache = LineSignsCache()
+
+    assert cache.get(FIRST, lambda: FIRST.atf) == "1. ku"
+    assert len(cache) == 1
+
+
+def test_get_returns_cached_signs() -> None:
+    cache = LineSignsCache()
+    cache.get(FIRST, lambda: FIRST.atf)
+
+    assert cache.get(parse_text_line("1. ku"), lambda: "new") == "1. ku"
+
+
+def test_least_recently_used_is_evicted() -> None:
+    cache = LineSignsCache(max_size=2)
+    cache.get(FIRST, lambda: FIRST.atf)
+    cache.get(SECOND, lambda: SECOND.atf)
+    cache.get(FIRST, lambda: FIRST.atf)
+    cache.get(THIRD, lambda: THIRD.atf)
+
+    assert len(cache) == 2
+    assert cache.get(FIRST, lambda: "new") == "1. ku"
+    assert cache.get(SECOND, lambda: "new") == "new"
+
+
+def test_clear() -> None:
+    cache = LineSignsCache()
+    cache.get(FIRST, lambda: FIRST.atf)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get(FIRST, lambda: "new") == "new"
@@ -0,0 +1,46 @@
+import pytest
+
+from ebl.transliteration.domain.lark_parser import (
+    get_parser,
+    parse_common_text_line,
+    parse_text_line,
+    transform_common_text_line,
+)
+from ebl.transliteration.domain.line_transformer import LineTransformer
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "1. a-na",
+        "2'. [{d}utu]-x# KUR.KUR₃ ...",
+        "a+1-a+2b. ša-(ra) 12 {+a}b",
+        "3. [(a)]-šu-ma#? du₃@v AN:ŠE₁₀!* X",
+        "4. {d}a{ki} a-[na] [...]-x",
+    ],
+)
+def test_parse_common_text_line(line) -> None:
+    expected = LineTransformer().transform(get_parser().parse(line, start="text_line"))
+
+    assert LineTransformer().transform(parse_common_text_line(line)) == expected
+    assert transform_common_text_line(line) == expected
+    assert parse_text_line(line) == expected
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "1. {d}",
+        "1. a  b",
+        "1. ʾa-na",
+        "1. 2(diš) ša[r",
+        "1. <(a)> : a",
+        "1. %n ana",
+    ],
+)
+def test_parse_uncommon_text_line(line) -> None:
+    assert parse_common_text_line(line) is None
+    assert transform_common_text_line(line) is None
+    assert parse_text_line(line) == LineTransformer().transform(
+        get_parser().parse(line, start="text_line")
+    )
@@ -0,0 +1,33 @@
+from ebl.transliteration.domain.transliteration_query_plan import (
+    Alternatives,
+    Gap,
+    LiteralSigns,
+    TransliterationQueryPlan,
+)
+from ebl.transliteration.infrastructure.queries import ngrams_match
+
+
+def test_ngrams_match_empty() -> None:
+    assert ngrams_match("ngrams", TransliterationQueryPlan([Gap()], "")) == {}
+
+
+def test_ngrams_match() -> None:
+    plan = TransliterationQueryPlan(
+        [
+            LiteralSigns(["KU", "NU"]),
+            Alternatives([[LiteralSigns(["IGI"])], [LiteralSigns(["MI", "DIŠ"])]]),
+        ],
+        "",
+    )
+
+    assert ngrams_match("ngrams", plan) == {
+        "$and": [
+            {"ngrams": {"$all": ["KU NU"]}},
+            {
+                "$or": [
+                    {"ngrams": {"$all": ["IGI"]}},
+                    {"ngrams": {"$all": ["MI DIŠ"]}},
+                ]
+            },
+        ]
+    }
@@ -0,0 +1,76 @@
+import pytest
+
+from ebl.transliteration.domain.sign_ngrams import (
+    create_query_ngrams,
+    extract_ngrams,
+    split_indexable,
+)
+
+
+def test_extract_ngrams() -> None:
+    assert extract_ngrams("KU NU IGI\nMI DIŠ") == {
+        "KU",
+        "NU",
+        "IGI",
+        "KU NU",
+        "NU IGI",
+        "KU NU IGI",
+        "MI",
+        "DIŠ",
+        "MI DIŠ",
+    }
+
+
+def test_extract_ngrams_variants() -> None:
+    assert extract_ngrams("BA ŠU/BU") == {
+        "BA",
+        "ŠU",
+        "BU",
+        "BA ŠU",
+        "BA BU",
+    }
+
+
+def test_extract_ngrams_empty() -> None:
+    assert extract_ngrams("") == frozenset()
+
+
+@pytest.mark.parametrize(
+    "signs,expected",
+    [
+        ([], []),
+        (["KU", "NU"], [["KU", "NU"]]),
+        (["KU", "NU/BU", "IGI", "MI"], [["KU"], ["IGI", "MI"]]),
+        (["NU/BU", "", "KU"], [["KU"]]),
+    ],
+)
+def test_split_indexable(signs, expected) -> None:
+    assert split_indexable(signs) == expected
+
+
+@pytest.mark.parametrize(
+    "signs,expected",
+    [
+        ([], set()),
+        (["KU"], {"KU"}),
+        (["KU", "NU"], {"KU NU"}),
+        (["KU", "NU", "IGI"], {"KU NU IGI"}),
+        (["KU", "NU", "IGI", "MI"], {"KU NU IGI", "NU IGI MI"}),
+        (["KU", "NU/BU", "IGI", "MI"], {"KU", "IGI MI"}),
+    ],
+)
+def test_create_query_ngrams(signs, expected) -> None:
+    assert create_query_ngrams(signs) == expected
+
+
+@pytest.mark.parametrize(
+    "signs,query",
+    [
+        ("KU NU IGI\nMI DIŠ MI UD MA", ["DIŠ", "MI", "UD", "MA"]),
+        ("KU NU IGI\nMI DIŠ MI UD MA", ["NU", "IGI"]),
+        ("BA ŠU/BU", ["BA", "BU"]),
+        ("X MU TA MA UD", ["X"]),
+    ],
+)
+def test_query_ngrams_are_extracted(signs, query) -> None:
+    assert create_query_ngrams(query) <= extract_ngrams(signs)
@@ -2,7 +2,18 @@ import re
 
 import pytest
 
-from ebl.transliteration.domain.transliteration_query import TransliterationQuery
+from ebl.transliteration.domain.sign_ngrams import extract_ngrams
+from ebl.transliteration.domain.transliteration_query import (
+    TransliterationQuery,
+    get_line_offsets,
+)
+from ebl.transliteration.domain.transliteration_query_plan import (
+    Alternatives,
+    Gap,
+    LineBreak,
+    LiteralSigns,
+    TransliterationQueryPlan,
+)
 from ebl.transliteration.application.signs_visitor import SignsVisitor
 
 REGEXP_DATA = [
@@ -31,26 +42,141 @@ REGEXP_DATA = [
 ]
 
 
+SIGNS = "KU NU IGI\nMI DIŠ MI UD MA\nKI DU ABZ411 BA MA TA\nX MU TA MA UD\nBA ŠU/BU"
+
+
 @pytest.mark.parametrize("string,is_match", REGEXP_DATA)
 def test_regexp(string, is_match, sign_repository, signs):
     for sign in signs:
         sign_repository.create(sign)
     visitor = SignsVisitor(sign_repository)
     query = TransliterationQuery(string=string, visitor=visitor)
-    match = re.search(
-        query.regexp,
-        "KU NU IGI\n"
-        "MI DIŠ MI UD MA\n"
-        "KI DU ABZ411 BA MA TA\n"
-        "X MU TA MA UD\n"
-        "BA ŠU/BU",
-    )
+    match = re.search(query.regexp, SIGNS)
     if is_match:
         assert match is not None
     else:
         assert match is None
 
 
+def test_pattern(sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    query = TransliterationQuery(
+        string="DIŠ UD\nKI", visitor=SignsVisitor(sign_repository)
+    )
+
+    assert query.pattern.pattern == query.regexp
+    assert query.pattern.flags & re.MULTILINE
+    assert query.pattern is query.pattern
+    assert query.compile() is query.pattern
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("KU", [(0, 0)]),
+        ("MA", [(1, 1), (2, 2), (3, 3)]),
+        ("UD MA\nKI", [(1, 2)]),
+        ("BANSUR", []),
+    ],
+)
+def test_match(string, expected, sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    query = TransliterationQuery(string=string, visitor=SignsVisitor(sign_repository))
+
+    assert query.match(SIGNS) == expected
+
+
+def test_get_line_offsets():
+    assert get_line_offsets("KU\nMI DIŠ\n\nX") == (2, 9, 10)
+    assert get_line_offsets("") == ()
+
+
+def test_get_line_number(sign_repository):
+    query = TransliterationQuery(string="", visitor=SignsVisitor(sign_repository))
+
+    assert [query.get_line_number("KU\nMI\nX", position) for position in range(8)] == [
+        0,
+        0,
+        0,
+        1,
+        1,
+        1,
+        2,
+        2,
+    ]
+
+
+@pytest.mark.parametrize("string,is_match", REGEXP_DATA)
+def test_plan_prefilter(string, is_match, sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    visitor = SignsVisitor(sign_repository)
+    plan = TransliterationQuery(string=string, visitor=visitor).plan
+    ngrams = extract_ngrams(SIGNS)
+    if is_match:
+        assert plan.required_ngrams <= ngrams
+        assert all(
+            any(option <= ngrams for option in options)
+            for options in plan.alternative_ngrams
+        )
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("", set()),
+        ("MI", {"MI"}),
+        ("MI DIŠ UD MA", {"MI DIŠ UD", "DIŠ UD MA"}),
+        ("MI ? UD MA", {"MI", "UD MA"}),
+        ("MI * UD", {"MI", "UD"}),
+        ("[MI|DIŠ] UD", {"UD"}),
+        ("MI DIŠ\nUD", {"MI DIŠ", "UD"}),
+    ],
+)
+def test_plan_required_ngrams(string, expected, sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    query = TransliterationQuery(string=string, visitor=SignsVisitor(sign_repository))
+    assert query.plan.required_ngrams == expected
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("MI DIŠ", []),
+        ("[MI|DIŠ] UD", [[{"DIŠ"}, {"MI"}]]),
+        ("[MI DIŠ|UD] ? [MA|MA]", [[{"MI DIŠ"}, {"UD"}], [{"MA"}]]),
+        ("[MI|?] UD", []),
+    ],
+)
+def test_plan_alternative_ngrams(string, expected, sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    query = TransliterationQuery(string=string, visitor=SignsVisitor(sign_repository))
+    assert query.plan.alternative_ngrams == expected
+
+
+def test_plan_parts(sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    query = TransliterationQuery(
+        string="MI ? [DIŠ|UD MA] *\nKI", visitor=SignsVisitor(sign_repository)
+    )
+    assert query.plan == TransliterationQueryPlan(
+        [
+            LiteralSigns(["MI"]),
+            Gap(),
+            Alternatives([[LiteralSigns(["DIŠ"])], [LiteralSigns(["UD", "MA"])]]),
+            Gap(unbounded=True),
+            LineBreak(),
+            LiteralSigns(["KI"]),
+        ],
+        query.regexp,
+    )
+
+
 GET_IS_SEQUENCE_EMPTY_DATA = [
     ("", True),
     ("MA TA", False),
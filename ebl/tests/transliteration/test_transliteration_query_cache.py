@@ -0,0 +1,79 @@
+import pytest
+
+from ebl.transliteration.application.transliteration_query_cache import (
+    TransliterationQueryCache,
+    normalize_query,
+)
+from ebl.transliteration.domain.transliteration_query import (
+    TransliterationQuery,
+    TransliterationQueryEmpty,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+def create(string: str) -> TransliterationQuery:
+    return TransliterationQueryEmpty(string=string)
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("ku", "ku"),
+        (" ku nu ", "ku nu"),
+        ("-ku.\nnu- \n", "ku\nnu"),
+        ("ku \n  nu", "ku\nnu"),
+    ],
+)
+def test_normalize_query(string, expected) -> None:
+    assert normalize_query(string) == expected
+
+
+def test_get_creates_query() -> None:
+    cache = TransliterationQueryCache()
+
+    assert cache.get(" ku ", create) == create("ku")
+    assert len(cache) == 1
+
+
+def test_get_returns_cached_query() -> None:
+    cache = TransliterationQueryCache()
+    query = cache.get("ku", create)
+
+    assert cache.get("ku ", create) is query
+
+
+def test_least_recently_used_is_evicted() -> None:
+    cache = TransliterationQueryCache(max_size=2)
+    first = cache.get("ku", create)
+    second = cache.get("nu", create)
+    cache.get("ku", create)
+    cache.get("igi", create)
+
+    assert len(cache) == 2
+    assert cache.get("ku", create) is first
+    assert cache.get("nu", create) is not second
+
+
+def test_query_expires() -> None:
+    clock = FakeClock()
+    cache = TransliterationQueryCache(timeout=10, clock=clock)
+    query = cache.get("ku", create)
+    clock.time = 10
+
+    assert cache.get("ku", create) is not query
+
+
+def test_clear() -> None:
+    cache = TransliterationQueryCache()
+    query = cache.get("ku", create)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get("ku", create) is not query
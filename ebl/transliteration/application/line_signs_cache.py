@@ -0,0 +1,24 @@
+import time
+from typing import Callable
+
+from ebl.cache import DEFAULT_TIMEOUT, LruCache
+from ebl.transliteration.domain.text_line import TextLine
+
+
+DEFAULT_MAX_SIZE: int = 10000
+
+
+class LineSignsCache(LruCache[TextLine, str]):
+    """Sign strings of parsed lines, shared by all saves of a process.
+
+    The context owns one cache. Signs are imported outside the API, so
+    entries expire after the timeout instead of being cleared on writes.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(max_size, timeout, clock)
@@ -0,0 +1,36 @@
+import time
+from typing import Callable
+
+from ebl.cache import DEFAULT_TIMEOUT, LruCache
+from ebl.transliteration.domain.transliteration_query import TransliterationQuery
+
+
+DEFAULT_MAX_SIZE: int = 1000
+
+
+def normalize_query(string: str) -> str:
+    return "\n".join(line.strip(" -.") for line in string.strip(" -.\n").split("\n"))
+
+
+class TransliterationQueryCache:
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._queries: LruCache[str, TransliterationQuery] = LruCache(
+            max_size, timeout, clock
+        )
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def get(
+        self, string: str, create: Callable[[str], TransliterationQuery]
+    ) -> TransliterationQuery:
+        key = normalize_query(string)
+        return self._queries.get(key, lambda: create(key))
+
+    def clear(self) -> None:
+        self._queries.clear()
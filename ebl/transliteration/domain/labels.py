@@ -205,11 +205,12 @@ class LabelTransformer(Transformer):
 LABEL_PARSER = Lark.open(
     "ebl_atf.lark", maybe_placeholders=True, rel_to=__file__, start="labels"
 )
+LABEL_TRANSFORMER = LabelTransformer()
 
 
 def parse_labels(label: str) -> Sequence[Label]:
     if label:
         tree = LABEL_PARSER.parse(label)
-        return LabelTransformer().transform(tree)
+        return LABEL_TRANSFORMER.transform(tree)
     else:
         return tuple()
@@ -0,0 +1,102 @@
+import hashlib
+import os
+import pickle
+import stat
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import lark
+from lark.lark import Lark
+from lark.load_grammar import Grammar, load_grammar
+
+CACHE_DIRECTORY_VARIABLE = "EBL_GRAMMAR_CACHE"
+
+
+def hash_grammar(path: Path) -> str:
+    digest = hashlib.sha256(lark.__version__.encode())
+    for grammar_file in sorted(path.parent.glob("*.lark")):
+        digest.update(grammar_file.name.encode())
+        digest.update(grammar_file.read_bytes())
+    return digest.hexdigest()
+
+
+def get_cache_directory() -> Optional[Path]:
+    configured = os.environ.get(CACHE_DIRECTORY_VARIABLE)
+    if configured:
+        return Path(configured)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    try:
+        return (Path(xdg_cache) if xdg_cache else Path.home() / ".cache") / "ebl"
+    except (KeyError, RuntimeError):
+        return None
+
+
+def is_private(directory: Path) -> bool:
+    try:
+        status = directory.lstat()
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(status.st_mode)
+        and status.st_uid == os.getuid()
+        and not status.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    )
+
+
+def create_private_directory(directory: Path) -> bool:
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError:
+        return False
+    return is_private(directory)
+
+
+def get_cache_path(path: Path, cache_directory: Path) -> Path:
+    return cache_directory / f"lark_{path.stem}_{hash_grammar(path)}.pickle"
+
+
+def parse_grammar(path: Path) -> Grammar:
+    return load_grammar(path.read_text(encoding="utf-8"), str(path), [], False)
+
+
+def load_cached_grammar(path: Path, cache_directory: Optional[Path] = None) -> Grammar:
+    """Load a grammar, caching the parsed grammar as a pickle.
+
+    The cache is only read from and written to a directory that belongs
+    to the current user and is closed to everyone else. Otherwise the
+    grammar is parsed every time.
+    """
+    directory = get_cache_directory() if cache_directory is None else cache_directory
+    if directory is None or not create_private_directory(directory):
+        return parse_grammar(path)
+
+    cache_path = get_cache_path(path, directory)
+    try:
+        with cache_path.open("rb") as file:
+            cached = pickle.load(file)
+        if isinstance(cached, Grammar):
+            return cached
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    grammar = parse_grammar(path)
+    save_grammar(grammar, cache_path)
+    return grammar
+
+
+def save_grammar(grammar: Grammar, cache_path: Path) -> None:
+    try:
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=cache_path.parent)
+    except OSError:
+        return
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            pickle.dump(grammar, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        os.remove(temporary_path)
+
+
+def open_cached(grammar_filename: str, rel_to: str, **options) -> Lark:
+    return Lark(load_cached_grammar(Path(rel_to).parent / grammar_filename), **options)
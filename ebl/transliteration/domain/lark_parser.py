@@ -1,16 +1,20 @@
+from functools import lru_cache
 from itertools import dropwhile
-from typing import Sequence, Iterator
+from typing import Optional, Sequence, Iterator
 import re
 
+import attr
 import pydash
 from lark.exceptions import ParseError, UnexpectedInput, VisitError
 from lark.lark import Lark
+from lark.tree import Tree
 
 from ebl.errors import DataError
 from ebl.transliteration.domain import atf
 from ebl.transliteration.domain.enclosure_error import EnclosureError
 from ebl.transliteration.domain.enclosure_visitor import EnclosureValidator
 from ebl.transliteration.domain.greek_tokens import GreekWord
+from ebl.transliteration.domain.lark_grammar_cache import open_cached
 from ebl.transliteration.domain.labels import DuplicateStatusError
 from ebl.transliteration.domain.line import EmptyLine, Line
 from ebl.transliteration.domain.line_number import AbstractLineNumber
@@ -26,75 +30,122 @@ from ebl.transliteration.domain.translation_line import TranslationLine
 from ebl.transliteration.domain.transliteration_error import TransliterationError
 from ebl.transliteration.domain.word_tokens import Word
 from ebl.transliteration.domain.lark_parser_errors import PARSE_ERRORS
-from ebl.transliteration.domain.line_transformer import LineTransformer
-
-WORD_PARSER = Lark.open(
-    "ebl_atf.lark", maybe_placeholders=True, rel_to=__file__, start="any_word"
-)
-NOTE_LINE_PARSER = Lark.open(
-    "ebl_atf.lark", maybe_placeholders=True, rel_to=__file__, start="note_line"
-)
-MARKUP_PARSER = Lark.open(
-    "ebl_atf.lark", maybe_placeholders=True, rel_to=__file__, start="markup"
-)
-PARALLEL_LINE_PARSER = Lark.open(
-    "ebl_atf.lark", maybe_placeholders=True, rel_to=__file__, start="parallel_line"
-)
-TRANSLATION_LINE_PARSER = Lark.open(
-    "ebl_atf.lark", maybe_placeholders=True, rel_to=__file__, start="translation_line"
-)
-PARATEXT_PARSER = Lark.open(
-    "ebl_atf.lark", maybe_placeholders=True, rel_to=__file__, start="paratext"
+from ebl.transliteration.domain.line_transformer import (
+    InlineLineTransformer,
+    LineTransformer,
 )
-CHAPTER_PARSER = Lark.open(
-    "ebl_atf.lark", maybe_placeholders=True, rel_to=__file__, start="chapter"
+
+START_RULES = (
+    "start",
+    "any_word",
+    "note_line",
+    "markup",
+    "parallel_line",
+    "translation_line",
+    "paratext",
+    "chapter",
 )
-LINE_PARSER = Lark.open("ebl_atf.lark", maybe_placeholders=True, rel_to=__file__)
+TEXT_LINE_RULES = frozenset(["start", "text_line"])
+LINE_CACHE_SIZE = 10000
+LINE_TRANSFORMER = LineTransformer()
+
+
+@lru_cache(maxsize=None)
+def get_parser() -> Lark:
+    return open_cached(
+        "ebl_atf.lark", __file__, maybe_placeholders=True, start=list(START_RULES)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_text_line_parser(transform: bool = False) -> Lark:
+    return open_cached(
+        "lalr/ebl_atf.lark",
+        __file__,
+        parser="lalr",
+        maybe_placeholders=True,
+        start="text_line",
+        transformer=InlineLineTransformer() if transform else None,
+    )
+
+
+def parse_common_text_line(text: str) -> Optional[Tree]:
+    try:
+        return get_text_line_parser().parse(text)
+    except UnexpectedInput:
+        return None
+
+
+def transform_common_text_line(text: str) -> Optional[TextLine]:
+    try:
+        return get_text_line_parser(True).parse(text)
+    except UnexpectedInput:
+        return None
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class StartRuleParser:
+    start: str
+
+    def parse(self, text: str, start: Optional[str] = None) -> Tree:
+        rule = start or self.start
+        tree = parse_common_text_line(text) if rule in TEXT_LINE_RULES else None
+        return get_parser().parse(text, start=rule) if tree is None else tree
+
+    def transform(self, text: str, start: Optional[str] = None):
+        rule = start or self.start
+        line = transform_common_text_line(text) if rule in TEXT_LINE_RULES else None
+        return (
+            LINE_TRANSFORMER.transform(get_parser().parse(text, start=rule))
+            if line is None
+            else line
+        )
+
+
+WORD_PARSER = StartRuleParser("any_word")
+NOTE_LINE_PARSER = StartRuleParser("note_line")
+MARKUP_PARSER = StartRuleParser("markup")
+PARALLEL_LINE_PARSER = StartRuleParser("parallel_line")
+TRANSLATION_LINE_PARSER = StartRuleParser("translation_line")
+PARATEXT_PARSER = StartRuleParser("paratext")
+CHAPTER_PARSER = StartRuleParser("chapter")
+LINE_PARSER = StartRuleParser("start")
 
 
 def parse_word(atf: str) -> Word:
-    tree = WORD_PARSER.parse(atf)
-    return LineTransformer().transform(tree)
+    return WORD_PARSER.transform(atf)
 
 
 def parse_normalized_akkadian_word(atf: str) -> Word:
-    tree = LINE_PARSER.parse(atf, start="ebl_atf_text_line__akkadian_word")
-    return LineTransformer().transform(tree)
+    return LINE_PARSER.transform(atf, start="ebl_atf_text_line__akkadian_word")
 
 
 def parse_greek_word(atf: str) -> GreekWord:
-    tree = LINE_PARSER.parse(atf, start="ebl_atf_text_line__greek_word")
-    return LineTransformer().transform(tree)
+    return LINE_PARSER.transform(atf, start="ebl_atf_text_line__greek_word")
 
 
 def parse_compound_grapheme(atf: str) -> CompoundGrapheme:
-    tree = LINE_PARSER.parse(atf, start="ebl_atf_text_line__compound_grapheme")
-    return LineTransformer().transform(tree)
+    return LINE_PARSER.transform(atf, start="ebl_atf_text_line__compound_grapheme")
 
 
 def parse_reading(atf: str) -> Reading:
-    tree = LINE_PARSER.parse(atf, start="ebl_atf_text_line__reading")
-    return LineTransformer().transform(tree)
+    return LINE_PARSER.transform(atf, start="ebl_atf_text_line__reading")
 
 
 def parse_erasure(atf: str) -> Sequence[EblToken]:
-    tree = LINE_PARSER.parse(atf, start="ebl_atf_text_line__erasure")
-    return LineTransformer().transform(tree)
+    return LINE_PARSER.transform(atf, start="ebl_atf_text_line__erasure")
 
 
 def parse_line(atf: str) -> Line:
-    tree = LINE_PARSER.parse(atf)
-    return LineTransformer().transform(tree)
+    return LINE_PARSER.transform(atf)
 
 
 def parse_note_line(atf: str) -> NoteLine:
-    tree = NOTE_LINE_PARSER.parse(atf)
-    return LineTransformer().transform(tree)
+    return NOTE_LINE_PARSER.transform(atf)
 
 
 def parse_markup(atf: str) -> Sequence[MarkupPart]:
-    tree = MARKUP_PARSER.parse(atf)
-    return LineTransformer().transform(tree)
+    return MARKUP_PARSER.transform(atf)
 
 
 def split_paragraphs(atf: str) -> Iterator[str]:
@@ -108,28 +159,24 @@ def parse_introduction(atf: str) -> Sequence[MarkupPart]:
     for paragraph in split_paragraphs(atf):
         if parts:
             parts.append(ParagraphPart())
-        parts.extend(LineTransformer().transform(MARKUP_PARSER.parse(paragraph)))
+        parts.extend(MARKUP_PARSER.transform(paragraph))
     return tuple(parts)
 
 
 def parse_parallel_line(atf: str) -> ParallelLine:
-    tree = PARALLEL_LINE_PARSER.parse(atf)
-    return LineTransformer().transform(tree)
+    return PARALLEL_LINE_PARSER.transform(atf)
 
 
 def parse_translation_line(atf: str) -> TranslationLine:
-    tree = TRANSLATION_LINE_PARSER.parse(atf)
-    return LineTransformer().transform(tree)
+    return TRANSLATION_LINE_PARSER.transform(atf)
 
 
 def parse_text_line(atf: str) -> TextLine:
-    tree = LINE_PARSER.parse(atf, start="text_line")
-    return LineTransformer().transform(tree)
+    return LINE_PARSER.transform(atf, start="text_line")
 
 
 def parse_line_number(atf: str) -> AbstractLineNumber:
-    tree = LINE_PARSER.parse(atf, start="ebl_atf_text_line__line_number")
-    return LineTransformer().transform(tree)
+    return LINE_PARSER.transform(atf, start="ebl_atf_text_line__line_number")
 
 
 def validate_line(line: Line) -> None:
@@ -138,11 +185,17 @@ def validate_line(line: Line) -> None:
     visitor.done()
 
 
+@lru_cache(maxsize=LINE_CACHE_SIZE)
+def parse_valid_line(line: str, parser_version: str) -> Line:
+    parsed_line = parse_line(line) if line else EmptyLine()
+    validate_line(parsed_line)
+    return parsed_line
+
+
 def parse_atf_lark(atf_):
     def parse_line_(line: str, line_number: int):
         try:
-            parsed_line = parse_line(line) if line else EmptyLine()
-            validate_line(parsed_line)
+            parsed_line = parse_valid_line(line, atf.ATF_PARSER_VERSION)
             return parsed_line, None
         except PARSE_ERRORS as ex:
             return (None, create_transliteration_error_data(ex, line, line_number))
@@ -24,3 +24,9 @@ class LineTransformer(
     @v_args(inline=True)
     def control_line(self, prefix, content):
         return ControlLine(prefix, content)
+
+
+class InlineLineTransformer(LineTransformer):
+    # Terminal callbacks run in the lexer when transforming during parsing
+    # and must return tokens.
+    ebl_atf_text_line__INT = None  # pyre-ignore[15]
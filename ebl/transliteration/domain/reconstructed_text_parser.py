@@ -13,23 +13,24 @@ RECONSTRUCTED_LINE_PARSER = Lark.open(
     rel_to=__file__,
     start="ebl_atf_text_line__text",
 )
+TEXT_LINE_TRANSFORMER = TextLineTransformer()
 
 
 def parse_reconstructed_word(word: str) -> AkkadianWord:
     tree = RECONSTRUCTED_LINE_PARSER.parse(
         word, start="ebl_atf_text_line__akkadian_word"
     )
-    return TextLineTransformer().transform(tree)
+    return TEXT_LINE_TRANSFORMER.transform(tree)
 
 
 def parse_break(break_: str) -> Break:
     tree = RECONSTRUCTED_LINE_PARSER.parse(break_, start="ebl_atf_text_line__break")
-    return TextLineTransformer().transform(tree)
+    return TEXT_LINE_TRANSFORMER.transform(tree)
 
 
 def parse_reconstructed_line(text: str) -> Sequence[Token]:
     try:
         tree = RECONSTRUCTED_LINE_PARSER.parse(text)
-        return TextLineTransformer().transform(tree)
+        return TEXT_LINE_TRANSFORMER.transform(tree)
     except (UnexpectedInput, ParseError) as error:
         raise ValueError(f"Invalid reconstructed line: {text}. {error}")
@@ -0,0 +1,47 @@
+from itertools import product
+from typing import FrozenSet, Iterable, List, Sequence
+
+from ebl.transliteration.domain.atf import VARIANT_SEPARATOR, WORD_SEPARATOR
+
+NGRAM_SIZE = 3
+LINE_SEPARATOR = "\n"
+
+
+def extract_ngrams(signs: str) -> FrozenSet[str]:
+    return frozenset(
+        ngram
+        for line in signs.split(LINE_SEPARATOR)
+        for ngram in _create_line_ngrams(
+            [sign.split(VARIANT_SEPARATOR) for sign in line.split(WORD_SEPARATOR)]
+        )
+    )
+
+
+def _create_line_ngrams(line: Sequence[Sequence[str]]) -> Iterable[str]:
+    for size in range(1, NGRAM_SIZE + 1):
+        for start in range(len(line) - size + 1):
+            for ngram in product(*line[start : start + size]):
+                if all(ngram):
+                    yield WORD_SEPARATOR.join(ngram)
+
+
+def is_indexable(sign: str) -> bool:
+    return bool(sign) and VARIANT_SEPARATOR not in sign
+
+
+def split_indexable(signs: Sequence[str]) -> List[Sequence[str]]:
+    runs: List[List[str]] = [[]]
+    for sign in signs:
+        if is_indexable(sign):
+            runs[-1].append(sign)
+        elif runs[-1]:
+            runs.append([])
+    return [run for run in runs if run]
+
+
+def create_query_ngrams(signs: Sequence[str]) -> FrozenSet[str]:
+    return frozenset(
+        WORD_SEPARATOR.join(run[start : start + NGRAM_SIZE])
+        for run in split_indexable(signs)
+        for start in range(max(len(run) - NGRAM_SIZE, 0) + 1)
+    )
@@ -1,14 +1,23 @@
 from __future__ import annotations
 import re
 import attr
-from itertools import chain
-from typing import cast, Sequence, Tuple, List
+from bisect import bisect_left
+from functools import cached_property, lru_cache
+from typing import cast, Pattern, Sequence, Tuple, List
 from enum import Enum
 from collections import OrderedDict
 from ebl.errors import DataError
 from ebl.transliteration.domain.lark_parser import parse_line
 from ebl.transliteration.domain.text_line import TextLine
 from ebl.transliteration.domain.tokens import TokenVisitor
+from ebl.transliteration.domain.transliteration_query_plan import (
+    Alternatives,
+    Gap,
+    LineBreak,
+    LiteralSigns,
+    QueryPart,
+    TransliterationQueryPlan,
+)
 
 
 class Type(Enum):
@@ -30,6 +39,11 @@ wildcard_matchers: OrderedDict[Type, str] = OrderedDict(
 )
 
 
+@lru_cache(maxsize=128)
+def get_line_offsets(transliteration: str) -> Tuple[int, ...]:
+    return tuple(match.start() for match in re.finditer("\n", transliteration))
+
+
 @attr.s(auto_attribs=True)
 class TransliterationQuery:
 
@@ -37,14 +51,42 @@ class TransliterationQuery:
     visitor: TokenVisitor
     type: Type = attr.ib(init=False)
     regexp: str = attr.ib(init=False)
+    children: Sequence[TransliterationQuery] = attr.ib(
+        init=False, factory=list, eq=False, repr=False
+    )
 
     def __attrs_post_init__(self) -> None:
         self.string = self.string.strip(" -.\n")
         self.type = self._classify(self.string)
+        self.children = self._create_children()
         self.regexp = self._regexp()
 
+    def _create_children(self) -> Sequence[TransliterationQuery]:
+        return [] if self.is_empty() else self.create_children(self.string)
+
     def _regexp(self) -> str:
-        return r"" if self.is_empty() else self.children_regexp(self.string)
+        return r"" if self.is_empty() else self._join_children_regexp(self.children)
+
+    @cached_property
+    def pattern(self) -> Pattern:
+        return re.compile(self.regexp, re.MULTILINE)
+
+    def compile(self) -> Pattern:
+        """Compile the pattern now instead of on the first match."""
+        return self.pattern
+
+    @property
+    def plan(self) -> TransliterationQueryPlan:
+        return TransliterationQueryPlan(self.get_parts(), self.regexp)
+
+    def get_parts(self) -> Sequence[QueryPart]:
+        if self.type == Type.LINES:
+            return [
+                part
+                for index, child in enumerate(self.children)
+                for part in ([LineBreak()] if index else []) + list(child.get_parts())
+            ]
+        return [part for child in self.children for part in child.get_parts()]
 
     def _classify(self, string: str) -> Type:
         if not string:
@@ -68,8 +110,10 @@ class TransliterationQuery:
         return self.type == Type.UNDEFINED or not self.string
 
     def children_regexp(self, string: str = "") -> str:
-        children = self.create_children(string)
-        if children == []:
+        return self._join_children_regexp(self.create_children(string))
+
+    def _join_children_regexp(self, children: Sequence[TransliterationQuery]) -> str:
+        if not children:
             return r""
         separator = r"( .*)?\n.*" if self.type == Type.LINES else r" "
         return rf"{separator}".join(child.regexp for child in children)
@@ -106,24 +150,17 @@ class TransliterationQuery:
         return children
 
     def match(self, transliteration: str) -> Sequence[Tuple[int, int]]:
+        line_offsets = get_line_offsets(transliteration)
         return [
             (
-                self.get_line_number(transliteration, match.start()),
-                self.get_line_number(transliteration, match.end()),
-            )
-            for match in re.finditer(
-                re.compile(self.regexp, re.MULTILINE), transliteration
+                bisect_left(line_offsets, match.start()),
+                bisect_left(line_offsets, match.end()),
             )
+            for match in self.pattern.finditer(transliteration)
         ]
 
     def get_line_number(self, transliteration: str, position: int) -> int:
-        return len(
-            [
-                char
-                for char in chain.from_iterable(transliteration[:position])
-                if char == "\n"
-            ]
-        )
+        return bisect_left(get_line_offsets(transliteration), position)
 
     def make_transliteration_query_line(self, string: str) -> TransliterationQueryLine:
         return TransliterationQueryLine(string=string, visitor=self.visitor)
@@ -139,10 +176,20 @@ class TransliterationQuery:
 
 @attr.s(auto_attribs=True)
 class TransliterationQueryText(TransliterationQuery):
+    signs: Sequence[str] = attr.ib(init=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.signs = self._create_signs(self.string.strip(" -.\n"))
+        super().__attrs_post_init__()
+
+    def _create_children(self) -> Sequence[TransliterationQuery]:
+        return []
+
+    def get_parts(self) -> Sequence[QueryPart]:
+        return [LiteralSigns(self.signs)] if self.signs else []
+
     def _regexp(self) -> str:
-        signs_regexp = " ".join(
-            self._create_sign_regexp(sign) for sign in self._create_signs(self.string)
-        )
+        signs_regexp = " ".join(self._create_sign_regexp(sign) for sign in self.signs)
         return rf"(?<![^|\s]){signs_regexp}"
 
     def _create_sign_regexp(self, sign: str) -> str:
@@ -167,6 +214,21 @@ class TransliterationQueryText(TransliterationQuery):
 
 @attr.s(auto_attribs=True)
 class TransliterationQueryWildCard(TransliterationQuery):
+    def _create_children(self) -> Sequence[TransliterationQuery]:
+        return (
+            [
+                TransliterationQuery(string=alternative_string, visitor=self.visitor)
+                for alternative_string in self.string.strip("[]").split("|")
+            ]
+            if self.type == Type.ALTERNATIVE
+            else []
+        )
+
+    def get_parts(self) -> Sequence[QueryPart]:
+        if self.type == Type.ALTERNATIVE:
+            return [Alternatives([child.get_parts() for child in self.children])]
+        return [Gap(unbounded=self.type == Type.ANY_SIGN_PLUS)]
+
     def _regexp(self) -> str:
         if self.type == Type.ALTERNATIVE:
             return self._regexp_alternative()
@@ -177,12 +239,10 @@ class TransliterationQueryWildCard(TransliterationQuery):
         )
 
     def _regexp_alternative(self) -> str:
-        alternative_strings = self.string.strip("[]").split("|")
-        alternative_queries = [
-            "".join(child.regexp for child in self.create_children(alternative_string))
-            for alternative_string in alternative_strings
-        ]
-        regexp = r"|".join(alternative_queries)
+        regexp = r"|".join(
+            "".join(child.regexp for child in alternative.children)
+            for alternative in self.children
+        )
         return rf"({regexp})"
 
 
@@ -191,8 +251,11 @@ class TransliterationQueryLine(TransliterationQuery):
     def _classify(self, string: str) -> Type:
         return Type.LINE
 
+    def _create_children(self) -> Sequence[TransliterationQuery]:
+        return [TransliterationQuery(string=self.string, visitor=self.visitor)]
+
     def _regexp(self) -> str:
-        content = TransliterationQuery(string=self.string, visitor=self.visitor)
+        (content,) = self.children
         return rf"(?<![^|\s]){content.regexp}"
 
 
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from typing import FrozenSet, Sequence, Union
+
+import attr
+
+from ebl.transliteration.domain.sign_ngrams import create_query_ngrams
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class LiteralSigns:
+    signs: Sequence[str] = attr.ib(converter=tuple)
+
+    @property
+    def ngrams(self) -> FrozenSet[str]:
+        return create_query_ngrams(self.signs)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class Alternatives:
+    options: Sequence[Sequence[QueryPart]] = attr.ib(
+        converter=lambda options: tuple(tuple(option) for option in options)
+    )
+
+    @property
+    def ngrams(self) -> Sequence[FrozenSet[str]]:
+        options = [get_required_ngrams(option) for option in self.options]
+        return sorted(set(options), key=sorted) if options and all(options) else []
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class Gap:
+    unbounded: bool = False
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class LineBreak:
+    pass
+
+
+QueryPart = Union[LiteralSigns, Alternatives, Gap, LineBreak]
+
+
+def get_required_ngrams(parts: Sequence[QueryPart]) -> FrozenSet[str]:
+    return frozenset(
+        ngram
+        for part in parts
+        if isinstance(part, LiteralSigns)
+        for ngram in part.ngrams
+    )
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class TransliterationQueryPlan:
+    parts: Sequence[QueryPart] = attr.ib(converter=tuple)
+    regexp: str
+
+    @property
+    def required_ngrams(self) -> FrozenSet[str]:
+        return get_required_ngrams(self.parts)
+
+    @property
+    def alternative_ngrams(self) -> Sequence[Sequence[FrozenSet[str]]]:
+        return [
+            part.ngrams
+            for part in self.parts
+            if isinstance(part, Alternatives) and part.ngrams
+        ]
+
+    @property
+    def has_prefilter(self) -> bool:
+        return bool(self.required_ngrams or self.alternative_ngrams)
@@ -1,3 +1,4 @@
 TEXTS_COLLECTION = "texts"
 CHAPTERS_COLLECTION = "chapters"
+CHAPTER_SIGN_NGRAMS_COLLECTION = "chapter_sign_ngrams"
 FRAGMENTS_COLLECTION = "fragments"
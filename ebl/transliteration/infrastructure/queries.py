@@ -1,7 +1,24 @@
 from ebl.transliteration.application.museum_number_schema import MuseumNumberSchema
 from ebl.transliteration.domain.museum_number import MuseumNumber
+from ebl.transliteration.domain.transliteration_query_plan import (
+    TransliterationQueryPlan,
+)
 
 
 def museum_number_is(number: MuseumNumber) -> dict:
     serialized = MuseumNumberSchema().dump(number)
     return {f"museumNumber.{key}": value for key, value in serialized.items()}
+
+
+def ngrams_match(field: str, plan: TransliterationQueryPlan) -> dict:
+    required = (
+        [{field: {"$all": sorted(plan.required_ngrams)}}]
+        if plan.required_ngrams
+        else []
+    )
+    alternatives = [
+        {"$or": [{field: {"$all": sorted(option)}} for option in options]}
+        for options in plan.alternative_ngrams
+    ]
+    conditions = required + alternatives
+    return {"$and": conditions} if conditions else {}